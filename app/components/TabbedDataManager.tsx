@@ -27,8 +27,9 @@ import {
     addParamToAttribute,
     updateAttributeParam,
     deleteAttributeParam,
-    // Product API (今回はログのみ)
-    // createProduct, updateProduct, deleteProduct,
+    // Product API (作成と更新は未対応)
+    // createProduct, updateProduct,
+    deleteProduct,
 } from '@/app/lib/apiClient'; // APIクライアント
 
 import BaseTable from './BaseTable';
@@ -234,8 +235,13 @@ export default function TabbedDataManager() {
             const processedProductsAfterProductOps: Product[] = [];
             for (const product of currentProductsState) {
                 if (product._status === 'deleted' && product.productId > 0) {
-                    console.log(`SIMULATE: API DELETE Product ${product.productId}`);
-                    // await deleteProduct(product.productId); // API呼び出し
+                    try {
+                        // 配下のAttributeとParamはサーバー側でまとめて削除される
+                        await deleteProduct(product.productId);
+                    } catch (e: any) {
+                        overallSuccess = false;
+                        console.error(`Failed to delete product ${product.productId}:`, e);
+                    }
                     continue; // 削除されたものは以降の処理に含めない
                 }
                 // TODO: Productの新規作成(POST)と更新(PUT)処理
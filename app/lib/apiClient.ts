@@ -117,6 +117,17 @@ export async function fetchProductById(productId: number): Promise<ApiProduct> {
     return handleApiResponse<ApiProduct>(response);
 }
 
+/**
+ * Productを削除します。配下のAttributeとParamもサーバー側でまとめて削除されます。
+ * 成功時は204 No Contentを期待。
+ */
+export async function deleteProduct(productId: number): Promise<void> {
+    const response = await fetch(`${API_PROXY_PATH}/products/${productId}`, {
+        method: 'DELETE',
+    });
+    await handleApiResponse<void>(response); // レスポンスボディがない場合はマッピング不要
+}
+
 // --- Attribute Operations ---
 /**
  * Productに新しいAttributeを追加します。
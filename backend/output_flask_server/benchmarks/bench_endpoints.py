@@ -0,0 +1,205 @@
+# bench_endpoints.py
+"""
+全 operationId と initialize_data / refresh_mock_data のマイクロベンチマーク。
+
+data.DB を products × attributes × params の合成カタログで置き換え、
+Flask のテストクライアント経由で各エンドポイントを計測します。
+結果はコミット間で比較できるよう JSON で出力します。
+
+    python -m benchmarks.bench_endpoints --scales small,medium --output result.json
+"""
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import sys
+import time
+
+from openapi_server.app import create_app
+from openapi_server.controllers import data
+
+from benchmarks.catalog import build_catalog, build_records
+from benchmarks.stats import summarize
+
+# 名前: (products, attributes per product, params per attribute)
+SCALES = {
+    "tiny": (2, 3, 2),
+    "small": (10, 10, 5),
+    "medium": (100, 20, 10),
+    "large": (500, 40, 10),
+}
+
+_ATTRIBUTE_BODY = {
+    "code": "bench_attr",
+    "data_type": "string",
+    "disp_name": "ベンチ属性",
+    "unit": "",
+    "contract": "type1",
+    "public": True,
+    "masking": False,
+    "online": True,
+    "sort_order": 0,
+}
+
+_PARAM_BODY = {"code": "bench", "disp_name": "ベンチ", "sort_order": 0, "type": "type1"}
+
+_PRODUCT_BODY = {"prefix": "bench", "prd_type": "bench00", "cfg_type": "abcdef", "sort_order": 0}
+
+_NDJSON = "application/x-ndjson"
+
+
+def seed(scale):
+    data.load_products(build_catalog(*SCALES[scale]))
+
+
+def _time(fn, iterations, setup=None):
+    samples = []
+    for _ in range(iterations):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        response = fn(arg)
+        samples.append(time.perf_counter() - start)
+        if response is not None and response.status_code >= 400:
+            raise RuntimeError(f"{response.status_code}: {response.get_data(as_text=True)}")
+    return summarize(samples)
+
+
+def bench_scale(client, scale, iterations):
+    """1つの規模について全オペレーションを計測し、operationId -> 集計値 の dict を返します。"""
+    seed(scale)
+    products, _, _ = SCALES[scale]
+    pid = products // 2
+    # contract=type1 (param の type は type1) の attribute
+    aid = 0
+    base = f"/api/products/{pid}/attributes"
+
+    def new_attribute(_=None):
+        return client.post(base, json=_ATTRIBUTE_BODY).get_json()["attribute_id"]
+
+    def new_param(_=None):
+        return client.post(f"{base}/{aid}/params", json=_PARAM_BODY).get_json()["param_id"]
+
+    def import_body():
+        # 規模と同じ形の product 1つ分 (ID は毎回新しいもの)
+        records = build_records(data.DB["next_product_id"], *SCALES[scale][1:])
+        return "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records).encode("utf-8")
+
+    def import_catalog(body):
+        return client.post("/api/import", data=body, content_type=_NDJSON)
+
+    def new_product(_=None):
+        product_id = data.DB["next_product_id"]
+        import_catalog(import_body())
+        return product_id
+
+    def export_catalog(_):
+        response = client.get("/api/export")
+        response.get_data()  # ストリーミングのレスポンスを最後まで読む
+        return response
+
+    # 読み込み系は、書き込み系で増えた attribute / param の影響を受けないよう先に計測する
+    results = {
+        "list_products": _time(lambda _: client.get("/api/products"), iterations),
+        "get_product_by_id": _time(lambda _: client.get(f"/api/products/{pid}"), iterations),
+        "get_attribute_by_code": _time(
+            lambda _: client.get(f"{base}/by-code/attr{aid}"), iterations
+        ),
+        "search_catalog": _time(lambda _: client.get("/api/search?q=attr1"), iterations),
+        "autocomplete": _time(
+            lambda _: client.get("/api/autocomplete?field=prefix&prefix=p000"), iterations
+        ),
+        "query_attributes": _time(
+            lambda _: client.get("/api/attributes?public=true&contract=type1"), iterations
+        ),
+        "query_type2_params": _time(
+            lambda _: client.get("/api/params/type2?field=min&low=2&high=4"), iterations
+        ),
+        "export_catalog": _time(export_catalog, iterations),
+        "add_product": _time(lambda _: client.post("/api/products", json=_PRODUCT_BODY), iterations),
+        "delete_product": _time(
+            lambda new_pid: client.delete(f"/api/products/{new_pid}"), iterations, setup=new_product
+        ),
+        "import_catalog": _time(import_catalog, iterations, setup=import_body),
+        "add_attribute": _time(lambda _: client.post(base, json=_ATTRIBUTE_BODY), iterations),
+        "update_attribute": _time(
+            lambda _: client.put(f"{base}/{aid}", json=_ATTRIBUTE_BODY), iterations
+        ),
+        "delete_attribute": _time(
+            lambda new_aid: client.delete(f"{base}/{new_aid}"), iterations, setup=new_attribute
+        ),
+        "add_param": _time(
+            lambda _: client.post(f"{base}/{aid}/params", json=_PARAM_BODY), iterations
+        ),
+        "update_param": _time(
+            lambda _: client.put(f"{base}/{aid}/params/0", json=_PARAM_BODY), iterations
+        ),
+        "delete_param": _time(
+            lambda param_id: client.delete(f"{base}/{aid}/params/{param_id}"),
+            iterations,
+            setup=new_param,
+        ),
+    }
+    # 初期化系は DB を初期データに戻すため、計測の最後に毎回シードし直して実行する
+    results["initialize_data"] = _time(
+        lambda _: data.initialize_data(), iterations, setup=lambda: seed(scale)
+    )
+    results["refresh_mock_data"] = _time(
+        lambda _: client.post("/api/refresh"), iterations, setup=lambda: seed(scale)
+    )
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scales, iterations):
+    app = create_app().app
+    client = app.test_client()
+    try:
+        results = {scale: bench_scale(client, scale, iterations) for scale in scales}
+    finally:
+        data.initialize_data()
+    return {
+        "benchmark": "endpoints",
+        "commit": _git_commit(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "iterations": iterations,
+        "scales": {scale: dict(zip(("products", "attributes", "params"), SCALES[scale]))
+                   for scale in scales},
+        "unit": "seconds",
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scales", default="small,medium",
+                        help=f"カンマ区切り ({', '.join(SCALES)})")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--output", help="結果の出力先 (省略時は標準出力)")
+    args = parser.parse_args(argv)
+
+    scales = [s for s in args.scales.split(",") if s]
+    unknown = [s for s in scales if s not in SCALES]
+    if unknown:
+        parser.error(f"unknown scale: {', '.join(unknown)}")
+
+    result = run(scales, args.iterations)
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# bench_models.py
+"""
+モデルクラスのメモリ使用量とスループットのベンチマーク。
+
+現行のモデル (クラスレベルの openapi_types/attribute_map と __slots__) を、
+以前の生成コードと同じ形 (インスタンス毎に型マップを作り、__dict__ に値を持つ)
+のクラスと比較します。結果は JSON で標準出力に書き出します。
+
+    python -m benchmarks.bench_models --products 200 --attributes 10 --params 5
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import List
+
+from openapi_server import typing_utils
+from openapi_server import util
+from openapi_server.models.base_model import Model
+from openapi_server.models.product import Product
+
+from benchmarks.catalog import build_catalog
+
+_LEGACY_CLASSES = {}
+
+
+def _legacy_type(klass):
+    if typing_utils.is_generic(klass) and typing_utils.is_list(klass):
+        return List[_legacy_type(klass.__args__[0])]
+    if isinstance(klass, type) and issubclass(klass, Model):
+        return legacy_class(klass)
+    return klass
+
+
+def legacy_class(klass):
+    """klass と同じフィールド・プロパティを持つ、以前の生成コード形式のクラスを返します。"""
+    if klass in _LEGACY_CLASSES:
+        return _LEGACY_CLASSES[klass]
+
+    namespace = {
+        name: value for name, value in vars(klass).items() if isinstance(value, property)
+    }
+    legacy = type("Legacy" + klass.__name__, (Model,), namespace)
+    _LEGACY_CLASSES[klass] = legacy
+
+    openapi_types = {attr: _legacy_type(t) for attr, t in klass.openapi_types.items()}
+    attribute_map = dict(klass.attribute_map)
+
+    def __init__(self, **kwargs):
+        # 以前の生成コードと同様に、インスタンス毎に型マップを作り直す
+        self.openapi_types = dict(openapi_types)
+        self.attribute_map = dict(attribute_map)
+        for attr in openapi_types:
+            setattr(self, "_" + attr, kwargs.get(attr))
+
+    legacy.__init__ = __init__
+    legacy.openapi_types = openapi_types
+    legacy.attribute_map = attribute_map
+    return legacy
+
+
+def measure_memory(klass, catalog):
+    """catalog 全体をモデル化したときに保持されるバイト数を返します。"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        models = [util.deserialize_model(p, klass) for p in catalog]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del models
+    return after - before
+
+
+def measure_throughput(klass, catalog, repeat):
+    """from_dict の最良実行時間 (秒) を返します。"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for p in catalog:
+            util.deserialize_model(p, klass)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def count_models(catalog):
+    attributes = sum(len(p["attributes"]) for p in catalog)
+    params = sum(len(a["params"]) for p in catalog for a in p["attributes"])
+    return len(catalog) + attributes + params
+
+
+def run(products, attributes, params, repeat):
+    catalog = build_catalog(products, attributes, params)
+    n_models = count_models(catalog)
+    results = {}
+    for label, klass in (("slots", Product), ("legacy", legacy_class(Product))):
+        memory = measure_memory(klass, catalog)
+        seconds = measure_throughput(klass, catalog, repeat)
+        results[label] = {
+            "bytes": memory,
+            "bytes_per_model": memory / n_models,
+            "seconds": seconds,
+            "models_per_second": n_models / seconds,
+        }
+    return {
+        "benchmark": "models",
+        "scale": {"products": products, "attributes": attributes, "params": params},
+        "models": n_models,
+        "results": results,
+        "memory_ratio": results["slots"]["bytes"] / results["legacy"]["bytes"],
+        "speedup": results["legacy"]["seconds"] / results["slots"]["seconds"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=200)
+    parser.add_argument("--attributes", type=int, default=10)
+    parser.add_argument("--params", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    result = run(args.products, args.attributes, args.params, args.repeat)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
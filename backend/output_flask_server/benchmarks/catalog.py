@@ -0,0 +1,70 @@
+# catalog.py
+"""ベンチマーク用の合成カタログ (data.DB["products"] と同じ構造の dict) を作成します。"""
+
+# contract と、それに対応する param の type (_get_expected_param_type_from_contract と同じ規則)
+_CONTRACT_CYCLE = [("type1", "type1"), ("type2", "type2"), ("", "type3")]
+
+
+def build_param(param_id, param_type):
+    param = {"param_id": param_id, "sort_order": param_id, "type": param_type}
+    if param_type == "type2":
+        param["min"] = param_id
+        param["increment"] = param_id % 5 + 1
+    else:
+        param["code"] = f"code{param_id}"
+        param["disp_name"] = f"コード{param_id}"
+    return param
+
+
+def build_attribute(attribute_id, params_per_attribute):
+    contract, param_type = _CONTRACT_CYCLE[attribute_id % len(_CONTRACT_CYCLE)]
+    return {
+        "attribute_id": attribute_id,
+        "code": f"attr{attribute_id}",
+        "data_type": "string",
+        "disp_name": f"属性{attribute_id}",
+        "unit": "",
+        "contract": contract,
+        "public": attribute_id % 2 == 0,
+        "masking": attribute_id % 3 == 0,
+        "online": attribute_id % 2 == 1,
+        "sort_order": attribute_id,
+        "params": [build_param(i, param_type) for i in range(params_per_attribute)],
+    }
+
+
+def build_product(prod_id, attributes_per_product, params_per_attribute):
+    return {
+        "prod_id": prod_id,
+        "prefix": f"p{prod_id:05d}",
+        "prd_type": f"p{prod_id:05d}00",
+        "cfg_type": "abcdef",
+        "sort_order": prod_id,
+        "attributes": [
+            build_attribute(i, params_per_attribute)
+            for i in range(attributes_per_product)
+        ],
+    }
+
+
+def build_catalog(products, attributes_per_product, params_per_attribute):
+    """products × attributes × params の規模のカタログを返します。"""
+    return [
+        build_product(pid, attributes_per_product, params_per_attribute)
+        for pid in range(products)
+    ]
+
+
+def build_records(prod_id, attributes_per_product, params_per_attribute):
+    """build_product と同じ product を、POST /import のフラットなレコードにして返します。"""
+    product = build_product(prod_id, attributes_per_product, params_per_attribute)
+    attributes = product.pop("attributes")
+    records = [dict(product, kind="product")]
+    for attribute in attributes:
+        params = attribute.pop("params")
+        records.append(dict(attribute, kind="attribute", prod_id=prod_id))
+        aid = attribute["attribute_id"]
+        records.extend(
+            dict(param, kind="param", prod_id=prod_id, attribute_id=aid) for param in params
+        )
+    return records
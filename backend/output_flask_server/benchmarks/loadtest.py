@@ -0,0 +1,359 @@
+# loadtest.py
+"""
+openapi_server に対する負荷試験ハーネス。
+
+TabbedDataManager の保存処理と同じく「attribute/param の書き込みをまとめて
+行い、最後に /products を再取得する」流れなどを、指定した比率で再生します。
+
+- クローズドループ: --concurrency 本のワーカーが待ち時間なしで繰り返し実行
+- オープンループ:   --rate (シナリオ/秒) のポアソン到着で実行
+                    (遅延は予定到着時刻から計測し、coordinated omission を避ける)
+
+--url を省略するとサーバーをこのプロセス内 (ループバック) で起動し、
+合成カタログを投入してから計測するため、CI でもオフラインで実行できます。
+
+    python -m benchmarks.loadtest --duration 10 --concurrency 8 \\
+        --mix save_flow=3,get_product_by_id=5,list_products=1
+"""
+import argparse
+import http.client
+import json
+import logging
+import random
+import sys
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from benchmarks.stats import percentile
+
+DEFAULT_MIX = "save_flow=1"
+
+_ATTRIBUTE_FIELDS = (
+    "code", "data_type", "disp_name", "unit", "contract",
+    "public", "masking", "online", "sort_order",
+)
+
+
+class _KeepAliveHandler(WSGIRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+
+def start_local_server(products, attributes, params, seed):
+    """合成カタログを投入したサーバーをバックグラウンドスレッドで起動し、(server, base_url) を返します。"""
+    from openapi_server.app import create_app
+    from openapi_server.controllers import data
+    from openapi_server.synthetic import CatalogGenerator
+
+    generator = CatalogGenerator(seed=seed, attributes=attributes, params=params)
+    data.load_products(list(generator.iter_products(products)))
+    # リクエスト毎のアクセスログは計測の妨げになるので抑止する
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = make_server(
+        "127.0.0.1", 0, create_app().app, threaded=True, request_handler=_KeepAliveHandler
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/api"
+
+
+class Recorder:
+    """operationId ごとの (遅延, ステータス) を記録します。"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+        self.recording = False
+
+    def add(self, operation_id, latency, status):
+        if not self.recording:
+            return
+        with self._lock:
+            self.samples.setdefault(operation_id, []).append((latency, status))
+
+
+class Client:
+    """ワーカースレッド毎の keep-alive 接続。"""
+
+    def __init__(self, base_url, recorder):
+        parsed = urllib.parse.urlsplit(base_url)
+        self._host = parsed.hostname
+        self._port = parsed.port or 80
+        self._prefix = parsed.path.rstrip("/")
+        self._recorder = recorder
+        self._conn = None
+
+    def call(self, operation_id, method, path, body=None, started=None):
+        payload = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload is not None else {}
+        start = time.perf_counter() if started is None else started
+        for attempt in (0, 1):
+            if self._conn is None:
+                self._conn = http.client.HTTPConnection(self._host, self._port, timeout=30)
+            try:
+                self._conn.request(method, self._prefix + path, body=payload, headers=headers)
+                response = self._conn.getresponse()
+                raw = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                self._conn.close()
+                self._conn = None
+                if attempt:
+                    self._recorder.add(operation_id, time.perf_counter() - start, 0)
+                    return None
+        self._recorder.add(operation_id, time.perf_counter() - start, response.status)
+        if response.status >= 400 or not raw:
+            return None
+        return json.loads(raw)
+
+
+class Targets:
+    """負荷をかける対象 (product / attribute) の一覧。"""
+
+    def __init__(self, products):
+        self.product_ids = [p["prod_id"] for p in products]
+        self.attributes = [
+            (p["prod_id"], a) for p in products for a in p["attributes"]
+        ]
+        if not self.attributes:
+            raise ValueError("the catalog has no attributes to write to")
+
+    @staticmethod
+    def attribute_body(attribute):
+        return {field: attribute[field] for field in _ATTRIBUTE_FIELDS}
+
+    @staticmethod
+    def param_body(attribute, sort_order):
+        from openapi_server.controllers.parameters_controller import (
+            _get_expected_param_type_from_contract,
+        )
+
+        param_type = _get_expected_param_type_from_contract(attribute["contract"])
+        body = {"type": param_type, "sort_order": sort_order}
+        if param_type == "type2":
+            body.update(min=sort_order, increment=1)
+        else:
+            body.update(code=f"load{sort_order}", disp_name=f"負荷{sort_order}")
+        return body
+
+
+# --- シナリオ -------------------------------------------------------------
+
+def list_products(client, targets, rng, options, started=None):
+    client.call("list_products", "GET", "/products", started=started)
+
+
+def get_product_by_id(client, targets, rng, options, started=None):
+    pid = rng.choice(targets.product_ids)
+    client.call("get_product_by_id", "GET", f"/products/{pid}", started=started)
+
+
+def save_flow(client, targets, rng, options, started=None):
+    """attribute/param の書き込みをまとめて行い、最後に /products を再取得します。"""
+    pid, attribute = rng.choice(targets.attributes)
+    base = f"/products/{pid}/attributes/{attribute['attribute_id']}"
+    created = []
+    for i in range(options.burst):
+        client.call("update_attribute", "PUT", base, targets.attribute_body(attribute),
+                    started=started if i == 0 else None)
+        param = client.call("add_param", "POST", f"{base}/params",
+                            targets.param_body(attribute, i))
+        if param is not None:
+            created.append(param)
+            client.call("update_param", "PUT", f"{base}/params/{param['param_id']}",
+                        targets.param_body(attribute, i + 1))
+    for param in created:
+        client.call("delete_param", "DELETE", f"{base}/params/{param['param_id']}")
+    client.call("list_products", "GET", "/products")
+
+
+def attribute_churn(client, targets, rng, options, started=None):
+    """attribute の追加・更新・削除を1組行います。"""
+    pid, attribute = rng.choice(targets.attributes)
+    body = targets.attribute_body(attribute)
+    created = client.call("add_attribute", "POST", f"/products/{pid}/attributes", body,
+                          started=started)
+    if created is None:
+        return
+    path = f"/products/{pid}/attributes/{created['attribute_id']}"
+    client.call("update_attribute", "PUT", path, body)
+    client.call("delete_attribute", "DELETE", path)
+
+
+def refresh(client, targets, rng, options, started=None):
+    client.call("refresh_mock_data", "POST", "/refresh", started=started)
+
+
+SCENARIOS = {
+    "list_products": list_products,
+    "get_product_by_id": get_product_by_id,
+    "save_flow": save_flow,
+    "attribute_churn": attribute_churn,
+    "refresh_mock_data": refresh,
+}
+
+
+def parse_mix(text):
+    """'save_flow=3,list_products=1' を [(シナリオ関数, 重み)] に変換します。"""
+    mix = []
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        if name not in SCENARIOS:
+            raise ValueError(f"unknown scenario: {name}")
+        mix.append((SCENARIOS[name], float(weight or 1)))
+    return mix
+
+
+# --- 実行 -----------------------------------------------------------------
+
+def _closed_loop(base_url, targets, mix, options, recorder, deadline):
+    scenarios, weights = zip(*mix)
+
+    def worker(index):
+        rng = random.Random(options.seed + index)
+        client = Client(base_url, recorder)
+        while time.perf_counter() < deadline:
+            rng.choices(scenarios, weights)[0](client, targets, rng, options)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(options.concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return 0.0
+
+
+def _open_loop(base_url, targets, mix, options, recorder, deadline):
+    scenarios, weights = zip(*mix)
+    rng = random.Random(options.seed)
+    local = threading.local()
+    max_lag = 0.0
+    lag_lock = threading.Lock()
+
+    def run_one(scenario, scheduled, seed):
+        nonlocal max_lag
+        if not hasattr(local, "client"):
+            local.client = Client(base_url, recorder)
+        with lag_lock:
+            max_lag = max(max_lag, time.perf_counter() - scheduled)
+        scenario(local.client, targets, random.Random(seed), options, started=scheduled)
+
+    with ThreadPoolExecutor(max_workers=options.concurrency) as pool:
+        scheduled = time.perf_counter()
+        while True:
+            scheduled += rng.expovariate(options.rate)
+            if scheduled >= deadline:
+                break
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(run_one, rng.choices(scenarios, weights)[0], scheduled, rng.random())
+    return max_lag
+
+
+def report(recorder, elapsed):
+    operations = {}
+    total = 0
+    for operation_id, samples in sorted(recorder.samples.items()):
+        latencies = sorted(latency for latency, _ in samples)
+        statuses = {}
+        for _, status in samples:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        errors = sum(1 for _, status in samples if status == 0 or status >= 500)
+        total += len(samples)
+        operations[operation_id] = {
+            "count": len(samples),
+            "throughput": len(samples) / elapsed,
+            "errors": errors,
+            "statuses": statuses,
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "p99.9": percentile(latencies, 99.9),
+            "max": latencies[-1],
+        }
+    return {"requests": total, "throughput": total / elapsed, "operations": operations}
+
+
+def run(options):
+    mix = parse_mix(options.mix)
+    server = None
+    base_url = options.url
+    if base_url is None:
+        server, base_url = start_local_server(
+            options.products, options.attributes, options.params, options.seed
+        )
+    try:
+        recorder = Recorder()
+        products = Client(base_url, recorder).call("list_products", "GET", "/products")
+        if products is None:
+            raise RuntimeError(f"cannot list products from {base_url}")
+        targets = Targets(products)
+        loop = _open_loop if options.rate else _closed_loop
+
+        if options.warmup:
+            loop(base_url, targets, mix, options, recorder,
+                 time.perf_counter() + options.warmup)
+        recorder.recording = True
+        start = time.perf_counter()
+        max_lag = loop(base_url, targets, mix, options, recorder, start + options.duration)
+        elapsed = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    result = {
+        "benchmark": "loadtest",
+        "mode": "open" if options.rate else "closed",
+        "concurrency": options.concurrency,
+        "rate": options.rate,
+        "mix": options.mix,
+        "duration": elapsed,
+        "unit": "seconds",
+        **report(recorder, elapsed),
+    }
+    if options.rate:
+        result["max_schedule_lag"] = max_lag
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="対象サーバー (例: http://localhost:8080/api)。省略時はプロセス内で起動")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help=f"シナリオと重み ({', '.join(SCENARIOS)})")
+    parser.add_argument("--concurrency", type=int, default=4, help="ワーカー数")
+    parser.add_argument("--rate", type=float, help="オープンループの到着率 (シナリオ/秒)")
+    parser.add_argument("--duration", type=float, default=10.0, help="計測時間 (秒)")
+    parser.add_argument("--warmup", type=float, default=1.0, help="計測前のウォームアップ (秒)")
+    parser.add_argument("--burst", type=int, default=5, help="save_flow での書き込み回数")
+    parser.add_argument("--products", type=int, default=50, help="ローカル起動時の product 数")
+    parser.add_argument("--attributes", default="10", help="ローカル起動時の attribute 数")
+    parser.add_argument("--params", default="5", help="ローカル起動時の param 数")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="結果の出力先 (省略時は標準出力)")
+    parser.add_argument("--fail-on-errors", action="store_true",
+                        help="5xx または接続エラーがあれば終了コード1で終了")
+    options = parser.parse_args(argv)
+    try:
+        parse_mix(options.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    result = run(options)
+    text = json.dumps(result, indent=2)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+    errors = sum(op["errors"] for op in result["operations"].values())
+    if options.fail_on_errors and errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+# regress.py
+"""
+ベンチマークの回帰チェック。コミット済みのベースラインと比較します。
+
+bench_endpoints の全オペレーションと、ストアの読み込み (load_products) と
+モデル化 (Product.from_dict) を --runs 回繰り返して計測します。各回の中央値を
+1サンプルとして、ベースラインとの平均の差の 95% 信頼区間を Welch の方法で求めます。
+差が --threshold (割合) を超え、かつ信頼区間が 0 を含まない (ノイズでは説明できない)
+オペレーションがあれば回帰として終了コード 1 で終了します。
+
+    python -m benchmarks.regress                    # benchmarks/baseline.json と比較
+    python -m benchmarks.regress --update-baseline  # ベースラインを作り直す
+
+ベースラインは計測したマシンに依存するので、CI と同じ環境で作り直してコミットしてください。
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+from openapi_server.controllers import data
+from openapi_server.models.product import Product
+
+from benchmarks import bench_endpoints
+from benchmarks.catalog import build_catalog
+from benchmarks.stats import difference_interval, mean_interval
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def bench_store(scale, iterations):
+    """ストアの読み込みとモデル化を計測し、名前 -> 中央値 (秒) の dict を返します。"""
+    catalog = build_catalog(*bench_endpoints.SCALES[scale])
+    load, from_dict = [], []
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            data.load_products(catalog)
+            load.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            [Product.from_dict(p) for p in catalog]
+            from_dict.append(time.perf_counter() - start)
+    finally:
+        data.initialize_data()
+    return {"store.load_products": statistics.median(load),
+            "store.from_dict": statistics.median(from_dict)}
+
+
+def run_once(scales, iterations):
+    """全ベンチマークを1回実行し、"規模/名前" -> 中央値 (秒) の dict を返します。"""
+    endpoints = bench_endpoints.run(scales, iterations)["results"]
+    medians = {}
+    for scale in scales:
+        for name, summary in endpoints[scale].items():
+            medians[f"{scale}/{name}"] = summary["median"]
+        for name, median in bench_store(scale, iterations).items():
+            medians[f"{scale}/{name}"] = median
+    return medians
+
+
+def collect(scales, iterations, runs, warmup=1):
+    """runs 回計測し、"規模/名前" -> 各回の中央値のリスト を返します (warmup 回は捨てる)。"""
+    for _ in range(warmup):
+        run_once(scales, iterations)
+    samples = {}
+    for _ in range(runs):
+        for key, median in run_once(scales, iterations).items():
+            samples.setdefault(key, []).append(median)
+    return samples
+
+
+def compare(current, baseline, threshold):
+    """各オペレーションの比較結果のリストを返します。
+
+    regression はベースラインより threshold (割合) 以上遅く、
+    かつ差の 95% 信頼区間が 0 を含まない場合に True になります。
+    """
+    rows = []
+    for key in sorted(set(current) | set(baseline)):
+        if key not in current or key not in baseline:
+            rows.append({"name": key, "status": "new" if key in current else "missing",
+                         "regression": False})
+            continue
+        base_mean, _, _ = mean_interval(baseline[key])
+        diff, low, high = difference_interval(current[key], baseline[key])
+        change = diff / base_mean if base_mean else 0.0
+        regression = change > threshold and low > 0
+        if regression:
+            status = "regression"
+        elif change < -threshold and high < 0:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append({
+            "name": key,
+            "status": status,
+            "regression": regression,
+            "baseline": base_mean,
+            "current": statistics.fmean(current[key]),
+            "change": change,
+            "diff_ci": [low, high],
+        })
+    return rows
+
+
+def format_report(rows, threshold):
+    lines = [f"{'operation':40} {'baseline ms':>12} {'current ms':>12} {'change':>8}  "
+             f"{'95% CI of diff (ms)':>22}  status"]
+    for row in rows:
+        if "change" not in row:
+            lines.append(f"{row['name']:40} {'':>12} {'':>12} {'':>8}  {'':>22}  {row['status']}")
+            continue
+        low, high = row["diff_ci"]
+        lines.append(
+            f"{row['name']:40} {row['baseline'] * 1000:12.3f} {row['current'] * 1000:12.3f} "
+            f"{row['change']:+8.1%}  {f'[{low * 1000:+.3f}, {high * 1000:+.3f}]':>22}  {row['status']}"
+        )
+    regressions = sum(row["regression"] for row in rows)
+    lines.append(f"{regressions} regression(s) beyond {threshold:.0%}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="比較せずに計測結果でベースラインを書き換える")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="回帰とみなす遅くなった割合 (既定 0.25 = 25%%)")
+    parser.add_argument("--scales", help="カンマ区切り (省略時はベースラインと同じ)")
+    parser.add_argument("--iterations", type=int, help="1回あたりの反復回数 (省略時はベースラインと同じ)")
+    parser.add_argument("--runs", type=int, help="繰り返し回数 (省略時はベースラインと同じ)")
+    parser.add_argument("--output", help="比較結果の JSON の出力先")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if not args.update_baseline:
+        try:
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        except FileNotFoundError:
+            parser.error(f"baseline not found: {args.baseline} (create it with --update-baseline)")
+
+    settings = baseline["settings"] if baseline else {"scales": ["small", "medium"], "iterations": 20, "runs": 5}
+    scales = args.scales.split(",") if args.scales else settings["scales"]
+    unknown = [s for s in scales if s not in bench_endpoints.SCALES]
+    if unknown:
+        parser.error(f"unknown scale: {', '.join(unknown)}")
+    iterations = args.iterations or settings["iterations"]
+    runs = args.runs or settings["runs"]
+    if runs < 2:
+        parser.error("--runs must be at least 2 to estimate noise")
+
+    samples = collect(scales, iterations, runs)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "benchmark": "regression-baseline",
+                "commit": bench_endpoints._git_commit(),
+                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "settings": {"scales": scales, "iterations": iterations, "runs": runs},
+                "unit": "seconds",
+                "samples": samples,
+            }, f, indent=2)
+            f.write("\n")
+        sys.stdout.write(f"baseline written to {args.baseline}\n")
+        return 0
+
+    # --scales で絞った場合、対象外の規模はベースラインからも除く
+    selected = {key: values for key, values in baseline["samples"].items()
+                if key.split("/", 1)[0] in scales}
+    rows = compare(samples, selected, args.threshold)
+    sys.stdout.write(format_report(rows, args.threshold) + "\n")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"baseline_commit": baseline.get("commit"),
+                       "commit": bench_endpoints._git_commit(),
+                       "threshold": args.threshold,
+                       "results": rows}, f, indent=2)
+            f.write("\n")
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+# stats.py
+"""ベンチマーク結果の集計ヘルパー。"""
+import math
+import statistics
+
+
+def percentile(sorted_samples, q):
+    """ソート済みサンプルの q パーセンタイル (線形補間) を返します。"""
+    if not sorted_samples:
+        return None
+    if len(sorted_samples) == 1:
+        return sorted_samples[0]
+    pos = (len(sorted_samples) - 1) * q / 100.0
+    lower = math.floor(pos)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    frac = pos - lower
+    return sorted_samples[lower] * (1 - frac) + sorted_samples[upper] * frac
+
+
+def summarize(samples):
+    """秒単位のサンプル列を集計した dict を返します。"""
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": statistics.fmean(ordered),
+        "median": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+
+# 両側 95% の t 分布の臨界値 (自由度 1〜30)。それより大きい自由度は正規分布で近似する
+_T95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+
+
+def t_critical(df):
+    """自由度 df の両側 95% の t 値を返します (小数の自由度は切り捨て)。"""
+    df = max(int(df), 1)
+    return _T95[df - 1] if df <= len(_T95) else 1.960
+
+
+def mean_interval(samples):
+    """平均とその 95% 信頼区間 (mean, low, high) を返します。"""
+    mean = statistics.fmean(samples)
+    if len(samples) < 2:
+        return mean, mean, mean
+    half = t_critical(len(samples) - 1) * statistics.stdev(samples) / math.sqrt(len(samples))
+    return mean, mean - half, mean + half
+
+
+def difference_interval(current, baseline):
+    """平均の差 (current - baseline) とその 95% 信頼区間を Welch の方法で返します。"""
+    diff = statistics.fmean(current) - statistics.fmean(baseline)
+    if len(current) < 2 or len(baseline) < 2:
+        return diff, diff, diff
+    var_c = statistics.variance(current) / len(current)
+    var_b = statistics.variance(baseline) / len(baseline)
+    se = math.sqrt(var_c + var_b)
+    if se == 0.0:
+        return diff, diff, diff
+    df = (var_c + var_b) ** 2 / (
+        var_c ** 2 / (len(current) - 1) + var_b ** 2 / (len(baseline) - 1)
+    )
+    half = t_critical(df) * se
+    return diff, diff - half, diff + half
@@ -1,17 +1,10 @@
 #!/usr/bin/env python3
 
-import connexion
-
-from openapi_server import encoder
+from openapi_server.app import create_app
 
 
 def main():
-    app = connexion.App(__name__, specification_dir='./openapi/')
-    app.app.json_encoder = encoder.JSONEncoder
-    app.add_api('openapi.yaml',
-                arguments={'title': 'Sample Product API'},
-                pythonic_params=True)
-
+    app = create_app()
     app.run(port=8080)
 
 
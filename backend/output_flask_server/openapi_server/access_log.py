@@ -0,0 +1,154 @@
+# access_log.py
+"""
+API の全オペレーションのアクセスログを JSON Lines で記録します。
+
+instrumentation のリスナーとして動作します。リクエストスレッドでは
+サンプリングの判定と値のタプルをキューに入れるだけで、dict は作りません。
+書き込みスレッドが、あらかじめ組み立てたフィールド配置 (_LINE_FORMAT) に
+値を埋め込んで1行にし、ハンドラーへ渡します。
+
+ハンドラーは ACCESS_LOG_HANDLER (ドット区切りのクラス名) で指定します。
+既定は log_handlers.AppendFileHandler (umask/sample.py から取り込んだもの) で、
+パーミッション (ACCESS_LOG_PERMISSIONS) を指定したファイルに複数プロセスから
+安全に追記できます。指定したクラスを読み込めない場合は
+起動時に RuntimeError になります (パーミッションを指定できないハンドラーに
+黙って切り替えることはしません)。空文字列を指定すると logging.FileHandler を使います。
+
+1行の例:
+    {"ts":"2024-05-01T12:00:00.123+00:00","operationId":"delete_param",
+     "productId":0,"attributeId":1,"paramId":2,"status":204,
+     "bytesIn":0,"bytesOut":0,"durationMs":1.234}
+"""
+import atexit
+import datetime
+import importlib
+import json
+import logging
+import queue
+import random
+import threading
+import time
+
+LOGGER_NAME = "openapi_server.access"
+
+# フィールドの並びは固定なので、1行分の書式を一度だけ組み立てておく
+FIELDS = (
+    ("ts", "%s"),
+    ("operationId", "%s"),
+    ("productId", "%s"),
+    ("attributeId", "%s"),
+    ("paramId", "%s"),
+    ("status", "%d"),
+    ("bytesIn", "%d"),
+    ("bytesOut", "%s"),  # ストリーミングのレスポンスでは null
+    ("durationMs", "%.3f"),
+)
+_LINE_FORMAT = "{" + ",".join('"%s":%s' % field for field in FIELDS) + "}"
+
+_READ_METHODS = frozenset(("GET", "HEAD"))
+_STOP = object()
+
+
+def _json_id(value):
+    if value is None:
+        return "null"
+    if type(value) is int:
+        return str(value)
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+def format_line(values):
+    """observe() がキューに入れた値のタプルを JSON の1行にします。"""
+    timestamp, operation_id, product_id, attribute_id, param_id, status, bytes_in, bytes_out, duration = values
+    ts = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).isoformat(timespec="milliseconds")
+    return _LINE_FORMAT % (
+        '"' + ts + '"',
+        json.dumps(operation_id, ensure_ascii=False),
+        _json_id(product_id),
+        _json_id(attribute_id),
+        _json_id(param_id),
+        status,
+        bytes_in,
+        _json_id(bytes_out),
+        duration * 1000.0,
+    )
+
+
+def load_handler(dotted_name, path, permissions):
+    """dotted_name のハンドラークラスを path と permissions で作成します。
+
+    dotted_name が空なら logging.FileHandler を使います (permissions は使わない)。
+
+    :raises RuntimeError: dotted_name のクラスを読み込めない場合
+    """
+    if not dotted_name:
+        return logging.FileHandler(path, encoding="utf-8")
+    module_name, _, class_name = dotted_name.rpartition(".")
+    try:
+        handler_class = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError, ValueError) as e:
+        raise RuntimeError(
+            f"access log handler {dotted_name!r} is not available ({e}); put its module on "
+            "PYTHONPATH, or unset OPENAPI_ACCESS_LOG_HANDLER to use the default "
+            "openapi_server.log_handlers.AppendFileHandler"
+        ) from e
+    return handler_class(path, permissions=permissions)
+
+
+class AccessLog:
+    def __init__(self, handler, read_sample_rate=1.0):
+        self.handler = handler
+        self.read_sample_rate = read_sample_rate
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="access-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def observe(self, record):
+        """instrumentation のリスナー。読み込み系の成功レスポンスだけをサンプリングします。"""
+        rate = self.read_sample_rate
+        if rate < 1.0 and record.method in _READ_METHODS and record.status < 400 and random.random() >= rate:
+            return
+        path_params = record.path_params
+        self._queue.put((
+            time.time(),
+            record.operation_id,
+            path_params.get("productId"),
+            path_params.get("attributeId"),
+            path_params.get("paramId"),
+            record.status,
+            record.request_bytes,
+            record.response_bytes,
+            record.duration,
+        ))
+
+    def _run(self):
+        handler = self.handler
+        while True:
+            values = self._queue.get()
+            if values is _STOP:
+                break
+            line = format_line(values)
+            handler.handle(logging.LogRecord(LOGGER_NAME, logging.INFO, __file__, 0, line, None, None))
+        handler.close()
+
+    def close(self):
+        """キューに残った行を書き出してから書き込みスレッドを停止します。"""
+        atexit.unregister(self.close)
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+
+def init_app(app, handler=None):
+    """ACCESS_LOG (出力先のファイル) が設定されていれば、アクセスログを有効にします。"""
+    path = app.config.get("ACCESS_LOG", "")
+    if handler is None:
+        if not path:
+            return None
+        handler = load_handler(app.config.get("ACCESS_LOG_HANDLER", ""), path,
+                               app.config.get("ACCESS_LOG_PERMISSIONS", 0o600))
+    access_log = AccessLog(handler, app.config.get("ACCESS_LOG_READ_SAMPLE_RATE", 1.0))
+    app.extensions["access_log"] = access_log
+    app.extensions["instrumentation"].add_listener(access_log.observe)
+    return access_log
@@ -0,0 +1,38 @@
+import connexion
+
+from openapi_server import access_log
+from openapi_server import bulk
+from openapi_server import compaction
+from openapi_server import config as default_config
+from openapi_server import encoder
+from openapi_server import memory
+from openapi_server import metrics
+from openapi_server import profiling
+from openapi_server import slow_log
+from openapi_server.instrumentation import Instrumentation, InstrumentedResolver
+
+
+def create_app(config=None):
+    """connexion アプリケーションを作成します (サーバー起動とテストで共通)。
+
+    config で openapi_server.config の設定値を上書きできます。
+    """
+    app = connexion.App(__name__, specification_dir='./openapi/')
+    app.app.config.update(default_config.from_env())
+    app.app.config.update(config or {})
+    app.app.json_encoder = encoder.JSONEncoder
+    # 日本語の disp_name などを \uXXXX にエスケープせず UTF-8 のまま出力する
+    app.app.config['JSON_AS_ASCII'] = False
+    app.add_api('openapi.yaml',
+                arguments={'title': 'Sample Product API'},
+                pythonic_params=True,
+                resolver=InstrumentedResolver())
+    Instrumentation(app.app)
+    metrics.init_app(app.app)
+    profiling.init_app(app.app)
+    slow_log.init_app(app.app)
+    access_log.init_app(app.app)
+    memory.init_app(app.app)
+    bulk.init_app(app.app)
+    compaction.init_app(app.app)
+    return app
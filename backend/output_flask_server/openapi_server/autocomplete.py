@@ -0,0 +1,97 @@
+# autocomplete.py
+"""
+product の prefix / prd_type と attribute の code の入力補完 (GET /autocomplete)。
+
+PrefixIndex は、値の重複を除いたソート済みの配列です。
+
+- 配列の要素は (正規化した値, 値) のタプルで、正規化は search.normalize と同じ
+  (NFKC + casefold) です。ソート順が正規化した値の順なので、前方一致する値は
+  配列上で連続し、bisect で先頭を探したあと k 件を切り出すだけで取り出せます
+  (O(log n + k))。
+- 同じ値を使っている product / attribute の数を別の dict で数え、最後の1つが
+  なくなったときに配列から取り除きます。
+- 配列への挿入・削除は list の要素の移動を伴いますが、移動するのは
+  ポインタだけなので、ストアの規模ではノードを持つトライより速く小さく済みます。
+- ストアの読み込みやインポートでは bulk() の中で追加し、新しい値を最後に
+  まとめて1回だけソートします (1つずつ挿入すると O(n^2) になる)。
+
+ストアとの同期は controllers/data.py の index_product などが行います。
+"""
+import bisect
+import contextlib
+
+from openapi_server.search import normalize
+
+FIELDS = ("prefix", "prd_type", "code")
+
+
+class PrefixIndex:
+    """値の前方一致を引くための、ソート済みの配列による索引。"""
+
+    def __init__(self):
+        self._entries = []  # (正規化した値, 値) のソート済みリスト
+        self._counts = {}  # 値 -> その値を使っているもの (product / attribute) の数
+        self._pending = None  # bulk() の中で新しく使われた値 (配列にはまだ入れていない)
+
+    def __len__(self):
+        return len(self._counts)
+
+    def add(self, value):
+        if not value:
+            return
+        count = self._counts.get(value, 0)
+        self._counts[value] = count + 1
+        if count == 0:
+            if self._pending is not None:
+                self._pending.add(value)
+            else:
+                bisect.insort(self._entries, (normalize(value), value))
+
+    def remove(self, value):
+        count = self._counts.get(value)
+        if not count:
+            return
+        if count > 1:
+            self._counts[value] = count - 1
+            return
+        del self._counts[value]
+        if self._pending is not None and value in self._pending:
+            self._pending.discard(value)
+            return
+        entry = (normalize(value), value)
+        i = bisect.bisect_left(self._entries, entry)
+        if i < len(self._entries) and self._entries[i] == entry:
+            del self._entries[i]
+
+    def memory_parts(self):
+        """メモリ使用量の見積もり (memory.py) に使う内部のコンテナ。"""
+        return {"entries": self._entries, "counts": self._counts}
+
+    @contextlib.contextmanager
+    def bulk(self):
+        """この中での add をまとめ、抜けるときに新しい値を配列に加えて1回だけソートします。"""
+        if self._pending is not None:
+            yield
+            return
+        self._pending = set()
+        try:
+            yield
+        finally:
+            pending, self._pending = self._pending, None
+            if pending:
+                self._entries.extend((normalize(value), value) for value in pending)
+                self._entries.sort()
+
+    def complete(self, prefix, limit=10):
+        """正規化した prefix で始まる値を、正規化した値の順に最大 limit 件返します。
+
+        各要素は {"value": 値, "count": その値を使っているものの数} です。
+        """
+        key = normalize(prefix or "")
+        start = bisect.bisect_left(self._entries, (key,))
+        completions = []
+        for text, value in self._entries[start:start + limit]:
+            if not text.startswith(key):
+                break
+            completions.append({"value": value, "count": self._counts[value]})
+        return completions
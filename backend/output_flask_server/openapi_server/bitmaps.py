@@ -0,0 +1,167 @@
+# bitmaps.py
+"""
+attribute の絞り込み検索 (GET /attributes) のためのビットマップ索引。
+
+BitmapIndex は、登録した要素 (attribute) ごとにスロット番号を割り当て、
+(フィールド, 値) ごとに「その値を持つスロット」のビットを立てた bytearray を持ちます。
+
+- 登録・変更・削除は、変わったフィールドのビットを立て直すだけなので
+  要素数によらず一定時間です (各スロットの現在の値を覚えているので、
+  変更時に呼び出し側が元の値を渡す必要はない)。
+- 検索は条件のビットマップを int にして AND を取り、立っているビットを
+  64 ビットずつ取り出します。結果はキー ((prod_id, attribute_id)) の順なので、
+  ストアを読み直しても offset / limit のページは変わりません。
+- スロットは先頭から _ordered 個がキーの順に並んでいます。それより大きいキーの
+  登録は末尾に足すだけで順序を保ち、それ以外 (既存の product への attribute の
+  追加など) は順序の外の「尾部」に入ります。検索は尾部の一致だけをキーでソートして
+  先頭部分と併合します。尾部が大きくなったら (_REORDER_RATIO) スロットを
+  キーの順に振り直します。
+- 削除したスロットは再利用しません。削除済みのスロットは live のビットを
+  落とすだけで、スロットを振り直すときに詰められます。
+
+ストアとの同期は controllers/data.py の index_attribute などが行います。
+"""
+import heapq
+import itertools
+
+# 絞り込みに使う attribute のフィールド (真偽値と、値の種類が少ない文字列)
+FIELDS = ("public", "masking", "online", "contract", "data_type", "unit")
+
+_WORD_BYTES = 8
+
+# 順序の外のスロットがこの割合 (かつ _REORDER_MIN 個) を超えたら、スロットを振り直す
+_REORDER_RATIO = 0.125
+_REORDER_MIN = 64
+
+
+def _set_bit(bitmap, slot):
+    index = slot >> 3
+    if index >= len(bitmap):
+        bitmap.extend(bytes(index + 1 - len(bitmap)))
+    bitmap[index] |= 1 << (slot & 7)
+
+
+def _clear_bit(bitmap, slot):
+    index = slot >> 3
+    if index < len(bitmap):
+        bitmap[index] &= ~(1 << (slot & 7)) & 0xFF
+
+
+def iter_bits(bits):
+    """int の立っているビットの位置を小さい順に yield します。"""
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for offset in range(0, len(data), _WORD_BYTES):
+        word = int.from_bytes(data[offset:offset + _WORD_BYTES], "little")
+        base = offset * 8
+        while word:
+            low = word & -word
+            yield base + low.bit_length() - 1
+            word ^= low
+
+
+class BitmapIndex:
+    """要素のフィールドの値ごとのビットマップ索引。"""
+
+    def __init__(self, fields=FIELDS):
+        self.fields = tuple(fields)
+        self._slots = {}  # 要素のキー -> スロット
+        self._items = []  # スロット -> (キー, 要素) (削除済みなら None)
+        self._values = []  # スロット -> 登録時のフィールドの値のタプル
+        self._live = bytearray()
+        self._bitmaps = {}  # (フィールド, 値) -> bytearray
+        self._ordered = 0  # 先頭からキーの順に並んでいるスロットの数
+        self._last_key = None  # スロット _ordered - 1 に登録したキー
+
+    def __len__(self):
+        return len(self._slots)
+
+    def add(self, key, item):
+        """要素 item (dict) をキー key で登録します。登録済みなら値の変わったフィールドだけ更新します。"""
+        values = tuple(item.get(field) for field in self.fields)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = len(self._items)
+            self._slots[key] = slot
+            self._items.append((key, item))
+            self._values.append((None,) * len(self.fields))
+            old_values = None
+            _set_bit(self._live, slot)
+            if self._ordered == slot and (self._last_key is None or key > self._last_key):
+                self._ordered += 1
+                self._last_key = key
+        else:
+            self._items[slot] = (key, item)
+            old_values = self._values[slot]
+        for field, old, new in zip(self.fields, old_values or values, values):
+            if old_values is not None:
+                if old == new:
+                    continue
+                _clear_bit(self._bitmaps[(field, old)], slot)
+            _set_bit(self._bitmaps.setdefault((field, new), bytearray()), slot)
+        self._values[slot] = values
+        unordered = len(self._items) - self._ordered
+        if unordered > _REORDER_MIN and unordered > len(self._items) * _REORDER_RATIO:
+            self._reorder()
+
+    def _reorder(self):
+        """登録済みの要素のスロットを、キーの順に詰めて振り直します。"""
+        entries = sorted(
+            (entry[0], slot) for slot, entry in enumerate(self._items) if entry is not None
+        )
+        items, values = self._items, self._values
+        self._slots = {}
+        self._items = []
+        self._values = []
+        self._live = bytearray()
+        self._bitmaps = {}
+        for new_slot, (key, slot) in enumerate(entries):
+            self._slots[key] = new_slot
+            self._items.append(items[slot])
+            self._values.append(values[slot])
+            _set_bit(self._live, new_slot)
+            for field, value in zip(self.fields, values[slot]):
+                _set_bit(self._bitmaps.setdefault((field, value), bytearray()), new_slot)
+        self._ordered = len(self._items)
+        self._last_key = entries[-1][0] if entries else self._last_key
+
+    def remove(self, key):
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+        for field, value in zip(self.fields, self._values[slot]):
+            _clear_bit(self._bitmaps[(field, value)], slot)
+        _clear_bit(self._live, slot)
+        self._items[slot] = None
+        self._values[slot] = None
+
+    def memory_parts(self):
+        """メモリ使用量の見積もり (memory.py) に使う内部のコンテナ。"""
+        return {"slots": self._slots, "items": self._items, "values": self._values,
+                "live": self._live, "bitmaps": self._bitmaps}
+
+    def query(self, filters, offset=0, limit=50):
+        """filters ({フィールド: 値}) をすべて満たす要素を数え、offset から limit 件返します。
+
+        (一致した数, [(キー, 要素), ...]) を返します。
+        """
+        bits = int.from_bytes(self._live, "little")
+        for field, value in filters.items():
+            bitmap = self._bitmaps.get((field, value))
+            if bitmap is None:
+                return 0, []
+            bits &= int.from_bytes(bitmap, "little")
+            if not bits:
+                return 0, []
+        ordered = self._ordered
+        head = bits & ((1 << ordered) - 1)
+        tail = bits >> ordered
+        if not tail:
+            slots = iter_bits(head)
+        else:
+            # 順序の外の一致だけをキーでソートし、キーの順の先頭部分と併合する
+            items = self._items
+            tail_keys = sorted((items[ordered + bit][0], ordered + bit) for bit in iter_bits(tail))
+            head_keys = ((items[slot][0], slot) for slot in iter_bits(head))
+            slots = (slot for _, slot in heapq.merge(head_keys, tail_keys))
+        page = [self._items[slot] for slot in itertools.islice(slots, offset, offset + limit)]
+        return bits.bit_count(), page
@@ -0,0 +1,276 @@
+# bulk.py
+"""
+カタログの一括取り込み (POST /import)。
+
+入力は synthetic.py の ndjson と同じ、1行1レコードのフラット形式です。
+
+    {"kind": "product", "prod_id": 0, "prefix": ..., ...}
+    {"kind": "attribute", "prod_id": 0, "attribute_id": 0, "code": ..., ...}
+    {"kind": "param", "prod_id": 0, "attribute_id": 0, "param_id": 0, "type": "type1", ...}
+
+リクエストボディは1行ずつ読み込み (1行の長さは MAX_LINE_BYTES まで)、
+各行を openapi.yaml のスキーマで検証してから batch_size 行ごとにストアへ
+反映します。親の存在と contract に対する param の type の検証は反映時に行います。
+行ごとのエラーと進捗はイベント (dict) として返すだけで溜め込まないので、
+取り込み中のメモリ使用量はアップロードの大きさによらず一定です。
+"""
+import io
+import json
+
+from flask import g, request
+from jsonschema import Draft4Validator
+from werkzeug.wsgi import get_input_stream
+
+from openapi_server.controllers import data
+from openapi_server.controllers.parameters_controller import (
+    _get_expected_param_type_from_contract,
+)
+from openapi_server.instrumentation import operation_id_for
+from openapi_server.synthetic import _resolve, load_schemas
+
+IMPORT_OPERATION_ID = "import_catalog"
+MAX_LINE_BYTES = 1 << 20
+DEFAULT_BATCH_SIZE = 500
+
+_VALIDATORS = None
+
+
+def _record_schema(schemas, name, parents, exclude):
+    """スキーマ name を、kind と親の ID を持つフラットなレコードのスキーマにします。"""
+    resolved = _resolve(schemas, schemas[name])
+    properties = {
+        field: prop for field, prop in resolved["properties"].items() if field not in exclude
+    }
+    properties["kind"] = {"type": "string"}
+    for parent in parents:
+        properties[parent] = {"type": "integer"}
+    required = [field for field in resolved["required"] if field not in exclude]
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(parents) + required,
+        "additionalProperties": False,
+    }
+
+
+def get_validators():
+    """kind (param は type) -> Draft4Validator の dict を返します (初回に作成)。"""
+    global _VALIDATORS
+    if _VALIDATORS is None:
+        schemas = load_schemas()
+        validators = {
+            "product": _record_schema(schemas, "Product", (), {"attributes"}),
+            "attribute": _record_schema(schemas, "Attribute", ("prod_id",), {"params"}),
+        }
+        mapping = schemas["ParamItem"]["discriminator"]["mapping"]
+        for param_type, ref in mapping.items():
+            validators["param:" + param_type] = _record_schema(
+                schemas, ref.rsplit("/", 1)[-1], ("prod_id", "attribute_id"), ()
+            )
+        _VALIDATORS = {key: Draft4Validator(schema) for key, schema in validators.items()}
+    return _VALIDATORS
+
+
+def iter_lines(stream, max_line_bytes=MAX_LINE_BYTES):
+    """stream から (行番号, 行の bytes) を読み込みます。
+
+    max_line_bytes を超える行は読み飛ばし、行の代わりに None を返します。
+    """
+    lineno = 0
+    while True:
+        line = stream.readline(max_line_bytes + 1)
+        if not line:
+            return
+        lineno += 1
+        if len(line) > max_line_bytes and not line.endswith(b"\n"):
+            while line and not line.endswith(b"\n"):
+                line = stream.readline(max_line_bytes)
+            yield lineno, None
+            continue
+        yield lineno, line
+
+
+def _detach_import_stream():
+    """取り込みのリクエストから WSGI の入力ストリームを取り出します。
+
+    connexion はコントローラーを呼ぶ前にボディ全体を get_data() で読み込むので、
+    取り込みではその前にストリームを g に移し、connexion には空のボディを見せます。
+    """
+    if operation_id_for(request.endpoint) != IMPORT_OPERATION_ID:
+        return
+    environ = request.environ
+    g.import_stream = get_input_stream(environ)
+    g.import_content_length = environ.get("CONTENT_LENGTH")
+    environ["wsgi.input"] = io.BytesIO()
+    environ["CONTENT_LENGTH"] = "0"
+
+
+def take_import_stream():
+    """_detach_import_stream() で取り出したストリームを返します (コントローラーから呼ぶ)。"""
+    # 計測 (request_bytes) が元の長さを使えるよう Content-Length を戻す
+    if g.import_content_length is not None:
+        request.environ["CONTENT_LENGTH"] = g.import_content_length
+    return g.import_stream
+
+
+def init_app(app):
+    app.before_request(_detach_import_stream)
+
+
+class ImportRecordError(Exception):
+    """1行のレコードを取り込めないことを表します。"""
+
+
+class CatalogImporter:
+    """フラット形式のレコードを検証し、バッチ単位でストアに反映します。"""
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, unique_codes=False):
+        self.batch_size = batch_size
+        self.unique_codes = unique_codes
+        self.lines = 0
+        self.counts = {"product": 0, "attribute": 0, "param": 0}
+        self.error_count = 0
+        self._validators = get_validators()
+        self._batch = []
+
+    def run(self, lines):
+        """(行番号, 行) を取り込み、error と progress のイベントを順に yield します。
+
+        error はバッチを反映するときに行番号の順で yield されます (読み込めなかった行も
+        バッチに入れておき、反映できなかった行と並べる)。
+        progress はバッチを反映するたびと、最後に一度 yield されます。
+        """
+        for lineno, line in lines:
+            try:
+                record = self._parse(line)
+            except ImportRecordError as e:
+                self._batch.append((lineno, e))
+            else:
+                if record is not None:
+                    self._batch.append((lineno, record))
+            if len(self._batch) >= self.batch_size:
+                yield from self._flush()
+                yield self.progress()
+        yield from self._flush()
+        yield self.progress()
+
+    def progress(self):
+        return {
+            "event": "progress",
+            "lines": self.lines,
+            "products": self.counts["product"],
+            "attributes": self.counts["attribute"],
+            "params": self.counts["param"],
+            "error_count": self.error_count,
+        }
+
+    def _error(self, lineno, message):
+        self.error_count += 1
+        return {"event": "error", "line": lineno, "message": message}
+
+    def _parse(self, line):
+        """1行を JSON として読み込み、スキーマで検証したレコードを返します (空行は None)。"""
+        if line is None:
+            self.lines += 1
+            raise ImportRecordError(f"Line is longer than {MAX_LINE_BYTES} bytes.")
+        if not line.strip():
+            return None
+        self.lines += 1
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise ImportRecordError(f"Invalid JSON: {e}")
+        if not isinstance(record, dict):
+            raise ImportRecordError("Record must be a JSON object.")
+        kind = record.get("kind")
+        key = "param:" + str(record.get("type")) if kind == "param" else kind
+        validator = self._validators.get(key)
+        if validator is None:
+            if kind == "param":
+                raise ImportRecordError(f"Unknown parameter type '{record.get('type')}'.")
+            raise ImportRecordError(f"Unknown record kind '{kind}'.")
+        for error in validator.iter_errors(record):
+            location = "/".join(str(p) for p in error.absolute_path)
+            raise ImportRecordError(f"{location + ': ' if location else ''}{error.message}")
+        return record
+
+    def _flush(self):
+        """溜まったバッチをストアに反映し、読み込めなかった行と反映できなかった行の error を yield します。"""
+        batch, self._batch = self._batch, []
+        apply = {"product": self._apply_product, "attribute": self._apply_attribute,
+                 "param": self._apply_param}
+        errors = []
+        # エクスポートのスナップショットと混ざらないよう、バッチはロックを取って反映する
+        # (ロック中に yield すると、ストリーミング中のレスポンスの書き込みを待つことになる)
+        # 索引への登録はバッチごとにまとめる (data.bulk_indexing)
+        with data.LOCK, data.bulk_indexing():
+            for lineno, record in batch:
+                if isinstance(record, ImportRecordError):
+                    errors.append(self._error(lineno, str(record)))
+                    continue
+                kind = record.pop("kind")
+                try:
+                    apply[kind](record)
+                except ImportRecordError as e:
+                    errors.append(self._error(lineno, str(e)))
+                else:
+                    self.counts[kind] += 1
+        yield from errors
+
+    @staticmethod
+    def _find_attribute(pid, aid):
+        # 存在確認はストアのIDの索引で行う (削除済みのものは含まれない)
+        if pid not in data.DB["products"]:
+            raise ImportRecordError(f"Product {pid} not found.")
+        return data.find_attribute(pid, aid)
+
+    def _apply_product(self, record):
+        pid = record["prod_id"]
+        if pid in data.DB["products"]:
+            raise ImportRecordError(f"Product {pid} already exists.")
+        record["attributes"] = []
+        data.DB["products"][pid] = record
+        data.index_product(record)
+        data.DB["next_product_id"] = max(data.DB["next_product_id"], pid + 1)
+        data.DB["next_attribute_id"].setdefault(pid, 0)
+        data.DB["attribute_codes"].setdefault(pid, {})
+
+    def _apply_attribute(self, record):
+        pid = record.pop("prod_id")
+        aid = record["attribute_id"]
+        if self._find_attribute(pid, aid) is not None:
+            raise ImportRecordError(f"Attribute {aid} already exists in product {pid}.")
+        if self.unique_codes and data.attribute_code_taken(pid, record["code"]):
+            raise ImportRecordError(
+                f"Attribute code '{record['code']}' already exists in product {pid}."
+            )
+        record["params"] = []
+        data.DB["products"][pid]["attributes"].append(record)
+        data.index_attribute_code(pid, record["code"], aid)
+        data.index_attribute(pid, record)
+        counters = data.DB["next_attribute_id"]
+        counters[pid] = max(counters.get(pid, 0), aid + 1)
+        data.DB["next_param_id"].setdefault((pid, aid), 0)
+
+    def _apply_param(self, record):
+        pid = record.pop("prod_id")
+        aid = record.pop("attribute_id")
+        attribute = self._find_attribute(pid, aid)
+        if attribute is None:
+            raise ImportRecordError(f"Attribute {aid} in product {pid} not found.")
+        contract = attribute.get("contract")
+        expected = _get_expected_param_type_from_contract(contract)
+        if record["type"] != expected:
+            raise ImportRecordError(
+                f"Parameter type '{record['type']}' is not allowed for attribute with contract "
+                f"'{contract}'. Expected parameter type: '{expected}'."
+            )
+        param_id = record["param_id"]
+        if data.find_param(pid, aid, param_id) is not None:
+            raise ImportRecordError(
+                f"Parameter {param_id} already exists in attribute {aid} of product {pid}."
+            )
+        attribute.setdefault("params", []).append(record)
+        data.index_param(pid, aid, record)
+        counters = data.DB["next_param_id"]
+        counters[(pid, aid)] = max(counters.get((pid, aid), 0), param_id + 1)
@@ -0,0 +1,88 @@
+# compaction.py
+"""
+削除済み (tombstone) の attribute / param をストアのリストから取り除くバックグラウンド処理。
+
+attribute / param の削除 (controllers/data.py の tombstone_attribute など) は、
+リストを作り直さずに dict に削除済みの印を付けて索引から外すだけなので、
+削除1件の処理時間はリストの長さによりません。読み出し (data.live_product) は
+印の付いたものを飛ばします。
+
+各リクエストの後に tombstone の割合 (data.tombstone_ratio) を調べ、
+TOMBSTONE_COMPACTION_RATIO を超えていれば Compactor のスレッドを起こします。
+スレッドは LOCK を取って data.compact() でリストを作り直します。
+リクエストを処理するスレッドは起こすだけで、作り直しを待ちません。
+Compactor と割合はアプリケーションごと (app.extensions["compactor"]) に持ちます。
+"""
+import threading
+
+from flask import request
+
+from openapi_server.controllers import data
+
+
+class Compactor:
+    """data.compact() を呼ぶデーモンスレッド (最初に起こされたときに起動する)。"""
+
+    def __init__(self, ratio):
+        self.ratio = ratio
+        self.runs = 0
+        self.done = threading.Event()  # compaction を1回終えるたびにセットされる (テスト用)
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._stopped = False
+        self._start_lock = threading.Lock()
+
+    def after_request(self, response):
+        # tombstone が増えるのは DELETE だけ。割合の計算は定数時間
+        # (件数は索引の大きさから求める) なので、LOCK はすぐに返せる
+        if request.method == "DELETE":
+            with data.LOCK:
+                over = data.tombstone_ratio() > self.ratio
+            if over:
+                self.notify()
+        return response
+
+    def notify(self):
+        """compaction を依頼します。"""
+        with self._start_lock:
+            if self._stopped:
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="tombstone-compactor", daemon=True
+                )
+                self._thread.start()
+        self.done.clear()
+        self._wakeup.set()
+
+    def stop(self, timeout=None):
+        """スレッドを止めます (起動していなければ何もしない)。"""
+        with self._start_lock:
+            self._stopped = True
+            thread = self._thread
+        self._wakeup.set()
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stopped:
+                return
+            with data.LOCK:
+                # 起こされてから LOCK を取るまでに、ストアが読み直されているかもしれない
+                if data.tombstone_ratio() > self.ratio:
+                    data.compact()
+                    self.runs += 1
+            self.done.set()
+
+
+def init_app(app):
+    """TOMBSTONE_COMPACTION_RATIO が 0 以上なら、リクエストの後に割合を調べる Compactor を登録します。"""
+    ratio = app.config.get("TOMBSTONE_COMPACTION_RATIO", 0.25)
+    if ratio < 0:
+        return
+    compactor = Compactor(ratio)
+    app.after_request(compactor.after_request)
+    app.extensions["compactor"] = compactor
@@ -0,0 +1,56 @@
+# config.py
+"""
+サーバーの設定値。create_app() で Flask の app.config に読み込まれます。
+各値は同名の環境変数 (OPENAPI_ 接頭辞付き) で上書きできます。
+"""
+import os
+
+DEFAULTS = {
+    # プロファイリング (profiling.py)
+    # ヘッダー X-Profile にこのトークンを付けたリクエストだけをプロファイルする (空なら無効)
+    "PROFILE_TOKEN": "",
+    # True なら全リクエストをプロファイルする (開発用)
+    "PROFILE_ALL_REQUESTS": False,
+    # 指定するとプロファイル結果 (.prof) をこのディレクトリに保存する
+    "PROFILE_DIR": "",
+    # 遅いリクエストのログ (slow_log.py)
+    # この時間 (ミリ秒) 以上かかったリクエストを記録する (負の値なら無効)
+    "SLOW_REQUEST_THRESHOLD_MS": 500.0,
+    # 出力先のファイル (空なら標準エラー出力)
+    "SLOW_REQUEST_LOG": "",
+    # アクセスログ (access_log.py)
+    # 出力先のファイル (空なら無効)
+    "ACCESS_LOG": "",
+    # 出力に使うハンドラークラス (ドット区切りのクラス名)
+    "ACCESS_LOG_HANDLER": "openapi_server.log_handlers.AppendFileHandler",
+    # ログファイルのパーミッション (環境変数では 0o640 のように指定する)
+    "ACCESS_LOG_PERMISSIONS": 0o600,
+    # GET の成功レスポンスを記録する割合 (0.0〜1.0)
+    "ACCESS_LOG_READ_SAMPLE_RATE": 1.0,
+    # ストア (controllers/data.py)
+    # True なら同じ product 内で attribute の code の重複を許さない (409 を返す)
+    "UNIQUE_ATTRIBUTE_CODES": False,
+    # 削除済み (tombstone) の attribute/param の割合がこれを超えたら、
+    # バックグラウンドでリストから取り除く (compaction.py、負の値なら無効)
+    "TOMBSTONE_COMPACTION_RATIO": 0.25,
+}
+
+
+def _convert(default, value):
+    if isinstance(default, bool):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    if isinstance(default, int):
+        return int(value, 0)
+    if isinstance(default, float):
+        return float(value)
+    return value
+
+
+def from_env(environ=None):
+    """DEFAULTS を環境変数で上書きした設定の dict を返します。"""
+    environ = os.environ if environ is None else environ
+    settings = {}
+    for key, default in DEFAULTS.items():
+        value = environ.get("OPENAPI_" + key)
+        settings[key] = default if value is None else _convert(default, value)
+    return settings
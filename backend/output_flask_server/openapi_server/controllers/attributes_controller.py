@@ -5,13 +5,28 @@ from typing import Union
 
 from openapi_server.models.attribute import Attribute  # noqa: E501
 from openapi_server.models.attribute_input import AttributeInput  # noqa: E501
+from openapi_server.models.attribute_match import AttributeMatch  # noqa: E501
+from openapi_server.models.attribute_query_result import AttributeQueryResult  # noqa: E501
 from openapi_server.models.error import Error  # noqa: E501
 from openapi_server import util
 
-from flask import request, jsonify
+from flask import current_app, request, jsonify
 from . import data
 
 
+def _code_conflict(product_id, code, attribute_id=None):
+    """UNIQUE_ATTRIBUTE_CODESが有効で、codeが他のattributeに使われていれば409のレスポンスを返します。"""
+    if current_app.config.get("UNIQUE_ATTRIBUTE_CODES") and data.attribute_code_taken(
+        product_id, code, attribute_id
+    ):
+        return (
+            jsonify({"message": f"Attribute code '{code}' already exists in product {product_id}"}),
+            409,
+        )
+    return None
+
+
+@data.locked
 def add_attribute(product_id, body):  # noqa: E501
     """Add a new attribute to a specific product (without params)"""
     if product_id not in data.DB["products"]:
@@ -20,6 +35,9 @@ def add_attribute(product_id, body):  # noqa: E501
     # bodyはconnexionによってバリデーションされ、辞書として渡される想定
     # AttributeInputスキーマにはparamsが含まれない
     attribute_input = body
+    conflict = _code_conflict(product_id, attribute_input.get("code"))
+    if conflict:
+        return conflict
 
     new_attr_id = data.get_next_attribute_id(product_id)
     new_attribute_data = {
@@ -37,49 +55,49 @@ def add_attribute(product_id, body):  # noqa: E501
     }
 
     data.DB["products"][product_id]["attributes"].append(new_attribute_data)
+    data.index_attribute_code(product_id, new_attribute_data["code"], new_attr_id)
+    data.index_attribute(product_id, new_attribute_data)
     return jsonify(Attribute.from_dict(new_attribute_data)), 201
 
 
+@data.locked
 def delete_attribute(product_id, attribute_id):  # noqa: E501
     """Delete a specific attribute from a product"""
     if product_id not in data.DB["products"]:
         return jsonify({"message": "Product not found"}), 404
 
-    product_attributes = data.DB["products"][product_id].get("attributes", [])
-    original_len = len(product_attributes)
-
-    data.DB["products"][product_id]["attributes"] = [
-        attr for attr in product_attributes if attr.get("attribute_id") != attribute_id
-    ]
-
-    if len(data.DB["products"][product_id]["attributes"]) == original_len:
+    deleted_attr = data.find_attribute(product_id, attribute_id)
+    if deleted_attr is None:
         return jsonify({"message": "Attribute not found"}), 404
 
+    # リストは作り直さず削除済みの印を付ける (リストからはcompactionで取り除かれる)
+    data.tombstone_attribute(product_id, deleted_attr)
     return "", 204
 
 
+@data.locked
 def update_attribute(product_id, attribute_id, body):  # noqa: E501
     """Update an existing attribute (without managing params list directly)"""
     if product_id not in data.DB["products"]:
         return jsonify({"message": "Product not found"}), 404
 
-    product_attributes = data.DB["products"][product_id].get("attributes", [])
-    attr_to_update = None
-    attr_idx = -1
-    for i, attr in enumerate(product_attributes):
-        if attr.get("attribute_id") == attribute_id:
-            attr_to_update = attr
-            attr_idx = i
-            break
-
-    if not attr_to_update:
+    attr_to_update = data.find_attribute(product_id, attribute_id)
+    if attr_to_update is None:
         return jsonify({"message": "Attribute not found"}), 404
 
     # AttributeInputスキーマにはparamsが含まれない
     update_data = body
+    old_code = attr_to_update["code"]
+    new_code = update_data.get("code", old_code)
+    if new_code != old_code:
+        conflict = _code_conflict(product_id, new_code, attribute_id)
+        if conflict:
+            return conflict
+        data.unindex_attribute_code(product_id, old_code, attribute_id)
+        data.index_attribute_code(product_id, new_code, attribute_id)
 
     # params以外のフィールドを更新
-    attr_to_update["code"] = update_data.get("code", attr_to_update["code"])
+    attr_to_update["code"] = new_code
     attr_to_update["data_type"] = update_data.get(
         "data_type", attr_to_update["data_type"]
     )
@@ -96,5 +114,49 @@ def update_attribute(product_id, attribute_id, body):  # noqa: E501
     )
     # paramsリストはこのエンドポイントでは変更しない
 
-    data.DB["products"][product_id]["attributes"][attr_idx] = attr_to_update
-    return jsonify(Attribute.from_dict(attr_to_update)), 200
+    data.index_attribute(product_id, attr_to_update)
+    return jsonify(Attribute.from_dict(data.live_attribute(product_id, attr_to_update))), 200
+
+
+def get_attribute_by_code(product_id, code):  # noqa: E501
+    """Get an attribute of a specific product by its code"""
+    if product_id not in data.DB["products"]:
+        return jsonify({"message": "Product not found"}), 404
+
+    attribute_id = data.find_attribute_id_by_code(product_id, code)
+    if attribute_id is None:
+        return jsonify({"message": "Attribute not found"}), 404
+
+    attr_data = data.live_attribute(product_id, data.find_attribute(product_id, attribute_id))
+    return jsonify(Attribute.from_dict(attr_data)), 200
+
+
+def query_attributes(public=None, masking=None, online=None, contract=None, data_type=None, unit=None, offset=None, limit=None):  # noqa: E501
+    """Find attributes across all products by their flags and low-cardinality fields"""
+    filters = {
+        field: value
+        for field, value in (
+            ("public", public),
+            ("masking", masking),
+            ("online", online),
+            ("contract", contract),
+            ("data_type", data_type),
+            ("unit", unit),
+        )
+        if value is not None
+    }
+    offset = offset or 0
+    limit = limit or 50
+
+    # 書き込みと同時に索引を読まないよう、ページを作り終えるまでロックを取る
+    with data.LOCK:
+        total, page = data.DB["attribute_bitmaps"].query(filters, offset, limit)
+        items = [
+            AttributeMatch(
+                prod_id=product_id,
+                attribute=Attribute.from_dict(data.live_attribute(product_id, attr_data)),
+            )
+            for (product_id, _), attr_data in page
+        ]
+    result = AttributeQueryResult(total=total, offset=offset, limit=limit, items=items)
+    return jsonify(result), 200
@@ -0,0 +1,57 @@
+import connexion
+from typing import Dict
+from typing import Tuple
+from typing import Union
+
+from openapi_server.models.error import Error  # noqa: E501
+from openapi_server.models.import_result import ImportResult  # noqa: E501
+from openapi_server import bulk
+from openapi_server import export
+from openapi_server import util
+
+from flask import Response, current_app, json, request, jsonify, stream_with_context
+from . import data
+
+NDJSON = "application/x-ndjson"
+
+
+def import_catalog(batch_size=None, max_errors=None, replace=None):  # noqa: E501
+    """Import products, attributes and params from NDJSON"""
+    stream = bulk.take_import_stream()
+    if replace:
+        with data.LOCK:
+            data.load_products([])
+    importer = bulk.CatalogImporter(
+        batch_size or bulk.DEFAULT_BATCH_SIZE,
+        unique_codes=current_app.config.get("UNIQUE_ATTRIBUTE_CODES", False),
+    )
+    events = importer.run(bulk.iter_lines(stream))
+
+    # Accept: application/x-ndjson なら progress/error イベントを逐次返す
+    if request.accept_mimetypes.best_match(["application/json", NDJSON]) == NDJSON:
+        def generate():
+            for event in events:
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+
+        return Response(stream_with_context(generate()), 200, mimetype=NDJSON)
+
+    max_errors = 100 if max_errors is None else max_errors
+    errors = []
+    for event in events:
+        if event["event"] == "error" and len(errors) < max_errors:
+            errors.append({"line": event["line"], "message": event["message"]})
+    result = {key: value for key, value in event.items() if key != "event"}
+    result["errors"] = errors
+    return jsonify(result), 200
+
+
+def export_catalog(format_=None):  # noqa: E501
+    """Export products, attributes and params as NDJSON or CSV"""
+    fmt = format_ or "ndjson"
+    snapshot = export.snapshot(fmt)
+    return Response(
+        export.iter_chunks(snapshot),
+        200,
+        mimetype=export.FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="catalog.{fmt}"'},
+    )
@@ -1,5 +1,16 @@
 # data.py
+import contextlib
 import copy  # deepcopyを使用するためにインポート
+import functools
+import threading
+
+from openapi_server.autocomplete import FIELDS as COMPLETION_FIELDS
+from openapi_server.autocomplete import PrefixIndex
+from openapi_server.bitmaps import BitmapIndex
+from openapi_server.ranges import FIELDS as RANGE_FIELDS
+from openapi_server.ranges import RangeIndex
+from openapi_server.search import FIELDS as SEARCH_FIELDS
+from openapi_server.search import NgramIndex
 
 # 初期データのスナップショット (この内容は変更されないようにする)
 # このデータは、以前のやり取りで定義した初期データ構造に基づきます
@@ -123,6 +134,25 @@ _INITIAL_PRODUCTS_SNAPSHOT = [
 # データストア (インメモリ)
 DB = {}  # このDBはinitialize_data()によって初期化/リセットされます
 
+# 書き込みとスナップショット (エクスポート) の排他用ロック
+LOCK = threading.RLock()
+
+# 削除済み (tombstone) の印。attribute/paramのdictにこのキーがあれば削除済みで、
+# 読み出し (live_product/live_attribute) では取り除かれる。
+# リストからの実際の削除はcompact()で行う (compaction.pyがバックグラウンドで呼ぶ)
+DELETED = "_deleted"
+
+
+def locked(function):
+    """function を LOCK を取得した状態で実行するデコレーター (ストアを変更する処理に付ける)。"""
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with LOCK:
+            return function(*args, **kwargs)
+
+    return wrapper
+
 
 def initialize_data():
     """
@@ -130,6 +160,18 @@ def initialize_data():
     DBをクリアし、_INITIAL_PRODUCTS_SNAPSHOTからデータを再ロードします。
     IDカウンターも初期データに基づいてリセットします。
     """
+    # スナップショットが変更されないようにディープコピーを使用
+    load_products(copy.deepcopy(_INITIAL_PRODUCTS_SNAPSHOT))
+
+
+@locked
+def load_products(products):
+    """
+    DBをクリアし、与えられたproductのリストをロードします。
+    productのdictはコピーせずにそのままDBに格納されます。
+    IDカウンターは各product/attribute/paramの最大IDから再計算します。
+    (バックグラウンドのcompactionと重ならないようLOCKを取ります)
+    """
     global DB  # グローバル変数DBを変更することを明示
     DB.clear()  # まず既存のデータをすべてクリア
 
@@ -139,34 +181,60 @@ def initialize_data():
         {}
     )  # Key: prod_id, Value: next attribute_id for that product
     DB["next_param_id"] = {}  # Key: (prod_id, attribute_id), Value: next param_id
+    # Key: prod_id, Value: {attributeのcode: そのcodeを持つattribute_idのリスト (追加順)}
+    DB["attribute_codes"] = {}
+    # attribute/paramのcodeとdisp_nameの全文検索用の索引 (search.py)
+    DB["search_index"] = NgramIndex()
+    # productのprefix/prd_typeとattributeのcodeの入力補完用の索引 (autocomplete.py)
+    DB["completions"] = {field: PrefixIndex() for field in COMPLETION_FIELDS}
+    # attributeのフラグなどでの絞り込み用のビットマップ索引 (bitmaps.py)
+    DB["attribute_bitmaps"] = BitmapIndex()
+    # type2のparamのmin/incrementの範囲検索用の索引 (ranges.py)
+    DB["param_ranges"] = {field: RangeIndex() for field in RANGE_FIELDS}
+    # IDの索引 (削除済みのものは含まない)
+    DB["attribute_ids"] = {}  # Key: (prod_id, attribute_id), Value: attributeのdict
+    DB["param_ids"] = {}  # Key: (prod_id, attribute_id, param_id), Value: paramのdict
+    # Key: prod_id, Value: そのproduct配下のtombstoneの数 (tombstoneのないproductは含まない)
+    DB["tombstones"] = {}
+    DB["tombstone_count"] = 0
+
+    with bulk_indexing():
+        for product_data in products:
+            _load_product(product_data)
 
-    for product_template in _INITIAL_PRODUCTS_SNAPSHOT:
-        # スナップショットが変更されないようにディープコピーを使用
-        product_data = copy.deepcopy(product_template)
 
-        pid = product_data["prod_id"]
-        DB["products"][pid] = product_data
+def _load_product(product_data):
+    """productを1つDBに格納し、索引とIDカウンターに登録します (load_products用)。"""
+    pid = product_data["prod_id"]
+    DB["products"][pid] = product_data
+    index_product(product_data)
+    # 削除済みのattribute/paramが残っていれば、ここで取り除く
+    _drop_deleted(product_data)
 
-        # 次のProduct IDを更新 (初期データ内の最大ID + 1)
-        DB["next_product_id"] = max(DB.get("next_product_id", 0), pid + 1)
+    # 次のProduct IDを更新 (初期データ内の最大ID + 1)
+    DB["next_product_id"] = max(DB.get("next_product_id", 0), pid + 1)
 
-        current_max_attr_id_for_product = -1
-        if "attributes" in product_data and product_data["attributes"]:
-            for attr_data in product_data["attributes"]:
-                aid = attr_data["attribute_id"]
-                current_max_attr_id_for_product = max(
-                    current_max_attr_id_for_product, aid
-                )
+    current_max_attr_id_for_product = -1
+    if "attributes" in product_data and product_data["attributes"]:
+        for attr_data in product_data["attributes"]:
+            aid = attr_data["attribute_id"]
+            current_max_attr_id_for_product = max(
+                current_max_attr_id_for_product, aid
+            )
 
-                current_max_param_id_for_attr = -1
-                if "params" in attr_data and attr_data["params"]:
-                    for param_data in attr_data["params"]:
-                        param_id_val = param_data["param_id"]
-                        current_max_param_id_for_attr = max(
-                            current_max_param_id_for_attr, param_id_val
-                        )
-                DB["next_param_id"][(pid, aid)] = current_max_param_id_for_attr + 1
-        DB["next_attribute_id"][pid] = current_max_attr_id_for_product + 1
+            current_max_param_id_for_attr = -1
+            if "params" in attr_data and attr_data["params"]:
+                for param_data in attr_data["params"]:
+                    param_id_val = param_data["param_id"]
+                    current_max_param_id_for_attr = max(
+                        current_max_param_id_for_attr, param_id_val
+                    )
+                    index_param(pid, aid, param_data)
+            DB["next_param_id"][(pid, aid)] = current_max_param_id_for_attr + 1
+            index_attribute_code(pid, attr_data["code"], aid)
+            index_attribute(pid, attr_data)
+    DB["next_attribute_id"][pid] = current_max_attr_id_for_product + 1
+    DB["attribute_codes"].setdefault(pid, {})
 
 
 # ID採番ヘルパー関数 (DBのカウンターを使用)
@@ -174,6 +242,7 @@ def get_next_product_id():
     pid = DB["next_product_id"]
     DB["next_product_id"] += 1
     DB["next_attribute_id"][pid] = 0  # 新規ProductのAttribute IDカウンターを初期化
+    DB["attribute_codes"][pid] = {}
     return pid
 
 
@@ -193,10 +262,7 @@ def get_next_attribute_id(product_id):
 def get_next_param_id(product_id, attribute_id):
     key = (product_id, attribute_id)
     # 念のため親リソースの存在確認
-    if product_id not in DB["products"] or not any(
-        attr.get("attribute_id") == attribute_id
-        for attr in DB["products"][product_id].get("attributes", [])
-    ):
+    if find_attribute(product_id, attribute_id) is None:
         raise ValueError(
             f"Attribute {attribute_id} in product {product_id} not found for param ID generation."
         )
@@ -206,5 +272,263 @@ def get_next_param_id(product_id, attribute_id):
     return param_id_val
 
 
+def remove_product(product_id):
+    """
+    productをDBから取り除き、そのattribute/paramのIDカウンターも削除します。
+    削除するカウンターのキーはproductのattributeから作るので、
+    処理時間はそのproduct配下の大きさに比例します (カウンター全体は走査しません)。
+    取り除いたproductのdictを返します (存在しなければNone)。
+    """
+    product_data = DB["products"].pop(product_id, None)
+    if product_data is None:
+        return None
+    unindex_product(product_data)
+    DB["tombstone_count"] -= DB["tombstones"].pop(product_id, 0)
+    for attr_data in product_data.get("attributes", []):
+        if DELETED in attr_data:
+            continue
+        DB["next_param_id"].pop((product_id, attr_data["attribute_id"]), None)
+        unindex_attribute_code(product_id, attr_data["code"], attr_data["attribute_id"])
+        unindex_attribute(product_id, attr_data)
+    DB["next_attribute_id"].pop(product_id, None)
+    DB["attribute_codes"].pop(product_id, None)
+    return product_data
+
+
+@contextlib.contextmanager
+def bulk_indexing():
+    """この中での索引への登録をまとめて行います (ストアの読み込みやインポート用)。
+
+    ソート済みの配列の索引は追加分を最後に1回だけソートして加え、
+    全文検索の索引は転置リストを最後にまとめて作ります。
+    呼び出し側でLOCKを取ること (抜けるまで索引は検索に使えない)。
+    """
+    with contextlib.ExitStack() as stack:
+        for index in (
+            DB["search_index"],
+            *DB["completions"].values(),
+            *DB["param_ranges"].values(),
+        ):
+            stack.enter_context(index.bulk())
+        yield
+
+
+def index_structures():
+    """ストアの索引を (名前, 索引) の順に返します (memory.pyの見積もり用)。
+
+    索引を追加したら、ここにも加えること。
+    """
+    yield "attribute_ids", DB["attribute_ids"]
+    yield "param_ids", DB["param_ids"]
+    yield "attribute_codes", DB["attribute_codes"]
+    yield "search_index", DB["search_index"]
+    for field, index in DB["completions"].items():
+        yield "completions." + field, index
+    yield "attribute_bitmaps", DB["attribute_bitmaps"]
+    for field, index in DB["param_ranges"].items():
+        yield "param_ranges." + field, index
+
+
+# productのprefix/prd_typeの入力補完の索引 (DB["completions"])
+# productを追加・削除する処理は必ずこれらを呼ぶこと
+def index_product(product_data):
+    for field in ("prefix", "prd_type"):
+        DB["completions"][field].add(product_data.get(field))
+
+
+def unindex_product(product_data):
+    for field in ("prefix", "prd_type"):
+        DB["completions"][field].remove(product_data.get(field))
+
+
+# attributeのcodeの索引 (DB["attribute_codes"] と DB["completions"]["code"])
+# attributeを追加・削除したり、codeを変更したりする処理は必ずこれらを呼ぶこと
+def index_attribute_code(product_id, code, attribute_id):
+    DB["attribute_codes"].setdefault(product_id, {}).setdefault(code, []).append(
+        attribute_id
+    )
+    DB["completions"]["code"].add(code)
+
+
+def unindex_attribute_code(product_id, code, attribute_id):
+    codes = DB["attribute_codes"].get(product_id, {})
+    attribute_ids = codes.get(code)
+    if attribute_ids and attribute_id in attribute_ids:
+        attribute_ids.remove(attribute_id)
+        if not attribute_ids:
+            del codes[code]
+        DB["completions"]["code"].remove(code)
+
+
+def find_attribute_id_by_code(product_id, code):
+    """codeを持つattributeのIDを返します (複数あれば最初に追加されたもの、なければNone)。"""
+    attribute_ids = DB["attribute_codes"].get(product_id, {}).get(code)
+    return attribute_ids[0] if attribute_ids else None
+
+
+def attribute_code_taken(product_id, code, attribute_id=None):
+    """attribute_id以外のattributeがcodeを使っているかを返します。"""
+    attribute_ids = DB["attribute_codes"].get(product_id, {}).get(code)
+    return bool(attribute_ids) and attribute_ids != [attribute_id]
+
+
+
+# 検索用の索引 (DB["search_index"], DB["attribute_bitmaps"], DB["param_ranges"])
+# attribute/paramを追加・変更・削除する処理は必ずこれらを呼ぶこと
+# (変更では、変更後のdictでindex_attribute/index_paramを呼べば登録し直される)
+def index_attribute(product_id, attr_data):
+    """attribute自身のフィールドを索引に (再) 登録します (paramsは含まない)。"""
+    aid = attr_data["attribute_id"]
+    DB["attribute_ids"][(product_id, aid)] = attr_data
+    for field in SEARCH_FIELDS:
+        DB["search_index"].add((product_id, aid, None, field), attr_data.get(field))
+    DB["attribute_bitmaps"].add((product_id, aid), attr_data)
+
+
+def unindex_attribute(product_id, attr_data):
+    """attributeとそのparamsをすべて索引から取り除きます。"""
+    aid = attr_data["attribute_id"]
+    DB["attribute_ids"].pop((product_id, aid), None)
+    for field in SEARCH_FIELDS:
+        DB["search_index"].remove((product_id, aid, None, field))
+    DB["attribute_bitmaps"].remove((product_id, aid))
+    for param_data in attr_data.get("params", []):
+        unindex_param(product_id, aid, param_data["param_id"])
+
+
+def index_param(product_id, attribute_id, param_data):
+    param_id = param_data["param_id"]
+    DB["param_ids"][(product_id, attribute_id, param_id)] = param_data
+    for field in SEARCH_FIELDS:
+        DB["search_index"].add(
+            (product_id, attribute_id, param_id, field), param_data.get(field)
+        )
+    # typeがtype2以外に変わったparamは範囲検索の索引から外れる
+    is_type2 = param_data.get("type") == "type2"
+    for field in RANGE_FIELDS:
+        DB["param_ranges"][field].add(
+            (product_id, attribute_id, param_id),
+            param_data.get(field) if is_type2 else None,
+            param_data,
+        )
+
+
+def unindex_param(product_id, attribute_id, param_id):
+    DB["param_ids"].pop((product_id, attribute_id, param_id), None)
+    for field in SEARCH_FIELDS:
+        DB["search_index"].remove((product_id, attribute_id, param_id, field))
+    for field in RANGE_FIELDS:
+        DB["param_ranges"][field].remove((product_id, attribute_id, param_id))
+
+
+
+def find_attribute(product_id, attribute_id):
+    """IDの索引からattributeのdictを返します (削除済み、または存在しなければNone)。"""
+    return DB["attribute_ids"].get((product_id, attribute_id))
+
+
+def find_param(product_id, attribute_id, param_id):
+    """IDの索引からparamのdictを返します (削除済み、または存在しなければNone)。"""
+    return DB["param_ids"].get((product_id, attribute_id, param_id))
+
+
+# 削除 (tombstone)
+# attribute/paramの削除はリストを作り直さず、dictに印を付けて索引から外すだけにする。
+# 印の付いたdictはcompact()がまとめてリストから取り除く
+def tombstone_attribute(product_id, attr_data):
+    """attributeとそのparamsを削除済みにします (処理時間はparamsの数に比例)。"""
+    aid = attr_data["attribute_id"]
+    live_params = sum(1 for p in attr_data.get("params", []) if DELETED not in p)
+    unindex_attribute_code(product_id, attr_data["code"], aid)
+    unindex_attribute(product_id, attr_data)
+    # 削除したattributeのParam IDカウンターも取り除く (attribute IDは再利用しない)
+    DB["next_param_id"].pop((product_id, aid), None)
+    attr_data[DELETED] = True
+    _add_tombstones(product_id, 1 + live_params)
+
+
+def tombstone_param(product_id, attribute_id, param_data):
+    """paramを削除済みにします。"""
+    unindex_param(product_id, attribute_id, param_data["param_id"])
+    param_data[DELETED] = True
+    _add_tombstones(product_id, 1)
+
+
+def tombstone_ratio():
+    """tombstoneの数 / (tombstoneの数 + 削除されていないattributeとparamの数)。"""
+    tombstones = DB["tombstone_count"]
+    total = tombstones + len(DB["attribute_ids"]) + len(DB["param_ids"])
+    return tombstones / total if total else 0.0
+
+
+def _add_tombstones(product_id, count):
+    DB["tombstones"][product_id] = DB["tombstones"].get(product_id, 0) + count
+    DB["tombstone_count"] += count
+
+
+def _live(items):
+    return [item for item in items if DELETED not in item]
+
+
+def _drop_deleted(product_data):
+    """product配下の削除済みのattribute/paramを取り除いたリストに置き換えます。
+
+    読み出し中のリストを書き換えないよう、リストはその場で変更せず新しいものにします。
+    """
+    attributes = product_data.get("attributes", [])
+    if any(DELETED in attr_data for attr_data in attributes):
+        attributes = product_data["attributes"] = _live(attributes)
+    for attr_data in attributes:
+        params = attr_data.get("params", [])
+        if any(DELETED in param_data for param_data in params):
+            attr_data["params"] = _live(params)
+
+
+def _live_attribute(attr_data):
+    params = attr_data.get("params", [])
+    if any(DELETED in param_data for param_data in params):
+        return dict(attr_data, params=_live(params))
+    return attr_data
+
+
+def live_attribute(product_id, attr_data):
+    """削除済みのparamを除いたattributeを返します (読み出し用)。
+
+    tombstoneのないproductのattributeはそのまま返し、削除済みのparamを持つものは浅いコピーを返します。
+    """
+    if product_id not in DB["tombstones"]:
+        return attr_data
+    return _live_attribute(attr_data)
+
+
+def live_product(product_data):
+    """削除済みのattribute/paramを除いたproductを返します (読み出し用)。
+
+    tombstoneのないproductはそのまま返し、あるものは浅いコピーを返します。
+    """
+    if product_data["prod_id"] not in DB["tombstones"]:
+        return product_data
+    attributes = [
+        _live_attribute(attr_data)
+        for attr_data in product_data.get("attributes", [])
+        if DELETED not in attr_data
+    ]
+    return dict(product_data, attributes=attributes)
+
+
+def compact():
+    """tombstoneのあるproductのリストから削除済みのものを取り除きます。
+
+    処理時間はtombstoneのあるproduct配下の大きさの合計に比例します。
+    呼び出し側でLOCKを取ること。取り除いたtombstoneの数を返します。
+    """
+    removed = DB["tombstone_count"]
+    for product_id in DB["tombstones"]:
+        _drop_deleted(DB["products"][product_id])
+    DB["tombstones"].clear()
+    DB["tombstone_count"] = 0
+    return removed
+
+
 # モジュールロード時に一度初期データをロードする
 initialize_data()
@@ -6,6 +6,9 @@ from typing import Union
 from openapi_server.models.error import Error  # noqa: E501
 from openapi_server.models.param_item import ParamItem  # noqa: E501
 from openapi_server.models.param_item_input import ParamItemInput  # noqa: E501
+from openapi_server.models.param_type2_item import ParamType2Item  # noqa: E501
+from openapi_server.models.type2_param_match import Type2ParamMatch  # noqa: E501
+from openapi_server.models.type2_param_query_result import Type2ParamQueryResult  # noqa: E501
 from openapi_server import util
 
 from flask import request, jsonify
@@ -24,19 +27,14 @@ def _get_expected_param_type_from_contract(attribute_contract):
         return "type3"
 
 
+@data.locked
 def add_param(product_id, attribute_id, body):  # noqa: E501
     """Add a new parameter to a specific attribute"""
     if product_id not in data.DB["products"]:
         return jsonify({"message": "Product not found"}), 404
 
-    product_attributes = data.DB["products"][product_id].get("attributes", [])
-    target_attribute = None
-    for attr in product_attributes:
-        if attr.get("attribute_id") == attribute_id:
-            target_attribute = attr
-            break
-
-    if not target_attribute:
+    target_attribute = data.find_attribute(product_id, attribute_id)
+    if target_attribute is None:
         return jsonify({"message": "Attribute not found"}), 404
 
     param_input = body  # connexion がバリデーション済みの辞書を渡す想定
@@ -77,60 +75,42 @@ def add_param(product_id, attribute_id, body):  # noqa: E501
     if "params" not in target_attribute:
         target_attribute["params"] = []
     target_attribute["params"].append(new_param_data)
+    data.index_param(product_id, attribute_id, new_param_data)
 
     return jsonify(ParamItem.from_dict(new_param_data)), 201
 
 
+@data.locked
 def delete_param(product_id, attribute_id, param_id):  # noqa: E501
     """Delete a specific parameter"""
     if product_id not in data.DB["products"]:
         return jsonify({"message": "Product not found"}), 404
 
-    product_attributes = data.DB["products"][product_id].get("attributes", [])
-    target_attribute = None
-    for attr in product_attributes:
-        if attr.get("attribute_id") == attribute_id:
-            target_attribute = attr
-            break
-    if not target_attribute:
+    target_attribute = data.find_attribute(product_id, attribute_id)
+    if target_attribute is None:
         return jsonify({"message": "Attribute not found"}), 404
 
-    original_len = len(target_attribute.get("params", []))
-    target_attribute["params"] = [
-        p_data
-        for p_data in target_attribute.get("params", [])
-        if p_data.get("param_id") != param_id
-    ]
-
-    if len(target_attribute["params"]) == original_len:
+    target_param = data.find_param(product_id, attribute_id, param_id)
+    if target_param is None:
         return jsonify({"message": "Parameter not found"}), 404
 
+    # リストは作り直さず削除済みの印を付ける (リストからはcompactionで取り除かれる)
+    data.tombstone_param(product_id, attribute_id, target_param)
     return "", 204
 
 
+@data.locked
 def update_param(product_id, attribute_id, param_id, body):  # noqa: E501
     """Update an existing parameter"""
     if product_id not in data.DB["products"]:
         return jsonify({"message": "Product not found"}), 404
 
-    product_attributes = data.DB["products"][product_id].get("attributes", [])
-    target_attribute = None
-    for attr in product_attributes:
-        if attr.get("attribute_id") == attribute_id:
-            target_attribute = attr
-            break
-    if not target_attribute:
+    target_attribute = data.find_attribute(product_id, attribute_id)
+    if target_attribute is None:
         return jsonify({"message": "Attribute not found"}), 404
 
-    target_param = None
-    param_idx = -1
-    for i, p_data in enumerate(target_attribute.get("params", [])):
-        if p_data.get("param_id") == param_id:
-            target_param = p_data
-            param_idx = i
-            break
-
-    if not target_param:
+    target_param = data.find_param(product_id, attribute_id, param_id)
+    if target_param is None:
         return jsonify({"message": "Parameter not found"}), 404
 
     update_data = body  # connexion がバリデーション済みの辞書を渡す想定
@@ -223,5 +203,27 @@ def update_param(product_id, attribute_id, param_id, body):  # noqa: E501
             ),
         )
 
-    target_attribute["params"][param_idx] = target_param
+    data.index_param(product_id, attribute_id, target_param)
     return jsonify(ParamItem.from_dict(target_param)), 200
+
+
+def query_type2_params(field=None, low=None, high=None, order=None, offset=None, limit=None):  # noqa: E501
+    """Find type2 params across all products by a range of min or increment"""
+    offset = offset or 0
+    limit = limit or 50
+
+    # 書き込みと同時に索引を読まないよう、ページを作り終えるまでロックを取る
+    with data.LOCK:
+        total, page = data.DB["param_ranges"][field or "min"].query(
+            low, high, descending=order == "desc", offset=offset, limit=limit
+        )
+        items = [
+            Type2ParamMatch(
+                prod_id=product_id,
+                attribute_id=attribute_id,
+                param=ParamType2Item.from_dict(param_data),
+            )
+            for (product_id, attribute_id, _), _, param_data in page
+        ]
+    result = Type2ParamQueryResult(total=total, offset=offset, limit=limit, items=items)
+    return jsonify(result), 200
@@ -5,6 +5,7 @@ from typing import Union
 
 from openapi_server.models.error import Error  # noqa: E501
 from openapi_server.models.product import Product  # noqa: E501
+from openapi_server.models.product_input import ProductInput  # noqa: E501
 from openapi_server import util
 
 from flask import request, jsonify
@@ -12,11 +13,45 @@ from flask import request, jsonify
 from . import data
 
 
+@data.locked
+def add_product(body):  # noqa: E501
+    """Create a new product (without attributes)"""
+    # bodyはconnexionによってバリデーションされ、辞書として渡される想定
+    # ProductInputスキーマにはprod_idとattributesが含まれない
+    product_input = body
+
+    new_prod_id = data.get_next_product_id()
+    new_product_data = {
+        "prod_id": new_prod_id,
+        "prefix": product_input.get("prefix"),
+        "prd_type": product_input.get("prd_type"),
+        "cfg_type": product_input.get("cfg_type"),
+        "sort_order": product_input.get("sort_order", 0),
+        "attributes": [],  # 新規作成時はattributesは空
+    }
+
+    data.DB["products"][new_prod_id] = new_product_data
+    data.index_product(new_product_data)
+    return jsonify(Product.from_dict(new_product_data)), 201
+
+
+@data.locked
+def delete_product(product_id):  # noqa: E501
+    """Delete a product together with its attributes and params"""
+    if data.remove_product(product_id) is None:
+        return jsonify({"message": "Product not found"}), 404
+
+    return "", 204
+
+
 def get_product_by_id(product_id):  # noqa: E501
     """Get a specific product by its ID"""
-    product_data = data.DB["products"].get(product_id)
-    if product_data:
-        return jsonify(Product.from_dict(product_data)), 200
+    # 書き込みと同時にproductを読まないよう、モデルを作り終えるまでロックを取る
+    with data.LOCK:
+        product_data = data.DB["products"].get(product_id)
+        product = Product.from_dict(data.live_product(product_data)) if product_data else None
+    if product:
+        return jsonify(product), 200
     else:
         return jsonify({"message": "Product not found"}), 404
 
@@ -24,7 +59,10 @@ def get_product_by_id(product_id):  # noqa: E501
 def list_products():  # noqa: E501
     """List all products"""
     # data.DB["products"] の値をリストにして返す
-    products_list = [
-        Product.from_dict(p_data) for p_data in data.DB["products"].values()
-    ]
+    # (add_product/delete_productなどがdictの大きさを変えるので、ロックを取って走査する)
+    with data.LOCK:
+        products_list = [
+            Product.from_dict(data.live_product(p_data))
+            for p_data in data.DB["products"].values()
+        ]
     return jsonify(products_list), 200
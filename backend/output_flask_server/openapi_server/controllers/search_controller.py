@@ -0,0 +1,27 @@
+import connexion
+from typing import Dict
+from typing import Tuple
+from typing import Union
+
+from openapi_server.models.completion import Completion  # noqa: E501
+from openapi_server.models.error import Error  # noqa: E501
+from openapi_server.models.search_hit import SearchHit  # noqa: E501
+from openapi_server import util
+
+from flask import request, jsonify
+from . import data
+
+
+def search_catalog(q, kind=None, limit=None):  # noqa: E501
+    """Search attributes and params by code or display name"""
+    # 書き込みと同時に索引を読まないよう、検索中はロックを取る (検索自体は候補の数に比例)
+    with data.LOCK:
+        hits = data.DB["search_index"].search(q, limit or 20, kind)
+    return jsonify([SearchHit.from_dict(hit) for hit in hits]), 200
+
+
+def autocomplete(field, prefix=None, limit=None):  # noqa: E501
+    """Complete a product prefix, product type or attribute code"""
+    with data.LOCK:
+        completions = data.DB["completions"][field].complete(prefix or "", limit or 10)
+    return jsonify([Completion.from_dict(c) for c in completions]), 200
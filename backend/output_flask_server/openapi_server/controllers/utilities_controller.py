@@ -12,6 +12,7 @@ from openapi_server import util
 from flask import request, jsonify
 from . import data
 
+@data.locked
 def refresh_mock_data():  # noqa: E501
     """
     POST /refresh
@@ -1,19 +1,86 @@
+import time
+
 from connexion.apps.flask_app import FlaskJSONEncoder
 
+from openapi_server import instrumentation
+from openapi_server import typing_utils
 from openapi_server.models.base_model import Model
 
+# Generated encode functions keyed by (model class, include_nulls).
+_ENCODERS = {}
+
 
 class JSONEncoder(FlaskJSONEncoder):
     include_nulls = False
 
+    def encode(self, o):
+        start = time.perf_counter()
+        try:
+            return super().encode(o)
+        finally:
+            instrumentation.add_phase("serialization", time.perf_counter() - start)
+
     def default(self, o):
         if isinstance(o, Model):
-            dikt = {}
-            for attr in o.openapi_types:
-                value = getattr(o, attr)
-                if value is None and not self.include_nulls:
-                    continue
-                attr = o.attribute_map[attr]
-                dikt[attr] = value
-            return dikt
+            encode = _ENCODERS.get((o.__class__, self.include_nulls))
+            if encode is None:
+                encode = get_encoder(o.__class__, self.include_nulls)
+            return encode(o)
         return FlaskJSONEncoder.default(self, o)
+
+
+def get_encoder(klass, include_nulls=False):
+    """Returns the encode function of a model class, generating it on first use.
+
+    The function reads every field straight from its slot, renames it through
+    ``attribute_map`` and encodes nested models of the declared type in place,
+    so the json encoder does not call back into ``default`` for them.
+
+    :param klass: model class literal.
+    :param include_nulls: whether None fields are emitted.
+    :return: function taking a model object and returning a dict.
+    """
+    key = (klass, include_nulls)
+    encode = _ENCODERS.get(key)
+    if encode is None:
+        encode = _compile_encoder(klass, include_nulls, set())
+    return encode
+
+
+def _compile_encoder(klass, include_nulls, compiling):
+    compiling.add(klass)
+    namespace = {}
+    lines = ["def encode(o):", "    d = {}"]
+    for i, (attr, attr_type) in enumerate(klass.openapi_types.items()):
+        if hasattr(klass, '_' + attr):
+            lines.append("    v = o._%s" % attr)
+        else:
+            lines.append("    v = o.%s" % attr)
+        value = "v"
+        item_type = attr_type
+        is_list = typing_utils.is_generic(attr_type) and typing_utils.is_list(attr_type)
+        if is_list:
+            item_type = attr_type.__args__[0]
+        if isinstance(item_type, type) and issubclass(item_type, Model) \
+                and item_type not in compiling:
+            namespace['klass%d' % i] = item_type
+            namespace['encode%d' % i] = _ENCODERS.get((item_type, include_nulls)) \
+                or _compile_encoder(item_type, include_nulls, compiling)
+            if is_list:
+                value = ("[encode%d(x) if x.__class__ is klass%d else x for x in v]"
+                         % (i, i))
+            else:
+                value = "encode%d(v) if v.__class__ is klass%d else v" % (i, i)
+        json_key = klass.attribute_map[attr]
+        if include_nulls:
+            lines.append("    d[%r] = None if v is None else %s" % (json_key, value))
+        else:
+            lines.append("    if v is not None:")
+            lines.append("        d[%r] = %s" % (json_key, value))
+    lines.append("    return d")
+    source = "\n".join(lines)
+    exec(compile(source, "<encoder %s>" % klass.__name__, "exec"), namespace)
+    encode = namespace["encode"]
+    _ENCODERS[(klass, include_nulls)] = encode
+    compiling.discard(klass)
+    return encode
@@ -0,0 +1,148 @@
+# export.py
+"""
+カタログの一括エクスポート (GET /export)。
+
+- ndjson: bulk.py の取り込みと同じ、1行1レコードのフラット形式
+- csv:    param 1つにつき1行。product と attribute の列を各行に展開します。
+          param のない attribute、attribute のない product も、欠けた列を空にした
+          1行として出力します。列名は各スキーマのフィールド名で、複数の階層に
+          ある名前 (sort_order, code, disp_name) には product_/attribute_/param_ を付けます。
+
+スナップショットは data.LOCK を取ったまま SpooledTemporaryFile に書き出します
+(SPOOL_MAX_BYTES を超えるとディスクに移る)。その後はロックを離して
+EXPORT_CHUNK_BYTES ずつ返すので、遅いクライアントが書き込みを止めることはなく、
+メモリ使用量もカタログの大きさによらず一定です。
+"""
+import collections
+import csv
+import io
+import json
+import tempfile
+
+from openapi_server.controllers import data
+from openapi_server.synthetic import _fields, load_schemas
+
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+EXPORT_CHUNK_BYTES = 64 * 1024
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+_CSV_LAYOUT = None
+
+
+def csv_layout():
+    """(product, attribute, param) ごとのフィールド名のタプルと、CSV のヘッダーを返します。"""
+    global _CSV_LAYOUT
+    if _CSV_LAYOUT is None:
+        schemas = load_schemas()
+        param_fields = []
+        for ref in schemas["ParamItem"]["discriminator"]["mapping"].values():
+            for field, _ in _fields(schemas, ref.rsplit("/", 1)[-1]):
+                if field not in param_fields:
+                    param_fields.append(field)
+        levels = (
+            ("product", tuple(field for field, _ in _fields(schemas, "Product"))),
+            ("attribute", tuple(field for field, _ in _fields(schemas, "Attribute"))),
+            ("param", tuple(param_fields)),
+        )
+        counts = collections.Counter(field for _, fields in levels for field in fields)
+        header = [
+            field if counts[field] == 1 else f"{level}_{field}"
+            for level, fields in levels
+            for field in fields
+        ]
+        _CSV_LAYOUT = tuple(fields for _, fields in levels), header
+    return _CSV_LAYOUT
+
+
+def iter_records():
+    """ストアの内容をフラット形式のレコードとして yield します (呼び出し側で LOCK を取る)。"""
+    for pid, product in data.DB["products"].items():
+        product = data.live_product(product)
+        record = {"kind": "product"}
+        record.update((k, v) for k, v in product.items() if k != "attributes")
+        yield record
+        for attribute in product.get("attributes", []):
+            record = {"kind": "attribute", "prod_id": pid}
+            record.update((k, v) for k, v in attribute.items() if k != "params")
+            yield record
+            aid = attribute["attribute_id"]
+            for param in attribute.get("params", []):
+                record = {"kind": "param", "prod_id": pid, "attribute_id": aid}
+                record.update(param)
+                yield record
+
+
+def _csv_value(value):
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return value
+
+
+def iter_csv_rows():
+    """CSV の行 (ヘッダーを含む) を yield します (呼び出し側で LOCK を取る)。"""
+    (product_fields, attribute_fields, param_fields), header = csv_layout()
+    yield header
+    no_attribute = [None] * len(attribute_fields)
+    no_param = [None] * len(param_fields)
+    for product in data.DB["products"].values():
+        product = data.live_product(product)
+        product_values = [_csv_value(product.get(f)) for f in product_fields]
+        attributes = product.get("attributes", [])
+        if not attributes:
+            yield product_values + no_attribute + no_param
+        for attribute in attributes:
+            prefix = product_values + [_csv_value(attribute.get(f)) for f in attribute_fields]
+            params = attribute.get("params", [])
+            if not params:
+                yield prefix + no_param
+            for param in params:
+                yield prefix + [_csv_value(param.get(f)) for f in param_fields]
+
+
+def write_snapshot(fmt, fp):
+    """ストアのスナップショットを fmt 形式で fp (バイナリ) に書き出します。"""
+    buffer = io.StringIO()
+    if fmt == "csv":
+        writer = csv.writer(buffer, lineterminator="\n")
+        items, write = iter_csv_rows(), writer.writerow
+    else:
+        items = iter_records()
+
+        def write(record):
+            buffer.write(json.dumps(record, ensure_ascii=False))
+            buffer.write("\n")
+
+    with data.LOCK:
+        for item in items:
+            write(item)
+            if buffer.tell() >= EXPORT_CHUNK_BYTES:
+                fp.write(buffer.getvalue().encode("utf-8"))
+                buffer.seek(0)
+                buffer.truncate()
+    fp.write(buffer.getvalue().encode("utf-8"))
+
+
+def snapshot(fmt):
+    """スナップショットを書き出したファイルを先頭に戻して返します。"""
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    try:
+        write_snapshot(fmt, spool)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+def iter_chunks(fp, size=EXPORT_CHUNK_BYTES):
+    """fp を size バイトずつ yield し、最後に閉じます。"""
+    try:
+        while True:
+            chunk = fp.read(size)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        fp.close()
@@ -0,0 +1,166 @@
+# instrumentation.py
+"""
+connexion の各オペレーションの処理時間をフェーズ毎に計測します。
+
+フェーズ:
+- validation:    リクエスト受付からコントローラー呼び出しまで (connexion のパラメータ解析・バリデーション)
+- controller:    コントローラー本体 (下記のネストしたフェーズを除く)
+- from_dict:     モデルへの変換 (util.deserialize_model)
+- serialization: JSON エンコードと、コントローラーから戻った後のレスポンス処理
+
+計測結果は RequestRecord としてアプリ毎に登録されたリスナーに渡されます。
+"""
+import contextvars
+import functools
+import time
+
+from connexion.apis.flask_utils import flaskify_endpoint
+from connexion.resolver import Resolver
+from flask import request
+
+_perf_counter = time.perf_counter
+
+# 処理中のリクエストの RequestTimings
+_current = contextvars.ContextVar("openapi_server_request_timings", default=None)
+
+# flask のエンドポイント名 -> operationId
+_OPERATION_IDS = {}
+
+
+class RequestTimings:
+    __slots__ = ("start", "controller_start", "controller_end", "phases")
+
+    def __init__(self, start):
+        self.start = start
+        self.controller_start = None
+        self.controller_end = None
+        self.phases = {}
+
+
+class RequestRecord:
+    """1リクエストの計測結果。"""
+
+    __slots__ = (
+        "operation_id", "method", "path", "path_params", "status",
+        "start", "duration", "phases", "request_bytes", "response_bytes",
+    )
+
+    def __init__(self, operation_id, method, path, path_params, status,
+                 start, duration, phases, request_bytes, response_bytes):
+        self.operation_id = operation_id
+        self.method = method
+        self.path = path
+        self.path_params = path_params
+        self.status = status
+        self.start = start
+        self.duration = duration
+        self.phases = phases
+        self.request_bytes = request_bytes
+        self.response_bytes = response_bytes
+
+
+def add_phase(name, seconds):
+    """処理中のリクエストにフェーズ name の時間を加算します (リクエスト外では何もしません)。"""
+    timings = _current.get()
+    if timings is not None:
+        timings.phases[name] = timings.phases.get(name, 0.0) + seconds
+
+
+def instrument(function):
+    """コントローラー関数を、呼び出し区間を記録するラッパーで包みます。"""
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        timings = _current.get()
+        if timings is None:
+            return function(*args, **kwargs)
+        timings.controller_start = _perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timings.controller_end = _perf_counter()
+
+    return wrapper
+
+
+class InstrumentedResolver(Resolver):
+    """解決したコントローラー関数を instrument() で包む Resolver。"""
+
+    def resolve(self, operation):
+        resolution = super().resolve(operation)
+        _OPERATION_IDS[flaskify_endpoint(resolution.operation_id)] = operation.operation_id
+        resolution.function = instrument(resolution.function)
+        return resolution
+
+
+def operation_id_for(endpoint):
+    """flask のエンドポイント名 (blueprint.name) から operationId を返します。"""
+    if endpoint is None:
+        return None
+    return _OPERATION_IDS.get(endpoint.partition(".")[2])
+
+
+class Instrumentation:
+    """Flask アプリにリクエスト計測を組み込み、結果をリスナーに通知します。"""
+
+    def __init__(self, app=None):
+        self.listeners = []
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions["instrumentation"] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+
+    def add_listener(self, listener):
+        """listener(record: RequestRecord) を登録します。リクエストスレッドで呼ばれます。"""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """add_listener で登録した listener を取り除きます。"""
+        self.listeners.remove(listener)
+
+    def _before_request(self):
+        _current.set(RequestTimings(_perf_counter()))
+
+    def _after_request(self, response):
+        timings = _current.get()
+        if timings is None:
+            return response
+        operation_id = operation_id_for(request.endpoint)
+        if operation_id is None or not self.listeners:
+            return response
+
+        end = _perf_counter()
+        phases = timings.phases
+        nested = sum(phases.values())
+        if timings.controller_start is None:
+            phases["validation"] = max(0.0, end - timings.start - nested)
+        else:
+            controller_end = timings.controller_end or end
+            phases["validation"] = timings.controller_start - timings.start
+            phases["controller"] = max(
+                0.0, controller_end - timings.controller_start - nested
+            )
+            phases["serialization"] = phases.get("serialization", 0.0) + (end - controller_end)
+
+        record = RequestRecord(
+            operation_id,
+            request.method,
+            request.path,
+            request.view_args or {},
+            response.status_code,
+            timings.start,
+            end - timings.start,
+            phases,
+            request.content_length or 0,
+            response.content_length,
+        )
+        for listener in self.listeners:
+            listener(record)
+        return response
+
+    def _teardown_request(self, exc=None):
+        _current.set(None)
@@ -0,0 +1,179 @@
+# log_handlers.py
+"""
+アクセスログ (access_log.py) の既定のハンドラー。
+
+umask/sample.py の AppendFileHandler と _open_fd を、サーバーのパッケージから
+読み込めるように取り込んだものです (umask/ は Docker のビルドコンテキストにも
+setup.py のパッケージにも含まれないため)。修正するときは両方に反映すること。
+"""
+import fcntl
+import logging
+import os
+
+
+def _open_fd(path, open_flags, permissions):
+    """
+    ファイルを開いてディスクリプタを返します。
+
+    os.umask() はプロセス全体の設定で、スレッドから一時的に変更すると
+    他のスレッドのファイル作成と競合するため使いません。代わりにファイルを
+    新規作成したときだけ、開いたディスクリプタに os.fchmod() で
+    パーミッションを設定します (umask の影響を受けません)。
+    既存のファイルのパーミッションは変更しません。
+    """
+    while True:
+        try:
+            fd = os.open(path, open_flags | os.O_CREAT | os.O_EXCL, permissions)
+            created = True
+            break
+        except FileExistsError:
+            pass
+        try:
+            fd = os.open(path, open_flags)
+            created = False
+            break
+        except FileNotFoundError:
+            pass  # 2回の open の間に削除された場合は作成からやり直す
+    if created:
+        try:
+            os.fchmod(fd, permissions)
+        except BaseException:
+            os.close(fd)
+            raise
+    return fd
+
+
+class AppendFileHandler(logging.Handler):
+    """
+    複数のワーカープロセスが同じファイルに書き込んでも、レコードが混ざらないハンドラ。
+
+    - 1レコードを整形してから1つのバッファにまとめ、O_APPEND で開いた
+      ディスクリプタに1回の write で書き込みます。
+    - atomic_size バイト以下のレコードはロックなしで書き込みます
+      (O_APPEND の1回の write はプロセス間で分断されない)。
+      それより大きいレコードはロックファイルの排他ロック下で書き込み、
+      write が途中までしか書けなかった場合も大きいレコード同士が混ざらないようにします。
+    - max_bytes を超えたときのローテートもロックファイル (filename + ".lock") で
+      プロセス間で調整します (backup_count が 0 ならローテートしない)。他のプロセスがローテートしたことは、パスの inode と
+      開いているファイルの inode の比較で検出して開き直します。
+    - ファイルは permissions で作成されます。
+    """
+
+    def __init__(
+        self,
+        filename,
+        permissions=0o600,
+        max_bytes=0,
+        backup_count=5,
+        atomic_size=4096,
+        encoding="utf-8",
+        errors=None,
+    ):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.lockFilename = self.baseFilename + ".lock"
+        self.permissions = permissions
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.atomic_size = atomic_size
+        self.encoding = encoding
+        self.errors = errors or "strict"
+        self.terminator = "\n"
+        self._lock_fd = _open_fd(self.lockFilename, os.O_WRONLY, permissions)
+        self._fd = None
+        self._ino = None
+        self._open_file()
+
+    def _open_file(self):
+        if self._fd is not None:
+            os.close(self._fd)
+        self._fd = _open_fd(self.baseFilename, os.O_WRONLY | os.O_APPEND, permissions=self.permissions)
+        self._ino = os.fstat(self._fd).st_ino
+
+    def _reopen_if_rotated(self):
+        """他のプロセスがローテートしていればファイルを開き直します。"""
+        try:
+            if os.stat(self.baseFilename).st_ino == self._ino:
+                return
+        except FileNotFoundError:
+            pass
+        self._open_file()
+
+    def _rotate(self, size):
+        """size バイトを書くと max_bytes を超える場合、ロックファイルの排他ロック下でローテートします。"""
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            self._reopen_if_rotated()
+            if os.fstat(self._fd).st_size + size <= self.max_bytes:
+                return  # 他のプロセスがローテート済み
+            for i in range(self.backup_count - 1, 0, -1):
+                source = f"{self.baseFilename}.{i}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.baseFilename}.{i + 1}")
+            os.replace(self.baseFilename, self.baseFilename + ".1")
+            os.chmod(self.baseFilename + ".1", self.permissions)
+            self._open_file()
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _write_all(self, data):
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+
+    def emit(self, record):
+        try:
+            data = (self.format(record) + self.terminator).encode(self.encoding, self.errors)
+            # backup_count が 0 ならローテートしない (共有のファイルを消すと他のプロセスのログも消える)
+            if self.max_bytes and self.backup_count > 0:
+                self._reopen_if_rotated()
+                if os.fstat(self._fd).st_size + len(data) > self.max_bytes:
+                    self._rotate(len(data))
+            if len(data) <= self.atomic_size:
+                self._write_all(data)
+            else:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+                try:
+                    self._write_all(data)
+                finally:
+                    fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        with self.lock:
+            for name in ("_fd", "_lock_fd"):
+                fd = getattr(self, name)
+                if fd is not None:
+                    os.close(fd)
+                    setattr(self, name, None)
+        super().close()
+
+
+if __name__ == "__main__":
+    # ロガーの設定
+    logger = logging.getLogger("permission_test_logger")
+    logger.setLevel(logging.INFO)
+
+    # カスタムハンドラを使用 (パーミッションを 0o600 rw------- に設定)
+    # ファイルが存在しない場合にこのパーミッションで作成されます。
+    # ファイルが既に存在し、かつ追記モードの場合、既存ファイルのパーミッションは変更されません。
+    # もし既存ファイルのパーミッションも変更したい場合は、ファイルを開く前に os.chmod() を呼び出す必要があります。
+    file_handler = MyFileHandler(
+        "app_specific_permission.log", mode="w", permissions=0o600
+    )  # 'w'で新規作成または上書き
+    # file_handler = MyFileHandler('app_specific_permission.log', mode='a', permissions=0o600) # 'a'で追記
+    # 書き込みをバックグラウンドスレッドに任せる場合は QueueFileHandler を使います
+    # file_handler = QueueFileHandler('app_specific_permission.log', mode='a', permissions=0o600)
+
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    file_handler.setFormatter(formatter)
+
+    logger.addHandler(file_handler)
+
+    logger.info("このログは指定されたパーミッションでファイルに書き込まれます。")
+
+    print(
+        f"ログファイル 'app_specific_permission.log' を確認してください。パーミッションが {oct(0o600)} になっているはずです。"
+    )
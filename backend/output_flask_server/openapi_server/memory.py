@@ -0,0 +1,239 @@
+# memory.py
+"""
+ストア (data.DB) のメモリ使用量を、product / attribute / param の階層毎に見積もります。
+
+- 各階層の dict 本体・値 (文字列・数値)・子リストのコンテナを sys.getsizeof で数えます。
+  dict のキーはインターンされた文字列を全 dict で共有しているため数えません。
+  削除済み (tombstone) の attribute / param は階層には含めず、tombstones として別に数えます。
+- sample を指定すると、その数の product だけを走査して全体を外挿するため、
+  大きなストアを持つ稼働中のサーバーでも短時間で呼び出せます (0 なら全件を走査)。
+  標本の product は ID の範囲の乱数から選ぶので、ストア全体をリストにはしません。
+- IDカウンター (next_attribute_id / next_param_id) は、標本の product のエントリから見積もります。
+- 索引 (data.index_structures) は、内部のコンテナごとに等間隔に選んだ sample * 10 個の要素を
+  2階層まで測って外挿します。ストアの dict (product / attribute / param) は
+  階層の側で数えるので、索引からの参照としてだけ数えます。
+
+GET /admin/memory は /admin/profiles と同じトークン (ヘッダー X-Profile) が必要です。
+"""
+import itertools
+import random
+import sys
+
+from flask import abort, current_app, jsonify, request
+
+from openapi_server import profiling
+from openapi_server.controllers import data
+
+# 標本の product を ID の乱数で集めるときの、試行回数の上限 (標本の数の倍数)
+_MAX_DRAWS_PER_SAMPLE = 8
+# 索引の要素のうち、中身を測る入れ子の深さ
+_INDEX_DEPTH = 2
+# 索引の要素は product より安く測れ、大きさのばらつき (2-gram の転置リストなど) も大きいので、
+# コンテナごとに sample のこの倍数の要素を測る
+_INDEX_SAMPLE_FACTOR = 10
+
+DEFAULT_SAMPLE = 100
+
+
+def _is_shared(value):
+    """インタプリタ全体で共有される値 (None/bool/キャッシュされる小さい int) か。"""
+    if value is None or value is True or value is False:
+        return True
+    return type(value) is int and -5 <= value <= 256
+
+
+class _Tier:
+    __slots__ = ("count", "containers", "strings", "numbers")
+
+    def __init__(self):
+        self.count = 0
+        self.containers = 0
+        self.strings = 0
+        self.numbers = 0
+
+    def add_value(self, value, seen):
+        if _is_shared(value) or id(value) in seen:
+            return
+        seen.add(id(value))
+        if isinstance(value, str):
+            self.strings += sys.getsizeof(value)
+        elif isinstance(value, (int, float)):
+            self.numbers += sys.getsizeof(value)
+        else:
+            self.containers += sys.getsizeof(value)
+
+    def report(self, scale):
+        total = self.containers + self.strings + self.numbers
+        count = self.count * scale
+        return {
+            "count": round(count),
+            "bytes": round(total * scale),
+            "bytes_per_item": total / self.count if self.count else 0.0,
+            "breakdown": {
+                "containers": round(self.containers * scale),
+                "strings": round(self.strings * scale),
+                "numbers": round(self.numbers * scale),
+            },
+        }
+
+
+def _measure_dict(tier, item, child_key, seen):
+    tier.count += 1
+    tier.containers += sys.getsizeof(item)
+    for key, value in list(item.items()):
+        if key == data.DELETED:
+            continue
+        if key == child_key:
+            tier.containers += sys.getsizeof(value)
+        else:
+            tier.add_value(value, seen)
+
+
+def _sample_products(products, sample, rng):
+    """product を最大 sample 個、dict 全体をリストにせずに無作為に選びます。
+
+    ID は 0 以上 next_product_id 未満なので、その範囲の乱数のうち存在する ID を使います。
+    ID が疎で集まりきらなければ、残りは dict の先頭から補います。
+    """
+    id_limit = max(data.DB.get("next_product_id", 0), 1)
+    chosen = {}
+    for _ in range(sample * _MAX_DRAWS_PER_SAMPLE):
+        if len(chosen) >= sample:
+            break
+        pid = rng.randrange(id_limit)
+        if pid in products:
+            chosen[pid] = products[pid]
+    for pid, product in products.items():
+        if len(chosen) >= sample:
+            break
+        chosen.setdefault(pid, product)
+    return list(chosen.values())
+
+
+def _entry_size(key, value):
+    size = 0
+    keys = key if isinstance(key, tuple) else (key,)
+    if isinstance(key, tuple):
+        size += sys.getsizeof(key)
+    for v in keys + (value,):
+        if not _is_shared(v):
+            size += sys.getsizeof(v)
+    return size
+
+
+def _counter_report(counter, keys):
+    """カウンター map の dict 本体と、keys (標本の product のエントリ) から見積もったサイズを返します。"""
+    entries = len(counter)
+    table = sys.getsizeof(counter)
+    measured = [(key, counter[key]) for key in keys if key in counter]
+    if not entries or not measured:
+        return {"entries": entries, "bytes": table}
+    per_entry = sum(_entry_size(key, value) for key, value in measured)
+    return {"entries": entries, "bytes": table + round(per_entry * entries / len(measured))}
+
+
+def _is_container(value):
+    return isinstance(value, (dict, tuple, list, set, frozenset))
+
+
+def _part_size(part, sample, level=0):
+    """索引のコンテナ part の大きさを、要素を sample 個 (0 なら全部) 測って外挿して返します。
+
+    要素は先頭から等間隔に選びます (islice で飛ばすだけで、コンテナのコピーは作らない)。
+    入れ子は _INDEX_DEPTH 階層まで測ります。文字列や数値は part の直下でだけ数え、
+    入れ子の中ではコンテナが持つ参照として扱います。文書キーのように同じオブジェクトが
+    多くの入れ子から参照されても、重複して数えないためです。
+    ストアの dict (product / attribute / param) は階層の側で数えます。
+    """
+    if not _is_container(part):
+        return sys.getsizeof(part) if level == 1 and not _is_shared(part) else 0
+    if type(part) is dict and data.DELETED not in part and (
+            "prod_id" in part or "attribute_id" in part or "param_id" in part):
+        return 0
+    size = sys.getsizeof(part)
+    count = len(part)
+    if level >= _INDEX_DEPTH or not count:
+        return size
+    items = iter(part.items()) if isinstance(part, dict) else iter(part)
+    step = max(count // sample, 1) if sample else 1
+    measured = 0
+    total = 0
+    for item in itertools.islice(items, 0, None, step):
+        children = item if isinstance(part, dict) else (item,)
+        total += sum(_part_size(child, sample, level + 1) for child in children)
+        measured += 1
+    return size + round(total * count / measured)
+
+
+def _index_report(index, sample):
+    parts = index.memory_parts() if hasattr(index, "memory_parts") else {"table": index}
+    sizes = {name: _part_size(part, sample) for name, part in parts.items()}
+    return {"bytes": sum(sizes.values()), "parts": sizes}
+
+
+def store_memory(sample=DEFAULT_SAMPLE, seed=None):
+    """ストアのメモリ使用量の見積もりを dict で返します。
+
+    :param sample: 走査する product 数と、索引のコンテナごとに測る要素数 (0 なら全件)
+    :param seed: 標本抽出の乱数シード
+    """
+    rng = random.Random(seed)
+    product_table = data.DB.get("products", {})
+    exact = not sample or sample >= len(product_table)
+    measured = list(product_table.values()) if exact else _sample_products(product_table, sample, rng)
+    scale = 1.0 if exact or not measured else len(product_table) / len(measured)
+
+    tiers = {"products": _Tier(), "attributes": _Tier(), "params": _Tier(), "tombstones": _Tier()}
+    seen = set()
+    attribute_keys = []
+    for product in measured:
+        _measure_dict(tiers["products"], product, "attributes", seen)
+        for attribute in list(product.get("attributes", ())):
+            deleted = data.DELETED in attribute
+            _measure_dict(tiers["tombstones" if deleted else "attributes"], attribute, "params", seen)
+            if not deleted:
+                attribute_keys.append((product["prod_id"], attribute["attribute_id"]))
+            for param in list(attribute.get("params", ())):
+                deleted_param = deleted or data.DELETED in param
+                _measure_dict(tiers["tombstones" if deleted_param else "params"], param, None, seen)
+
+    report = {name: tier.report(scale) for name, tier in tiers.items()}
+    report["products_table"] = {"bytes": sys.getsizeof(product_table)}
+    report["counters"] = {
+        "next_attribute_id": _counter_report(
+            data.DB.get("next_attribute_id", {}), [p["prod_id"] for p in measured]),
+        "next_param_id": _counter_report(data.DB.get("next_param_id", {}), attribute_keys),
+    }
+    index_sample = 0 if exact else sample * _INDEX_SAMPLE_FACTOR
+    report["indexes"] = {
+        name: _index_report(index, index_sample) for name, index in data.index_structures()
+    }
+    report["total_bytes"] = (
+        sum(report[name]["bytes"] for name in tiers)
+        + report["products_table"]["bytes"]
+        + sum(c["bytes"] for c in report["counters"].values())
+        + sum(i["bytes"] for i in report["indexes"].values())
+    )
+    report["sampled_products"] = len(measured)
+    report["exact"] = exact
+    return report
+
+
+def _memory_view():
+    if not profiling.authorized(current_app.config.get("PROFILE_TOKEN", "")):
+        abort(403)
+    try:
+        sample = int(request.args.get("sample", DEFAULT_SAMPLE))
+    except ValueError:
+        return jsonify({"message": "sample must be an integer"}), 400
+    if sample < 0:
+        return jsonify({"message": "sample must be >= 0"}), 400
+    # 書き込みと同時にストアを走査しないよう、見積もりの間はロックを取る
+    with data.LOCK:
+        report = store_memory(sample)
+    return jsonify(report)
+
+
+def init_app(app):
+    """GET /admin/memory?sample=N を追加します (PROFILE_TOKEN が必要)。"""
+    app.add_url_rule("/admin/memory", "store_memory", _memory_view)
@@ -0,0 +1,162 @@
+# metrics.py
+"""
+Prometheus のテキスト形式で /metrics を提供します。
+
+instrumentation のリスナーとして、operationId 毎のリクエスト数・
+ステータス別エラー数・フェーズ別レイテンシのヒストグラムを集計し、
+スクレイプ時にストアのサイズとキャッシュのエントリ数をゲージとして出力します。
+"""
+import bisect
+import threading
+
+from flask import Response
+
+from openapi_server import encoder
+from openapi_server import util
+from openapi_server.controllers import data
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 秒単位のバケット上限
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 最後は +Inf
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+def _label_value(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{k}="{_label_value(v)}"' for k, v in labels.items()) + "}"
+
+
+def _format_float(value):
+    return repr(float(value))
+
+
+def store_sizes():
+    """ストア (data.DB) の product/attribute/param 数を返します。"""
+    # 削除済み (tombstone) のものは数えない
+    return {
+        "products": len(data.DB.get("products", {})),
+        "attributes": len(data.DB.get("attribute_ids", {})),
+        "params": len(data.DB.get("param_ids", {})),
+    }
+
+
+def cache_sizes():
+    """モジュールレベルのキャッシュのエントリ数を返します。"""
+    return {
+        "deserialize_plans": len(util._PLANS),
+        "encoders": len(encoder._ENCODERS),
+    }
+
+
+class MetricsRegistry:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """集計をすべて破棄します。"""
+        self._requests = {}  # operation -> count
+        self._errors = {}  # (operation, status) -> count
+        self._durations = {}  # operation -> Histogram
+        self._phases = {}  # (operation, phase) -> Histogram
+
+    def _histogram(self, table, key):
+        histogram = table.get(key)
+        if histogram is None:
+            histogram = table[key] = Histogram(self._buckets)
+        return histogram
+
+    def observe(self, record):
+        """instrumentation のリスナー。"""
+        operation = record.operation_id
+        with self._lock:
+            self._requests[operation] = self._requests.get(operation, 0) + 1
+            if record.status >= 400:
+                key = (operation, record.status)
+                self._errors[key] = self._errors.get(key, 0) + 1
+            self._histogram(self._durations, operation).observe(record.duration)
+            for phase, seconds in record.phases.items():
+                self._histogram(self._phases, (operation, phase)).observe(seconds)
+
+    def _render_histogram(self, lines, name, histogram, labels):
+        cumulative = 0
+        for bound, count in zip(self._buckets, histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels(**labels, le=_format_float(bound))} {cumulative}")
+        cumulative += histogram.counts[-1]
+        lines.append(f'{name}_bucket{_labels(**labels, le="+Inf")} {cumulative}')
+        lines.append(f"{name}_sum{_labels(**labels)} {_format_float(histogram.sum)}")
+        lines.append(f"{name}_count{_labels(**labels)} {cumulative}")
+
+    def render(self):
+        """Prometheus テキスト形式の文字列を返します。"""
+        lines = []
+        with self._lock:
+            lines.append("# HELP openapi_requests_total Requests handled per operation.")
+            lines.append("# TYPE openapi_requests_total counter")
+            for operation, count in sorted(self._requests.items()):
+                lines.append(f"openapi_requests_total{_labels(operation=operation)} {count}")
+
+            lines.append("# HELP openapi_request_errors_total Responses with status >= 400 per operation and status.")
+            lines.append("# TYPE openapi_request_errors_total counter")
+            for (operation, status), count in sorted(self._errors.items()):
+                lines.append(
+                    f"openapi_request_errors_total{_labels(operation=operation, status=status)} {count}"
+                )
+
+            lines.append("# HELP openapi_request_duration_seconds Request latency per operation.")
+            lines.append("# TYPE openapi_request_duration_seconds histogram")
+            for operation, histogram in sorted(self._durations.items()):
+                self._render_histogram(
+                    lines, "openapi_request_duration_seconds", histogram, {"operation": operation}
+                )
+
+            lines.append("# HELP openapi_request_phase_seconds Request latency per operation and phase.")
+            lines.append("# TYPE openapi_request_phase_seconds histogram")
+            for (operation, phase), histogram in sorted(self._phases.items()):
+                self._render_histogram(
+                    lines, "openapi_request_phase_seconds", histogram,
+                    {"operation": operation, "phase": phase},
+                )
+
+        lines.append("# HELP openapi_store_items Items held in the in-memory store.")
+        lines.append("# TYPE openapi_store_items gauge")
+        for kind, count in store_sizes().items():
+            lines.append(f"openapi_store_items{_labels(kind=kind)} {count}")
+
+        lines.append("# HELP openapi_cache_entries Entries in internal caches.")
+        lines.append("# TYPE openapi_cache_entries gauge")
+        for cache, count in cache_sizes().items():
+            lines.append(f"openapi_cache_entries{_labels(cache=cache)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def init_app(app):
+    """app に /metrics を追加し、instrumentation に集計用のリスナーを登録します。"""
+    registry = MetricsRegistry()
+    app.extensions["metrics"] = registry
+    app.extensions["instrumentation"].add_listener(registry.observe)
+    app.add_url_rule(
+        "/metrics", "metrics", lambda: Response(registry.render(), content_type=CONTENT_TYPE)
+    )
+    return registry
@@ -2,7 +2,12 @@
 # import models into model package
 from openapi_server.models.attribute import Attribute
 from openapi_server.models.attribute_input import AttributeInput
+from openapi_server.models.attribute_match import AttributeMatch
+from openapi_server.models.attribute_query_result import AttributeQueryResult
+from openapi_server.models.completion import Completion
 from openapi_server.models.error import Error
+from openapi_server.models.import_line_error import ImportLineError
+from openapi_server.models.import_result import ImportResult
 from openapi_server.models.param_base import ParamBase
 from openapi_server.models.param_base_input import ParamBaseInput
 from openapi_server.models.param_item import ParamItem
@@ -14,4 +19,8 @@ from openapi_server.models.param_type2_item_input import ParamType2ItemInput
 from openapi_server.models.param_type3_item import ParamType3Item
 from openapi_server.models.param_type3_item_input import ParamType3ItemInput
 from openapi_server.models.product import Product
+from openapi_server.models.product_input import ProductInput
 from openapi_server.models.refresh_mock_data200_response import RefreshMockData200Response
+from openapi_server.models.search_hit import SearchHit
+from openapi_server.models.type2_param_match import Type2ParamMatch
+from openapi_server.models.type2_param_query_result import Type2ParamQueryResult
@@ -14,6 +14,48 @@ class Attribute(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'attribute_id': int,
+        'code': str,
+        'data_type': str,
+        'disp_name': str,
+        'unit': str,
+        'params': List[ParamItem],
+        'contract': str,
+        'public': bool,
+        'masking': bool,
+        'online': bool,
+        'sort_order': int
+    }
+
+    attribute_map = {
+        'attribute_id': 'attribute_id',
+        'code': 'code',
+        'data_type': 'data_type',
+        'disp_name': 'disp_name',
+        'unit': 'unit',
+        'params': 'params',
+        'contract': 'contract',
+        'public': 'public',
+        'masking': 'masking',
+        'online': 'online',
+        'sort_order': 'sort_order'
+    }
+
+    __slots__ = (
+        '_attribute_id',
+        '_code',
+        '_data_type',
+        '_disp_name',
+        '_unit',
+        '_params',
+        '_contract',
+        '_public',
+        '_masking',
+        '_online',
+        '_sort_order',
+    )
+
     def __init__(self, attribute_id=None, code=None, data_type=None, disp_name=None, unit=None, params=None, contract=None, public=None, masking=None, online=None, sort_order=None):  # noqa: E501
         """Attribute - a model defined in OpenAPI
 
@@ -40,34 +82,6 @@ class Attribute(Model):
         :param sort_order: The sort_order of this Attribute.  # noqa: E501
         :type sort_order: int
         """
-        self.openapi_types = {
-            'attribute_id': int,
-            'code': str,
-            'data_type': str,
-            'disp_name': str,
-            'unit': str,
-            'params': List[ParamItem],
-            'contract': str,
-            'public': bool,
-            'masking': bool,
-            'online': bool,
-            'sort_order': int
-        }
-
-        self.attribute_map = {
-            'attribute_id': 'attribute_id',
-            'code': 'code',
-            'data_type': 'data_type',
-            'disp_name': 'disp_name',
-            'unit': 'unit',
-            'params': 'params',
-            'contract': 'contract',
-            'public': 'public',
-            'masking': 'masking',
-            'online': 'online',
-            'sort_order': 'sort_order'
-        }
-
         self._attribute_id = attribute_id
         self._code = code
         self._data_type = data_type
@@ -12,6 +12,42 @@ class AttributeInput(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'code': str,
+        'data_type': str,
+        'disp_name': str,
+        'unit': str,
+        'contract': str,
+        'public': bool,
+        'masking': bool,
+        'online': bool,
+        'sort_order': int
+    }
+
+    attribute_map = {
+        'code': 'code',
+        'data_type': 'data_type',
+        'disp_name': 'disp_name',
+        'unit': 'unit',
+        'contract': 'contract',
+        'public': 'public',
+        'masking': 'masking',
+        'online': 'online',
+        'sort_order': 'sort_order'
+    }
+
+    __slots__ = (
+        '_code',
+        '_data_type',
+        '_disp_name',
+        '_unit',
+        '_contract',
+        '_public',
+        '_masking',
+        '_online',
+        '_sort_order',
+    )
+
     def __init__(self, code=None, data_type=None, disp_name=None, unit=None, contract=None, public=None, masking=None, online=None, sort_order=None):  # noqa: E501
         """AttributeInput - a model defined in OpenAPI
 
@@ -34,30 +70,6 @@ class AttributeInput(Model):
         :param sort_order: The sort_order of this AttributeInput.  # noqa: E501
         :type sort_order: int
         """
-        self.openapi_types = {
-            'code': str,
-            'data_type': str,
-            'disp_name': str,
-            'unit': str,
-            'contract': str,
-            'public': bool,
-            'masking': bool,
-            'online': bool,
-            'sort_order': int
-        }
-
-        self.attribute_map = {
-            'code': 'code',
-            'data_type': 'data_type',
-            'disp_name': 'disp_name',
-            'unit': 'unit',
-            'contract': 'contract',
-            'public': 'public',
-            'masking': 'masking',
-            'online': 'online',
-            'sort_order': 'sort_order'
-        }
-
         self._code = code
         self._data_type = data_type
         self._disp_name = disp_name
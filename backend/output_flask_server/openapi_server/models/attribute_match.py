@@ -0,0 +1,98 @@
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from openapi_server.models.base_model import Model
+from openapi_server.models.attribute import Attribute
+from openapi_server import util
+
+from openapi_server.models.attribute import Attribute  # noqa: E501
+
+class AttributeMatch(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    openapi_types = {
+        'prod_id': int,
+        'attribute': Attribute
+    }
+
+    attribute_map = {
+        'prod_id': 'prod_id',
+        'attribute': 'attribute'
+    }
+
+    __slots__ = (
+        '_prod_id',
+        '_attribute',
+    )
+
+    def __init__(self, prod_id=None, attribute=None):  # noqa: E501
+        """AttributeMatch - a model defined in OpenAPI
+
+        :param prod_id: The prod_id of this AttributeMatch.  # noqa: E501
+        :type prod_id: int
+        :param attribute: The attribute of this AttributeMatch.  # noqa: E501
+        :type attribute: Attribute
+        """
+        self._prod_id = prod_id
+        self._attribute = attribute
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'AttributeMatch':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The AttributeMatch of this AttributeMatch.  # noqa: E501
+        :rtype: AttributeMatch
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def prod_id(self) -> int:
+        """Gets the prod_id of this AttributeMatch.
+
+
+        :return: The prod_id of this AttributeMatch.
+        :rtype: int
+        """
+        return self._prod_id
+
+    @prod_id.setter
+    def prod_id(self, prod_id: int):
+        """Sets the prod_id of this AttributeMatch.
+
+
+        :param prod_id: The prod_id of this AttributeMatch.
+        :type prod_id: int
+        """
+        if prod_id is None:
+            raise ValueError("Invalid value for `prod_id`, must not be `None`")  # noqa: E501
+
+        self._prod_id = prod_id
+
+    @property
+    def attribute(self) -> Attribute:
+        """Gets the attribute of this AttributeMatch.
+
+
+        :return: The attribute of this AttributeMatch.
+        :rtype: Attribute
+        """
+        return self._attribute
+
+    @attribute.setter
+    def attribute(self, attribute: Attribute):
+        """Sets the attribute of this AttributeMatch.
+
+
+        :param attribute: The attribute of this AttributeMatch.
+        :type attribute: Attribute
+        """
+        if attribute is None:
+            raise ValueError("Invalid value for `attribute`, must not be `None`")  # noqa: E501
+
+        self._attribute = attribute
@@ -0,0 +1,156 @@
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from openapi_server.models.base_model import Model
+from openapi_server.models.attribute_match import AttributeMatch
+from openapi_server import util
+
+from openapi_server.models.attribute_match import AttributeMatch  # noqa: E501
+
+class AttributeQueryResult(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    openapi_types = {
+        'total': int,
+        'offset': int,
+        'limit': int,
+        'items': List[AttributeMatch]
+    }
+
+    attribute_map = {
+        'total': 'total',
+        'offset': 'offset',
+        'limit': 'limit',
+        'items': 'items'
+    }
+
+    __slots__ = (
+        '_total',
+        '_offset',
+        '_limit',
+        '_items',
+    )
+
+    def __init__(self, total=None, offset=None, limit=None, items=None):  # noqa: E501
+        """AttributeQueryResult - a model defined in OpenAPI
+
+        :param total: The total of this AttributeQueryResult.  # noqa: E501
+        :type total: int
+        :param offset: The offset of this AttributeQueryResult.  # noqa: E501
+        :type offset: int
+        :param limit: The limit of this AttributeQueryResult.  # noqa: E501
+        :type limit: int
+        :param items: The items of this AttributeQueryResult.  # noqa: E501
+        :type items: List[AttributeMatch]
+        """
+        self._total = total
+        self._offset = offset
+        self._limit = limit
+        self._items = items
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'AttributeQueryResult':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The AttributeQueryResult of this AttributeQueryResult.  # noqa: E501
+        :rtype: AttributeQueryResult
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def total(self) -> int:
+        """Gets the total of this AttributeQueryResult.
+
+
+        :return: The total of this AttributeQueryResult.
+        :rtype: int
+        """
+        return self._total
+
+    @total.setter
+    def total(self, total: int):
+        """Sets the total of this AttributeQueryResult.
+
+
+        :param total: The total of this AttributeQueryResult.
+        :type total: int
+        """
+        if total is None:
+            raise ValueError("Invalid value for `total`, must not be `None`")  # noqa: E501
+
+        self._total = total
+
+    @property
+    def offset(self) -> int:
+        """Gets the offset of this AttributeQueryResult.
+
+
+        :return: The offset of this AttributeQueryResult.
+        :rtype: int
+        """
+        return self._offset
+
+    @offset.setter
+    def offset(self, offset: int):
+        """Sets the offset of this AttributeQueryResult.
+
+
+        :param offset: The offset of this AttributeQueryResult.
+        :type offset: int
+        """
+        if offset is None:
+            raise ValueError("Invalid value for `offset`, must not be `None`")  # noqa: E501
+
+        self._offset = offset
+
+    @property
+    def limit(self) -> int:
+        """Gets the limit of this AttributeQueryResult.
+
+
+        :return: The limit of this AttributeQueryResult.
+        :rtype: int
+        """
+        return self._limit
+
+    @limit.setter
+    def limit(self, limit: int):
+        """Sets the limit of this AttributeQueryResult.
+
+
+        :param limit: The limit of this AttributeQueryResult.
+        :type limit: int
+        """
+        if limit is None:
+            raise ValueError("Invalid value for `limit`, must not be `None`")  # noqa: E501
+
+        self._limit = limit
+
+    @property
+    def items(self) -> List[AttributeMatch]:
+        """Gets the items of this AttributeQueryResult.
+
+
+        :return: The items of this AttributeQueryResult.
+        :rtype: List[AttributeMatch]
+        """
+        return self._items
+
+    @items.setter
+    def items(self, items: List[AttributeMatch]):
+        """Sets the items of this AttributeQueryResult.
+
+
+        :param items: The items of this AttributeQueryResult.
+        :type items: List[AttributeMatch]
+        """
+        if items is None:
+            raise ValueError("Invalid value for `items`, must not be `None`")  # noqa: E501
+
+        self._items = items
@@ -16,6 +16,10 @@ class Model:
     # value is json key in definition.
     attribute_map: typing.Dict[str, str] = {}
 
+    # Both maps are class-level; subclasses declare their fields in
+    # __slots__ so that instances carry no per-object __dict__.
+    __slots__ = ()
+
     @classmethod
     def from_dict(cls: typing.Type[T], dikt) -> T:
         """Returns the dict as a model"""
@@ -61,7 +65,12 @@ class Model:
 
     def __eq__(self, other):
         """Returns true if both objects are equal"""
-        return self.__dict__ == other.__dict__
+        if not isinstance(other, Model):
+            return False
+        if self.openapi_types != other.openapi_types:
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.openapi_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
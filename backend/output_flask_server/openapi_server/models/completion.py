@@ -0,0 +1,96 @@
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from openapi_server.models.base_model import Model
+from openapi_server import util
+
+
+class Completion(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    openapi_types = {
+        'value': str,
+        'count': int
+    }
+
+    attribute_map = {
+        'value': 'value',
+        'count': 'count'
+    }
+
+    __slots__ = (
+        '_value',
+        '_count',
+    )
+
+    def __init__(self, value=None, count=None):  # noqa: E501
+        """Completion - a model defined in OpenAPI
+
+        :param value: The value of this Completion.  # noqa: E501
+        :type value: str
+        :param count: The count of this Completion.  # noqa: E501
+        :type count: int
+        """
+        self._value = value
+        self._count = count
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'Completion':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The Completion of this Completion.  # noqa: E501
+        :rtype: Completion
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def value(self) -> str:
+        """Gets the value of this Completion.
+
+
+        :return: The value of this Completion.
+        :rtype: str
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value: str):
+        """Sets the value of this Completion.
+
+
+        :param value: The value of this Completion.
+        :type value: str
+        """
+        if value is None:
+            raise ValueError("Invalid value for `value`, must not be `None`")  # noqa: E501
+
+        self._value = value
+
+    @property
+    def count(self) -> int:
+        """Gets the count of this Completion.
+
+
+        :return: The count of this Completion.
+        :rtype: int
+        """
+        return self._count
+
+    @count.setter
+    def count(self, count: int):
+        """Sets the count of this Completion.
+
+
+        :param count: The count of this Completion.
+        :type count: int
+        """
+        if count is None:
+            raise ValueError("Invalid value for `count`, must not be `None`")  # noqa: E501
+
+        self._count = count
@@ -12,6 +12,21 @@ class Error(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'message': str,
+        'code': str
+    }
+
+    attribute_map = {
+        'message': 'message',
+        'code': 'code'
+    }
+
+    __slots__ = (
+        '_message',
+        '_code',
+    )
+
     def __init__(self, message=None, code=None):  # noqa: E501
         """Error - a model defined in OpenAPI
 
@@ -20,16 +35,6 @@ class Error(Model):
         :param code: The code of this Error.  # noqa: E501
         :type code: str
         """
-        self.openapi_types = {
-            'message': str,
-            'code': str
-        }
-
-        self.attribute_map = {
-            'message': 'message',
-            'code': 'code'
-        }
-
         self._message = message
         self._code = code
 
@@ -0,0 +1,96 @@
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from openapi_server.models.base_model import Model
+from openapi_server import util
+
+
+class ImportLineError(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    openapi_types = {
+        'line': int,
+        'message': str
+    }
+
+    attribute_map = {
+        'line': 'line',
+        'message': 'message'
+    }
+
+    __slots__ = (
+        '_line',
+        '_message',
+    )
+
+    def __init__(self, line=None, message=None):  # noqa: E501
+        """ImportLineError - a model defined in OpenAPI
+
+        :param line: The line of this ImportLineError.  # noqa: E501
+        :type line: int
+        :param message: The message of this ImportLineError.  # noqa: E501
+        :type message: str
+        """
+        self._line = line
+        self._message = message
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'ImportLineError':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The ImportLineError of this ImportLineError.  # noqa: E501
+        :rtype: ImportLineError
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def line(self) -> int:
+        """Gets the line of this ImportLineError.
+
+
+        :return: The line of this ImportLineError.
+        :rtype: int
+        """
+        return self._line
+
+    @line.setter
+    def line(self, line: int):
+        """Sets the line of this ImportLineError.
+
+
+        :param line: The line of this ImportLineError.
+        :type line: int
+        """
+        if line is None:
+            raise ValueError("Invalid value for `line`, must not be `None`")  # noqa: E501
+
+        self._line = line
+
+    @property
+    def message(self) -> str:
+        """Gets the message of this ImportLineError.
+
+
+        :return: The message of this ImportLineError.
+        :rtype: str
+        """
+        return self._message
+
+    @message.setter
+    def message(self, message: str):
+        """Sets the message of this ImportLineError.
+
+
+        :param message: The message of this ImportLineError.
+        :type message: str
+        """
+        if message is None:
+            raise ValueError("Invalid value for `message`, must not be `None`")  # noqa: E501
+
+        self._message = message
@@ -0,0 +1,214 @@
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from openapi_server.models.base_model import Model
+from openapi_server.models.import_line_error import ImportLineError
+from openapi_server import util
+
+from openapi_server.models.import_line_error import ImportLineError  # noqa: E501
+
+class ImportResult(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    openapi_types = {
+        'lines': int,
+        'products': int,
+        'attributes': int,
+        'params': int,
+        'error_count': int,
+        'errors': List[ImportLineError]
+    }
+
+    attribute_map = {
+        'lines': 'lines',
+        'products': 'products',
+        'attributes': 'attributes',
+        'params': 'params',
+        'error_count': 'error_count',
+        'errors': 'errors'
+    }
+
+    __slots__ = (
+        '_lines',
+        '_products',
+        '_attributes',
+        '_params',
+        '_error_count',
+        '_errors',
+    )
+
+    def __init__(self, lines=None, products=None, attributes=None, params=None, error_count=None, errors=None):  # noqa: E501
+        """ImportResult - a model defined in OpenAPI
+
+        :param lines: The lines of this ImportResult.  # noqa: E501
+        :type lines: int
+        :param products: The products of this ImportResult.  # noqa: E501
+        :type products: int
+        :param attributes: The attributes of this ImportResult.  # noqa: E501
+        :type attributes: int
+        :param params: The params of this ImportResult.  # noqa: E501
+        :type params: int
+        :param error_count: The error_count of this ImportResult.  # noqa: E501
+        :type error_count: int
+        :param errors: The errors of this ImportResult.  # noqa: E501
+        :type errors: List[ImportLineError]
+        """
+        self._lines = lines
+        self._products = products
+        self._attributes = attributes
+        self._params = params
+        self._error_count = error_count
+        self._errors = errors
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'ImportResult':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The ImportResult of this ImportResult.  # noqa: E501
+        :rtype: ImportResult
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def lines(self) -> int:
+        """Gets the lines of this ImportResult.
+
+
+        :return: The lines of this ImportResult.
+        :rtype: int
+        """
+        return self._lines
+
+    @lines.setter
+    def lines(self, lines: int):
+        """Sets the lines of this ImportResult.
+
+
+        :param lines: The lines of this ImportResult.
+        :type lines: int
+        """
+        if lines is None:
+            raise ValueError("Invalid value for `lines`, must not be `None`")  # noqa: E501
+
+        self._lines = lines
+
+    @property
+    def products(self) -> int:
+        """Gets the products of this ImportResult.
+
+
+        :return: The products of this ImportResult.
+        :rtype: int
+        """
+        return self._products
+
+    @products.setter
+    def products(self, products: int):
+        """Sets the products of this ImportResult.
+
+
+        :param products: The products of this ImportResult.
+        :type products: int
+        """
+        if products is None:
+            raise ValueError("Invalid value for `products`, must not be `None`")  # noqa: E501
+
+        self._products = products
+
+    @property
+    def attributes(self) -> int:
+        """Gets the attributes of this ImportResult.
+
+
+        :return: The attributes of this ImportResult.
+        :rtype: int
+        """
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, attributes: int):
+        """Sets the attributes of this ImportResult.
+
+
+        :param attributes: The attributes of this ImportResult.
+        :type attributes: int
+        """
+        if attributes is None:
+            raise ValueError("Invalid value for `attributes`, must not be `None`")  # noqa: E501
+
+        self._attributes = attributes
+
+    @property
+    def params(self) -> int:
+        """Gets the params of this ImportResult.
+
+
+        :return: The params of this ImportResult.
+        :rtype: int
+        """
+        return self._params
+
+    @params.setter
+    def params(self, params: int):
+        """Sets the params of this ImportResult.
+
+
+        :param params: The params of this ImportResult.
+        :type params: int
+        """
+        if params is None:
+            raise ValueError("Invalid value for `params`, must not be `None`")  # noqa: E501
+
+        self._params = params
+
+    @property
+    def error_count(self) -> int:
+        """Gets the error_count of this ImportResult.
+
+
+        :return: The error_count of this ImportResult.
+        :rtype: int
+        """
+        return self._error_count
+
+    @error_count.setter
+    def error_count(self, error_count: int):
+        """Sets the error_count of this ImportResult.
+
+
+        :param error_count: The error_count of this ImportResult.
+        :type error_count: int
+        """
+        if error_count is None:
+            raise ValueError("Invalid value for `error_count`, must not be `None`")  # noqa: E501
+
+        self._error_count = error_count
+
+    @property
+    def errors(self) -> List[ImportLineError]:
+        """Gets the errors of this ImportResult.
+
+
+        :return: The errors of this ImportResult.
+        :rtype: List[ImportLineError]
+        """
+        return self._errors
+
+    @errors.setter
+    def errors(self, errors: List[ImportLineError]):
+        """Sets the errors of this ImportResult.
+
+
+        :param errors: The errors of this ImportResult.
+        :type errors: List[ImportLineError]
+        """
+        if errors is None:
+            raise ValueError("Invalid value for `errors`, must not be `None`")  # noqa: E501
+
+        self._errors = errors
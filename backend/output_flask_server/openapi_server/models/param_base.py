@@ -12,6 +12,21 @@ class ParamBase(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'param_id': int,
+        'sort_order': int
+    }
+
+    attribute_map = {
+        'param_id': 'param_id',
+        'sort_order': 'sort_order'
+    }
+
+    __slots__ = (
+        '_param_id',
+        '_sort_order',
+    )
+
     def __init__(self, param_id=None, sort_order=None):  # noqa: E501
         """ParamBase - a model defined in OpenAPI
 
@@ -20,16 +35,6 @@ class ParamBase(Model):
         :param sort_order: The sort_order of this ParamBase.  # noqa: E501
         :type sort_order: int
         """
-        self.openapi_types = {
-            'param_id': int,
-            'sort_order': int
-        }
-
-        self.attribute_map = {
-            'param_id': 'param_id',
-            'sort_order': 'sort_order'
-        }
-
         self._param_id = param_id
         self._sort_order = sort_order
 
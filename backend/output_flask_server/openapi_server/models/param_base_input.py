@@ -12,20 +12,24 @@ class ParamBaseInput(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'sort_order': int
+    }
+
+    attribute_map = {
+        'sort_order': 'sort_order'
+    }
+
+    __slots__ = (
+        '_sort_order',
+    )
+
     def __init__(self, sort_order=None):  # noqa: E501
         """ParamBaseInput - a model defined in OpenAPI
 
         :param sort_order: The sort_order of this ParamBaseInput.  # noqa: E501
         :type sort_order: int
         """
-        self.openapi_types = {
-            'sort_order': int
-        }
-
-        self.attribute_map = {
-            'sort_order': 'sort_order'
-        }
-
         self._sort_order = sort_order
 
     @classmethod
@@ -18,6 +18,36 @@ class ParamItem(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'param_id': int,
+        'sort_order': int,
+        'type': str,
+        'code': str,
+        'disp_name': str,
+        'min': int,
+        'increment': int
+    }
+
+    attribute_map = {
+        'param_id': 'param_id',
+        'sort_order': 'sort_order',
+        'type': 'type',
+        'code': 'code',
+        'disp_name': 'disp_name',
+        'min': 'min',
+        'increment': 'increment'
+    }
+
+    __slots__ = (
+        '_param_id',
+        '_sort_order',
+        '_type',
+        '_code',
+        '_disp_name',
+        '_min',
+        '_increment',
+    )
+
     def __init__(self, param_id=None, sort_order=None, type=None, code=None, disp_name=None, min=None, increment=None):  # noqa: E501
         """ParamItem - a model defined in OpenAPI
 
@@ -36,26 +66,6 @@ class ParamItem(Model):
         :param increment: The increment of this ParamItem.  # noqa: E501
         :type increment: int
         """
-        self.openapi_types = {
-            'param_id': int,
-            'sort_order': int,
-            'type': str,
-            'code': str,
-            'disp_name': str,
-            'min': int,
-            'increment': int
-        }
-
-        self.attribute_map = {
-            'param_id': 'param_id',
-            'sort_order': 'sort_order',
-            'type': 'type',
-            'code': 'code',
-            'disp_name': 'disp_name',
-            'min': 'min',
-            'increment': 'increment'
-        }
-
         self._param_id = param_id
         self._sort_order = sort_order
         self._type = type
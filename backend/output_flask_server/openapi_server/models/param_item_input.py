@@ -18,6 +18,33 @@ class ParamItemInput(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'sort_order': int,
+        'type': str,
+        'code': str,
+        'disp_name': str,
+        'min': int,
+        'increment': int
+    }
+
+    attribute_map = {
+        'sort_order': 'sort_order',
+        'type': 'type',
+        'code': 'code',
+        'disp_name': 'disp_name',
+        'min': 'min',
+        'increment': 'increment'
+    }
+
+    __slots__ = (
+        '_sort_order',
+        '_type',
+        '_code',
+        '_disp_name',
+        '_min',
+        '_increment',
+    )
+
     def __init__(self, sort_order=None, type=None, code=None, disp_name=None, min=None, increment=None):  # noqa: E501
         """ParamItemInput - a model defined in OpenAPI
 
@@ -34,24 +61,6 @@ class ParamItemInput(Model):
         :param increment: The increment of this ParamItemInput.  # noqa: E501
         :type increment: int
         """
-        self.openapi_types = {
-            'sort_order': int,
-            'type': str,
-            'code': str,
-            'disp_name': str,
-            'min': int,
-            'increment': int
-        }
-
-        self.attribute_map = {
-            'sort_order': 'sort_order',
-            'type': 'type',
-            'code': 'code',
-            'disp_name': 'disp_name',
-            'min': 'min',
-            'increment': 'increment'
-        }
-
         self._sort_order = sort_order
         self._type = type
         self._code = code
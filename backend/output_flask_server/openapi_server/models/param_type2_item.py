@@ -12,6 +12,30 @@ class ParamType2Item(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'param_id': int,
+        'sort_order': int,
+        'type': str,
+        'min': int,
+        'increment': int
+    }
+
+    attribute_map = {
+        'param_id': 'param_id',
+        'sort_order': 'sort_order',
+        'type': 'type',
+        'min': 'min',
+        'increment': 'increment'
+    }
+
+    __slots__ = (
+        '_param_id',
+        '_sort_order',
+        '_type',
+        '_min',
+        '_increment',
+    )
+
     def __init__(self, param_id=None, sort_order=None, type=None, min=None, increment=None):  # noqa: E501
         """ParamType2Item - a model defined in OpenAPI
 
@@ -26,22 +50,6 @@ class ParamType2Item(Model):
         :param increment: The increment of this ParamType2Item.  # noqa: E501
         :type increment: int
         """
-        self.openapi_types = {
-            'param_id': int,
-            'sort_order': int,
-            'type': str,
-            'min': int,
-            'increment': int
-        }
-
-        self.attribute_map = {
-            'param_id': 'param_id',
-            'sort_order': 'sort_order',
-            'type': 'type',
-            'min': 'min',
-            'increment': 'increment'
-        }
-
         self._param_id = param_id
         self._sort_order = sort_order
         self._type = type
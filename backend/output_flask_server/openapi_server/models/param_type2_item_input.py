@@ -12,6 +12,27 @@ class ParamType2ItemInput(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'sort_order': int,
+        'type': str,
+        'min': int,
+        'increment': int
+    }
+
+    attribute_map = {
+        'sort_order': 'sort_order',
+        'type': 'type',
+        'min': 'min',
+        'increment': 'increment'
+    }
+
+    __slots__ = (
+        '_sort_order',
+        '_type',
+        '_min',
+        '_increment',
+    )
+
     def __init__(self, sort_order=None, type=None, min=None, increment=None):  # noqa: E501
         """ParamType2ItemInput - a model defined in OpenAPI
 
@@ -24,20 +45,6 @@ class ParamType2ItemInput(Model):
         :param increment: The increment of this ParamType2ItemInput.  # noqa: E501
         :type increment: int
         """
-        self.openapi_types = {
-            'sort_order': int,
-            'type': str,
-            'min': int,
-            'increment': int
-        }
-
-        self.attribute_map = {
-            'sort_order': 'sort_order',
-            'type': 'type',
-            'min': 'min',
-            'increment': 'increment'
-        }
-
         self._sort_order = sort_order
         self._type = type
         self._min = min
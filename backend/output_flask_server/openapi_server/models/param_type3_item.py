@@ -12,6 +12,30 @@ class ParamType3Item(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'param_id': int,
+        'sort_order': int,
+        'type': str,
+        'code': str,
+        'disp_name': str
+    }
+
+    attribute_map = {
+        'param_id': 'param_id',
+        'sort_order': 'sort_order',
+        'type': 'type',
+        'code': 'code',
+        'disp_name': 'disp_name'
+    }
+
+    __slots__ = (
+        '_param_id',
+        '_sort_order',
+        '_type',
+        '_code',
+        '_disp_name',
+    )
+
     def __init__(self, param_id=None, sort_order=None, type=None, code=None, disp_name=None):  # noqa: E501
         """ParamType3Item - a model defined in OpenAPI
 
@@ -26,22 +50,6 @@ class ParamType3Item(Model):
         :param disp_name: The disp_name of this ParamType3Item.  # noqa: E501
         :type disp_name: str
         """
-        self.openapi_types = {
-            'param_id': int,
-            'sort_order': int,
-            'type': str,
-            'code': str,
-            'disp_name': str
-        }
-
-        self.attribute_map = {
-            'param_id': 'param_id',
-            'sort_order': 'sort_order',
-            'type': 'type',
-            'code': 'code',
-            'disp_name': 'disp_name'
-        }
-
         self._param_id = param_id
         self._sort_order = sort_order
         self._type = type
@@ -12,6 +12,27 @@ class ParamType3ItemInput(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'sort_order': int,
+        'type': str,
+        'code': str,
+        'disp_name': str
+    }
+
+    attribute_map = {
+        'sort_order': 'sort_order',
+        'type': 'type',
+        'code': 'code',
+        'disp_name': 'disp_name'
+    }
+
+    __slots__ = (
+        '_sort_order',
+        '_type',
+        '_code',
+        '_disp_name',
+    )
+
     def __init__(self, sort_order=None, type=None, code=None, disp_name=None):  # noqa: E501
         """ParamType3ItemInput - a model defined in OpenAPI
 
@@ -24,20 +45,6 @@ class ParamType3ItemInput(Model):
         :param disp_name: The disp_name of this ParamType3ItemInput.  # noqa: E501
         :type disp_name: str
         """
-        self.openapi_types = {
-            'sort_order': int,
-            'type': str,
-            'code': str,
-            'disp_name': str
-        }
-
-        self.attribute_map = {
-            'sort_order': 'sort_order',
-            'type': 'type',
-            'code': 'code',
-            'disp_name': 'disp_name'
-        }
-
         self._sort_order = sort_order
         self._type = type
         self._code = code
@@ -14,6 +14,33 @@ class Product(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'prod_id': int,
+        'prefix': str,
+        'prd_type': str,
+        'cfg_type': str,
+        'attributes': List[Attribute],
+        'sort_order': int
+    }
+
+    attribute_map = {
+        'prod_id': 'prod_id',
+        'prefix': 'prefix',
+        'prd_type': 'prd_type',
+        'cfg_type': 'cfg_type',
+        'attributes': 'attributes',
+        'sort_order': 'sort_order'
+    }
+
+    __slots__ = (
+        '_prod_id',
+        '_prefix',
+        '_prd_type',
+        '_cfg_type',
+        '_attributes',
+        '_sort_order',
+    )
+
     def __init__(self, prod_id=None, prefix=None, prd_type=None, cfg_type=None, attributes=None, sort_order=None):  # noqa: E501
         """Product - a model defined in OpenAPI
 
@@ -30,24 +57,6 @@ class Product(Model):
         :param sort_order: The sort_order of this Product.  # noqa: E501
         :type sort_order: int
         """
-        self.openapi_types = {
-            'prod_id': int,
-            'prefix': str,
-            'prd_type': str,
-            'cfg_type': str,
-            'attributes': List[Attribute],
-            'sort_order': int
-        }
-
-        self.attribute_map = {
-            'prod_id': 'prod_id',
-            'prefix': 'prefix',
-            'prd_type': 'prd_type',
-            'cfg_type': 'cfg_type',
-            'attributes': 'attributes',
-            'sort_order': 'sort_order'
-        }
-
         self._prod_id = prod_id
         self._prefix = prefix
         self._prd_type = prd_type
@@ -0,0 +1,154 @@
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from openapi_server.models.base_model import Model
+from openapi_server import util
+
+
+class ProductInput(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    openapi_types = {
+        'prefix': str,
+        'prd_type': str,
+        'cfg_type': str,
+        'sort_order': int
+    }
+
+    attribute_map = {
+        'prefix': 'prefix',
+        'prd_type': 'prd_type',
+        'cfg_type': 'cfg_type',
+        'sort_order': 'sort_order'
+    }
+
+    __slots__ = (
+        '_prefix',
+        '_prd_type',
+        '_cfg_type',
+        '_sort_order',
+    )
+
+    def __init__(self, prefix=None, prd_type=None, cfg_type=None, sort_order=None):  # noqa: E501
+        """ProductInput - a model defined in OpenAPI
+
+        :param prefix: The prefix of this ProductInput.  # noqa: E501
+        :type prefix: str
+        :param prd_type: The prd_type of this ProductInput.  # noqa: E501
+        :type prd_type: str
+        :param cfg_type: The cfg_type of this ProductInput.  # noqa: E501
+        :type cfg_type: str
+        :param sort_order: The sort_order of this ProductInput.  # noqa: E501
+        :type sort_order: int
+        """
+        self._prefix = prefix
+        self._prd_type = prd_type
+        self._cfg_type = cfg_type
+        self._sort_order = sort_order
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'ProductInput':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The ProductInput of this ProductInput.  # noqa: E501
+        :rtype: ProductInput
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def prefix(self) -> str:
+        """Gets the prefix of this ProductInput.
+
+
+        :return: The prefix of this ProductInput.
+        :rtype: str
+        """
+        return self._prefix
+
+    @prefix.setter
+    def prefix(self, prefix: str):
+        """Sets the prefix of this ProductInput.
+
+
+        :param prefix: The prefix of this ProductInput.
+        :type prefix: str
+        """
+        if prefix is None:
+            raise ValueError("Invalid value for `prefix`, must not be `None`")  # noqa: E501
+
+        self._prefix = prefix
+
+    @property
+    def prd_type(self) -> str:
+        """Gets the prd_type of this ProductInput.
+
+
+        :return: The prd_type of this ProductInput.
+        :rtype: str
+        """
+        return self._prd_type
+
+    @prd_type.setter
+    def prd_type(self, prd_type: str):
+        """Sets the prd_type of this ProductInput.
+
+
+        :param prd_type: The prd_type of this ProductInput.
+        :type prd_type: str
+        """
+        if prd_type is None:
+            raise ValueError("Invalid value for `prd_type`, must not be `None`")  # noqa: E501
+
+        self._prd_type = prd_type
+
+    @property
+    def cfg_type(self) -> str:
+        """Gets the cfg_type of this ProductInput.
+
+
+        :return: The cfg_type of this ProductInput.
+        :rtype: str
+        """
+        return self._cfg_type
+
+    @cfg_type.setter
+    def cfg_type(self, cfg_type: str):
+        """Sets the cfg_type of this ProductInput.
+
+
+        :param cfg_type: The cfg_type of this ProductInput.
+        :type cfg_type: str
+        """
+        if cfg_type is None:
+            raise ValueError("Invalid value for `cfg_type`, must not be `None`")  # noqa: E501
+
+        self._cfg_type = cfg_type
+
+    @property
+    def sort_order(self) -> int:
+        """Gets the sort_order of this ProductInput.
+
+
+        :return: The sort_order of this ProductInput.
+        :rtype: int
+        """
+        return self._sort_order
+
+    @sort_order.setter
+    def sort_order(self, sort_order: int):
+        """Sets the sort_order of this ProductInput.
+
+
+        :param sort_order: The sort_order of this ProductInput.
+        :type sort_order: int
+        """
+        if sort_order is None:
+            raise ValueError("Invalid value for `sort_order`, must not be `None`")  # noqa: E501
+
+        self._sort_order = sort_order
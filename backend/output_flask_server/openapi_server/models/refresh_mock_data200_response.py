@@ -12,20 +12,24 @@ class RefreshMockData200Response(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'message': str
+    }
+
+    attribute_map = {
+        'message': 'message'
+    }
+
+    __slots__ = (
+        '_message',
+    )
+
     def __init__(self, message=None):  # noqa: E501
         """RefreshMockData200Response - a model defined in OpenAPI
 
         :param message: The message of this RefreshMockData200Response.  # noqa: E501
         :type message: str
         """
-        self.openapi_types = {
-            'message': str
-        }
-
-        self.attribute_map = {
-            'message': 'message'
-        }
-
         self._message = message
 
     @classmethod
@@ -0,0 +1,247 @@
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from openapi_server.models.base_model import Model
+from openapi_server import util
+
+
+class SearchHit(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    openapi_types = {
+        'kind': str,
+        'prod_id': int,
+        'attribute_id': int,
+        'param_id': int,
+        'field': str,
+        'value': str,
+        'score': float
+    }
+
+    attribute_map = {
+        'kind': 'kind',
+        'prod_id': 'prod_id',
+        'attribute_id': 'attribute_id',
+        'param_id': 'param_id',
+        'field': 'field',
+        'value': 'value',
+        'score': 'score'
+    }
+
+    __slots__ = (
+        '_kind',
+        '_prod_id',
+        '_attribute_id',
+        '_param_id',
+        '_field',
+        '_value',
+        '_score',
+    )
+
+    def __init__(self, kind=None, prod_id=None, attribute_id=None, param_id=None, field=None, value=None, score=None):  # noqa: E501
+        """SearchHit - a model defined in OpenAPI
+
+        :param kind: The kind of this SearchHit.  # noqa: E501
+        :type kind: str
+        :param prod_id: The prod_id of this SearchHit.  # noqa: E501
+        :type prod_id: int
+        :param attribute_id: The attribute_id of this SearchHit.  # noqa: E501
+        :type attribute_id: int
+        :param param_id: The param_id of this SearchHit.  # noqa: E501
+        :type param_id: int
+        :param field: The field of this SearchHit.  # noqa: E501
+        :type field: str
+        :param value: The value of this SearchHit.  # noqa: E501
+        :type value: str
+        :param score: The score of this SearchHit.  # noqa: E501
+        :type score: float
+        """
+        self._kind = kind
+        self._prod_id = prod_id
+        self._attribute_id = attribute_id
+        self._param_id = param_id
+        self._field = field
+        self._value = value
+        self._score = score
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'SearchHit':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The SearchHit of this SearchHit.  # noqa: E501
+        :rtype: SearchHit
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def kind(self) -> str:
+        """Gets the kind of this SearchHit.
+
+
+        :return: The kind of this SearchHit.
+        :rtype: str
+        """
+        return self._kind
+
+    @kind.setter
+    def kind(self, kind: str):
+        """Sets the kind of this SearchHit.
+
+
+        :param kind: The kind of this SearchHit.
+        :type kind: str
+        """
+        allowed_values = ["attribute", "param"]  # noqa: E501
+        if kind not in allowed_values:
+            raise ValueError(
+                "Invalid value for `kind` ({0}), must be one of {1}"
+                .format(kind, allowed_values)
+            )
+
+        self._kind = kind
+
+    @property
+    def prod_id(self) -> int:
+        """Gets the prod_id of this SearchHit.
+
+
+        :return: The prod_id of this SearchHit.
+        :rtype: int
+        """
+        return self._prod_id
+
+    @prod_id.setter
+    def prod_id(self, prod_id: int):
+        """Sets the prod_id of this SearchHit.
+
+
+        :param prod_id: The prod_id of this SearchHit.
+        :type prod_id: int
+        """
+        if prod_id is None:
+            raise ValueError("Invalid value for `prod_id`, must not be `None`")  # noqa: E501
+
+        self._prod_id = prod_id
+
+    @property
+    def attribute_id(self) -> int:
+        """Gets the attribute_id of this SearchHit.
+
+
+        :return: The attribute_id of this SearchHit.
+        :rtype: int
+        """
+        return self._attribute_id
+
+    @attribute_id.setter
+    def attribute_id(self, attribute_id: int):
+        """Sets the attribute_id of this SearchHit.
+
+
+        :param attribute_id: The attribute_id of this SearchHit.
+        :type attribute_id: int
+        """
+        if attribute_id is None:
+            raise ValueError("Invalid value for `attribute_id`, must not be `None`")  # noqa: E501
+
+        self._attribute_id = attribute_id
+
+    @property
+    def param_id(self) -> int:
+        """Gets the param_id of this SearchHit.
+
+
+        :return: The param_id of this SearchHit.
+        :rtype: int
+        """
+        return self._param_id
+
+    @param_id.setter
+    def param_id(self, param_id: int):
+        """Sets the param_id of this SearchHit.
+
+
+        :param param_id: The param_id of this SearchHit.
+        :type param_id: int
+        """
+
+        self._param_id = param_id
+
+    @property
+    def field(self) -> str:
+        """Gets the field of this SearchHit.
+
+
+        :return: The field of this SearchHit.
+        :rtype: str
+        """
+        return self._field
+
+    @field.setter
+    def field(self, field: str):
+        """Sets the field of this SearchHit.
+
+
+        :param field: The field of this SearchHit.
+        :type field: str
+        """
+        allowed_values = ["code", "disp_name"]  # noqa: E501
+        if field not in allowed_values:
+            raise ValueError(
+                "Invalid value for `field` ({0}), must be one of {1}"
+                .format(field, allowed_values)
+            )
+
+        self._field = field
+
+    @property
+    def value(self) -> str:
+        """Gets the value of this SearchHit.
+
+
+        :return: The value of this SearchHit.
+        :rtype: str
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value: str):
+        """Sets the value of this SearchHit.
+
+
+        :param value: The value of this SearchHit.
+        :type value: str
+        """
+        if value is None:
+            raise ValueError("Invalid value for `value`, must not be `None`")  # noqa: E501
+
+        self._value = value
+
+    @property
+    def score(self) -> float:
+        """Gets the score of this SearchHit.
+
+
+        :return: The score of this SearchHit.
+        :rtype: float
+        """
+        return self._score
+
+    @score.setter
+    def score(self, score: float):
+        """Sets the score of this SearchHit.
+
+
+        :param score: The score of this SearchHit.
+        :type score: float
+        """
+        if score is None:
+            raise ValueError("Invalid value for `score`, must not be `None`")  # noqa: E501
+
+        self._score = score
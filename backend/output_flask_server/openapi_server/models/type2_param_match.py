@@ -0,0 +1,127 @@
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from openapi_server.models.base_model import Model
+from openapi_server.models.param_type2_item import ParamType2Item
+from openapi_server import util
+
+from openapi_server.models.param_type2_item import ParamType2Item  # noqa: E501
+
+class Type2ParamMatch(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    openapi_types = {
+        'prod_id': int,
+        'attribute_id': int,
+        'param': ParamType2Item
+    }
+
+    attribute_map = {
+        'prod_id': 'prod_id',
+        'attribute_id': 'attribute_id',
+        'param': 'param'
+    }
+
+    __slots__ = (
+        '_prod_id',
+        '_attribute_id',
+        '_param',
+    )
+
+    def __init__(self, prod_id=None, attribute_id=None, param=None):  # noqa: E501
+        """Type2ParamMatch - a model defined in OpenAPI
+
+        :param prod_id: The prod_id of this Type2ParamMatch.  # noqa: E501
+        :type prod_id: int
+        :param attribute_id: The attribute_id of this Type2ParamMatch.  # noqa: E501
+        :type attribute_id: int
+        :param param: The param of this Type2ParamMatch.  # noqa: E501
+        :type param: ParamType2Item
+        """
+        self._prod_id = prod_id
+        self._attribute_id = attribute_id
+        self._param = param
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'Type2ParamMatch':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The Type2ParamMatch of this Type2ParamMatch.  # noqa: E501
+        :rtype: Type2ParamMatch
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def prod_id(self) -> int:
+        """Gets the prod_id of this Type2ParamMatch.
+
+
+        :return: The prod_id of this Type2ParamMatch.
+        :rtype: int
+        """
+        return self._prod_id
+
+    @prod_id.setter
+    def prod_id(self, prod_id: int):
+        """Sets the prod_id of this Type2ParamMatch.
+
+
+        :param prod_id: The prod_id of this Type2ParamMatch.
+        :type prod_id: int
+        """
+        if prod_id is None:
+            raise ValueError("Invalid value for `prod_id`, must not be `None`")  # noqa: E501
+
+        self._prod_id = prod_id
+
+    @property
+    def attribute_id(self) -> int:
+        """Gets the attribute_id of this Type2ParamMatch.
+
+
+        :return: The attribute_id of this Type2ParamMatch.
+        :rtype: int
+        """
+        return self._attribute_id
+
+    @attribute_id.setter
+    def attribute_id(self, attribute_id: int):
+        """Sets the attribute_id of this Type2ParamMatch.
+
+
+        :param attribute_id: The attribute_id of this Type2ParamMatch.
+        :type attribute_id: int
+        """
+        if attribute_id is None:
+            raise ValueError("Invalid value for `attribute_id`, must not be `None`")  # noqa: E501
+
+        self._attribute_id = attribute_id
+
+    @property
+    def param(self) -> ParamType2Item:
+        """Gets the param of this Type2ParamMatch.
+
+
+        :return: The param of this Type2ParamMatch.
+        :rtype: ParamType2Item
+        """
+        return self._param
+
+    @param.setter
+    def param(self, param: ParamType2Item):
+        """Sets the param of this Type2ParamMatch.
+
+
+        :param param: The param of this Type2ParamMatch.
+        :type param: ParamType2Item
+        """
+        if param is None:
+            raise ValueError("Invalid value for `param`, must not be `None`")  # noqa: E501
+
+        self._param = param
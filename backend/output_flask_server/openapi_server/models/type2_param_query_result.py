@@ -0,0 +1,156 @@
+from datetime import date, datetime  # noqa: F401
+
+from typing import List, Dict  # noqa: F401
+
+from openapi_server.models.base_model import Model
+from openapi_server.models.type2_param_match import Type2ParamMatch
+from openapi_server import util
+
+from openapi_server.models.type2_param_match import Type2ParamMatch  # noqa: E501
+
+class Type2ParamQueryResult(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    openapi_types = {
+        'total': int,
+        'offset': int,
+        'limit': int,
+        'items': List[Type2ParamMatch]
+    }
+
+    attribute_map = {
+        'total': 'total',
+        'offset': 'offset',
+        'limit': 'limit',
+        'items': 'items'
+    }
+
+    __slots__ = (
+        '_total',
+        '_offset',
+        '_limit',
+        '_items',
+    )
+
+    def __init__(self, total=None, offset=None, limit=None, items=None):  # noqa: E501
+        """Type2ParamQueryResult - a model defined in OpenAPI
+
+        :param total: The total of this Type2ParamQueryResult.  # noqa: E501
+        :type total: int
+        :param offset: The offset of this Type2ParamQueryResult.  # noqa: E501
+        :type offset: int
+        :param limit: The limit of this Type2ParamQueryResult.  # noqa: E501
+        :type limit: int
+        :param items: The items of this Type2ParamQueryResult.  # noqa: E501
+        :type items: List[Type2ParamMatch]
+        """
+        self._total = total
+        self._offset = offset
+        self._limit = limit
+        self._items = items
+
+    @classmethod
+    def from_dict(cls, dikt) -> 'Type2ParamQueryResult':
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The Type2ParamQueryResult of this Type2ParamQueryResult.  # noqa: E501
+        :rtype: Type2ParamQueryResult
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def total(self) -> int:
+        """Gets the total of this Type2ParamQueryResult.
+
+
+        :return: The total of this Type2ParamQueryResult.
+        :rtype: int
+        """
+        return self._total
+
+    @total.setter
+    def total(self, total: int):
+        """Sets the total of this Type2ParamQueryResult.
+
+
+        :param total: The total of this Type2ParamQueryResult.
+        :type total: int
+        """
+        if total is None:
+            raise ValueError("Invalid value for `total`, must not be `None`")  # noqa: E501
+
+        self._total = total
+
+    @property
+    def offset(self) -> int:
+        """Gets the offset of this Type2ParamQueryResult.
+
+
+        :return: The offset of this Type2ParamQueryResult.
+        :rtype: int
+        """
+        return self._offset
+
+    @offset.setter
+    def offset(self, offset: int):
+        """Sets the offset of this Type2ParamQueryResult.
+
+
+        :param offset: The offset of this Type2ParamQueryResult.
+        :type offset: int
+        """
+        if offset is None:
+            raise ValueError("Invalid value for `offset`, must not be `None`")  # noqa: E501
+
+        self._offset = offset
+
+    @property
+    def limit(self) -> int:
+        """Gets the limit of this Type2ParamQueryResult.
+
+
+        :return: The limit of this Type2ParamQueryResult.
+        :rtype: int
+        """
+        return self._limit
+
+    @limit.setter
+    def limit(self, limit: int):
+        """Sets the limit of this Type2ParamQueryResult.
+
+
+        :param limit: The limit of this Type2ParamQueryResult.
+        :type limit: int
+        """
+        if limit is None:
+            raise ValueError("Invalid value for `limit`, must not be `None`")  # noqa: E501
+
+        self._limit = limit
+
+    @property
+    def items(self) -> List[Type2ParamMatch]:
+        """Gets the items of this Type2ParamQueryResult.
+
+
+        :return: The items of this Type2ParamQueryResult.
+        :rtype: List[Type2ParamMatch]
+        """
+        return self._items
+
+    @items.setter
+    def items(self, items: List[Type2ParamMatch]):
+        """Sets the items of this Type2ParamQueryResult.
+
+
+        :param items: The items of this Type2ParamQueryResult.
+        :type items: List[Type2ParamMatch]
+        """
+        if items is None:
+            raise ValueError("Invalid value for `items`, must not be `None`")  # noqa: E501
+
+        self._items = items
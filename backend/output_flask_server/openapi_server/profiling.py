@@ -0,0 +1,168 @@
+# profiling.py
+"""
+単一リクエストを cProfile でプロファイルする、オプトインの仕組み。
+
+- ヘッダー X-Profile に PROFILE_TOKEN と同じ値を付けたリクエスト、または
+  PROFILE_ALL_REQUESTS が有効なときの全リクエストが対象です。
+- 結果は openapi_server のモジュール単位に集計し、レスポンスヘッダー
+  X-Profile-Id の ID で GET /admin/profiles/<id> から取得できます
+  (同じトークンが必要)。PROFILE_DIR を指定すると .prof ファイルも保存します。
+
+プロファイラーはプロセスに同時に1つしか有効にできない (Python 3.12 以降の cProfile は
+プロセス全体の sys.monitoring を使う) ため、プロファイル中のリクエストがあるあいだに
+届いたリクエストはプロファイルせずに処理します (X-Profile-Id は付きません)。
+
+どちらの設定も無効な場合はフックを登録しないため、通常のリクエストには
+一切コストがかかりません。
+"""
+import collections
+import cProfile
+import hmac
+import os
+import pstats
+import threading
+import uuid
+
+from flask import abort, g, jsonify, request
+
+import openapi_server
+
+HEADER = "X-Profile"
+ID_HEADER = "X-Profile-Id"
+
+# 保持するプロファイル結果の数
+MAX_PROFILES = 50
+
+# プロファイル中のリクエストがあるあいだ保持する (同時に1つだけプロファイルする)
+_ACTIVE = threading.Lock()
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(openapi_server.__file__))
+_PACKAGE_ROOT = os.path.dirname(_PACKAGE_DIR)
+
+
+def authorized(token):
+    """リクエストのヘッダー X-Profile が token と一致するか (token が空なら常に False)。
+
+    /admin 以下の管理用のエンドポイントはこのトークンで保護します。
+    """
+    value = request.headers.get(HEADER)
+    return bool(token) and value is not None and hmac.compare_digest(value, token)
+
+
+def module_for(filename):
+    """関数のファイル名を、集計に使うモジュール名に変換します。"""
+    if filename.startswith("~") or filename.startswith("<"):
+        return "builtins"
+    path = os.path.abspath(filename)
+    if path.startswith(_PACKAGE_DIR + os.sep):
+        relative = os.path.relpath(path, _PACKAGE_ROOT)
+        module = os.path.splitext(relative)[0].replace(os.sep, ".")
+        return module[: -len(".__init__")] if module.endswith(".__init__") else module
+    # openapi_server 以外は site-packages 直下のパッケージ単位でまとめる
+    parts = path.split(os.sep)
+    if "site-packages" in parts:
+        return "other:" + parts[parts.index("site-packages") + 1].split(".")[0]
+    return "other:stdlib"
+
+
+def group_stats(stats, top=5):
+    """pstats.Stats をモジュール毎の自己時間・呼び出し回数・上位関数に集計します。
+
+    JSON にしても順序が変わらないよう、自己時間の長い順のリストで返します。
+    """
+    modules = {}
+    for (filename, lineno, funcname), (cc, nc, tt, ct, _) in stats.stats.items():
+        module = module_for(filename)
+        entry = modules.setdefault(
+            module, {"module": module, "tottime": 0.0, "calls": 0, "functions": []}
+        )
+        entry["tottime"] += tt
+        entry["calls"] += nc
+        entry["functions"].append(
+            {"function": f"{funcname}:{lineno}", "calls": nc, "tottime": tt, "cumtime": ct}
+        )
+    for entry in modules.values():
+        entry["functions"].sort(key=lambda f: f["tottime"], reverse=True)
+        del entry["functions"][top:]
+    return sorted(modules.values(), key=lambda entry: entry["tottime"], reverse=True)
+
+
+class Profiler:
+    def __init__(self, app=None):
+        self.profiles = collections.OrderedDict()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.token = app.config.get("PROFILE_TOKEN", "")
+        self.profile_all = app.config.get("PROFILE_ALL_REQUESTS", False)
+        self.directory = app.config.get("PROFILE_DIR", "")
+        app.extensions["profiler"] = self
+        if not (self.token or self.profile_all):
+            return
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        # 例外で after_request が呼ばれなかった場合も、プロファイラーを止めてロックを返す
+        app.teardown_request(lambda exc: self._stop())
+        app.add_url_rule("/admin/profiles/<profile_id>", "profile", self._get_profile)
+
+    def _authorized(self):
+        return authorized(self.token)
+
+    def _before_request(self):
+        if request.endpoint == "profile" or not (self.profile_all or self._authorized()):
+            return
+        if not _ACTIVE.acquire(blocking=False):
+            return  # 他のリクエストをプロファイル中
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # 他のプロファイラー (プロセス外から有効にしたものなど) が動いている
+            _ACTIVE.release()
+            return
+        g.profiler = profiler
+
+    def _stop(self):
+        """このリクエストのプロファイラーを止めて返します (プロファイルしていなければ None)。"""
+        profiler = g.pop("profiler", None)
+        if profiler is not None:
+            try:
+                profiler.disable()
+            finally:
+                _ACTIVE.release()
+        return profiler
+
+    def _after_request(self, response):
+        profiler = self._stop()
+        if profiler is None:
+            return response
+        profile_id = uuid.uuid4().hex[:16]
+        stats = pstats.Stats(profiler)
+        self.profiles[profile_id] = {
+            "id": profile_id,
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "total_time": stats.total_tt,
+            "modules": group_stats(stats),
+        }
+        while len(self.profiles) > MAX_PROFILES:
+            self.profiles.popitem(last=False)
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            stats.dump_stats(os.path.join(self.directory, profile_id + ".prof"))
+        response.headers[ID_HEADER] = profile_id
+        return response
+
+    def _get_profile(self, profile_id):
+        if not self._authorized():
+            abort(403)
+        profile = self.profiles.get(profile_id)
+        if profile is None:
+            return jsonify({"message": "Profile not found"}), 404
+        return jsonify(profile)
+
+
+def init_app(app):
+    return Profiler(app)
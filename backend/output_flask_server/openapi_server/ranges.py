@@ -0,0 +1,100 @@
+# ranges.py
+"""
+type2 の param の min / increment の範囲検索 (GET /params/type2)。
+
+RangeIndex は (値, キー) のタプルのソート済みの配列です。
+
+- 範囲 [low, high] に入る要素は配列上で連続するので、両端を bisect で
+  探して切り出すだけで取り出せます (O(log n + k))。件数は両端の位置の差です。
+- 上位・下位 k 件は配列の端から切り出すだけです。
+- 各キーの現在の値を別の dict に持っているので、変更・削除のときに
+  呼び出し側が元の値を渡す必要はありません。
+- 1件ずつの追加は bisect.insort で配列に挿入します。ストアの読み込みや
+  インポートのように多数を追加するときは bulk() の中で追加すると、追加分を
+  まとめておいて最後に1回だけソートします (1件ずつ挿入すると O(n^2) になる)。
+
+ストアとの同期は controllers/data.py の index_param などが行います。
+"""
+import bisect
+import contextlib
+
+# 索引を作る type2 の param のフィールド (どちらも整数)
+FIELDS = ("min", "increment")
+
+
+class RangeIndex:
+    """整数の値の範囲検索のための、ソート済みの配列による索引。"""
+
+    def __init__(self):
+        self._entries = []  # (値, キー) のソート済みリスト
+        self._values = {}  # キー -> (値, 要素)
+        self._pending = None  # bulk() の中で追加したキー -> 値 (配列にはまだ入れていない)
+
+    def __len__(self):
+        return len(self._values)
+
+    def add(self, key, value, item):
+        """要素 item をキー key と値 value で (再) 登録します。value が None なら削除だけ行います。"""
+        current = self._values.get(key)
+        if current is not None and current[0] == value:
+            self._values[key] = (value, item)
+            return
+        self.remove(key)
+        if value is None:
+            return
+        self._values[key] = (value, item)
+        if self._pending is not None:
+            self._pending[key] = value
+        else:
+            bisect.insort(self._entries, (value, key))
+
+    def remove(self, key):
+        current = self._values.pop(key, None)
+        if current is None:
+            return
+        if self._pending is not None and self._pending.pop(key, None) is not None:
+            return
+        entry = (current[0], key)
+        i = bisect.bisect_left(self._entries, entry)
+        if i < len(self._entries) and self._entries[i] == entry:
+            del self._entries[i]
+
+    def memory_parts(self):
+        """メモリ使用量の見積もり (memory.py) に使う内部のコンテナ。"""
+        return {"entries": self._entries, "values": self._values}
+
+    @contextlib.contextmanager
+    def bulk(self):
+        """この中での add をまとめ、抜けるときに配列に加えて1回だけソートします。
+
+        既存の配列と追加分はそれぞれソート済みの並びになるので、ソートは
+        ほぼ2つの並びのマージで済みます (O(n + k log k))。
+        """
+        if self._pending is not None:
+            yield
+            return
+        self._pending = {}
+        try:
+            yield
+        finally:
+            pending, self._pending = self._pending, None
+            if pending:
+                self._entries.extend((value, key) for key, value in pending.items())
+                self._entries.sort()
+
+    def query(self, low=None, high=None, descending=False, offset=0, limit=50):
+        """値が low 以上 high 以下の要素を数え、値の順に offset から limit 件返します。
+
+        low / high が None ならその側は無制限です。同じ値の要素はキーの順
+        (descending なら逆順) に並びます。(一致した数, [(キー, 値, 要素), ...]) を返します。
+        """
+        start = 0 if low is None else bisect.bisect_left(self._entries, (low,))
+        end = len(self._entries) if high is None else bisect.bisect_left(self._entries, (high + 1,))
+        total = max(end - start, 0)
+        if descending:
+            stop = max(end - offset, start)
+            entries = self._entries[max(stop - limit, start):stop][::-1]
+        else:
+            first = start + offset
+            entries = self._entries[first:min(first + limit, end)] if first < end else []
+        return total, [(key, value, self._values[key][1]) for value, key in entries]
@@ -0,0 +1,202 @@
+# search.py
+"""
+attribute と param の code / disp_name の全文検索 (GET /search)。
+
+NgramIndex は文字 2-gram の転置索引です。
+
+- 文字列は NFKC で正規化して casefold します (全角英数字・半角カナも同じ文字になる)。
+- 文字列の末尾には END を付けてから 2-gram に分けるので、どの文字もそれで始まる
+  2-gram を持ちます。1文字のクエリは、その文字で始まる 2-gram の転置リストの
+  和集合で答えます (1-gram の転置リストは持たない)。
+- 文書のキーは (prod_id, attribute_id, param_id, field) で、attribute 自身の
+  フィールドは param_id を None にします。
+- 追加・削除は文書の 2-gram の数に比例する時間で済みます (削除に必要な
+  正規化済みの文字列は索引が持っているので、呼び出し側は元の値を渡さなくてよい)。
+  ストアの読み込みやインポートでは bulk() の中で追加し、転置リストをまとめて作ります。
+- 検索はクエリの 2-gram の転置リストを短い順に積集合して候補を絞り、
+  正規化した文字列にクエリが実際に含まれるものだけを返します。
+
+ストアとの同期は controllers/data.py の index_attribute などが行います。
+"""
+import collections
+import contextlib
+import heapq
+import unicodedata
+
+FIELDS = ("code", "disp_name")
+GRAM = 2
+# 文字列の末尾の印 (正規化した文字列には現れない制御文字)
+END = "\x00"
+
+
+def normalize(text):
+    """検索用に text を正規化します (NFKC + casefold)。"""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def ngrams(text):
+    """末尾に END を付けた text の 2-gram の集合を返します (text の各文字で始まる 2-gram)。"""
+    text += END
+    return {text[i:i + GRAM] for i in range(len(text) - 1)}
+
+
+def _query_grams(query):
+    """候補を絞るのに使うクエリの 2-gram (1文字のクエリでは空)。"""
+    return {query[i:i + GRAM] for i in range(len(query) - GRAM + 1)}
+
+
+def score(query, text):
+    """正規化済みの text に対する query の一致度 (大きいほど上位)。
+
+    text に占める query の割合に、前方一致なら 0.5 を加えます (完全一致は 1.5)。
+    """
+    return len(query) / len(text) + (0.5 if text.startswith(query) else 0.0)
+
+
+class NgramIndex:
+    """code / disp_name の n-gram 転置索引。"""
+
+    def __init__(self):
+        self._postings = {}  # 2-gram -> 文書キーの集合
+        self._first = {}  # 文字 -> その文字で始まる 2-gram の集合 (1文字のクエリ用)
+        self._documents = {}  # 文書キー -> (正規化した文字列, 元の文字列)
+        self._pending = None  # bulk() の中で追加した文書キー (転置リストにはまだ入れていない)
+
+    def __len__(self):
+        return len(self._documents)
+
+    def add(self, key, value):
+        """文書 key を value で (再) 登録します。value が空文字列や None なら削除だけ行います。"""
+        self.remove(key)
+        if not value:
+            return
+        text = normalize(value)
+        if not text:
+            return
+        self._documents[key] = (text, value)
+        if self._pending is not None:
+            self._pending.append(key)
+            return
+        for gram in ngrams(text):
+            keys = self._postings.get(gram)
+            if keys is None:
+                keys = self._postings[gram] = set()
+                self._first.setdefault(gram[0], set()).add(gram)
+            keys.add(key)
+
+    def remove(self, key):
+        entry = self._documents.pop(key, None)
+        if entry is None:
+            return
+        for gram in ngrams(entry[0]):
+            keys = self._postings.get(gram)
+            if keys is None:
+                continue  # bulk() の中で追加した文書
+            keys.discard(key)
+            if not keys:
+                del self._postings[gram]
+                grams = self._first[gram[0]]
+                grams.discard(gram)
+                if not grams:
+                    del self._first[gram[0]]
+
+    def memory_parts(self):
+        """メモリ使用量の見積もり (memory.py) に使う内部のコンテナ。"""
+        return {"postings": self._postings, "first": self._first, "documents": self._documents}
+
+    @contextlib.contextmanager
+    def bulk(self):
+        """この中での add をまとめ、抜けるときに 2-gram ごとの転置リストを一度に作ります。"""
+        if self._pending is not None:
+            yield
+            return
+        self._pending = []
+        try:
+            yield
+        finally:
+            pending, self._pending = self._pending, None
+            self._build(pending)
+
+    def _build(self, keys):
+        documents = self._documents
+        lists = collections.defaultdict(list)
+        for key in keys:
+            entry = documents.get(key)
+            # bulk() の中で追加した後に削除された文書は登録しない
+            # (再登録された文書はキーが2回現れるが、集合にするので1つになる)
+            if entry is None:
+                continue
+            for gram in ngrams(entry[0]):
+                lists[gram].append(key)
+        for gram, new_keys in lists.items():
+            keys = self._postings.get(gram)
+            if keys is None:
+                self._postings[gram] = set(new_keys)
+                self._first.setdefault(gram[0], set()).add(gram)
+            else:
+                keys.update(new_keys)
+
+    def _candidates(self, query):
+        """query を含み得る文書キーの集合を返します (呼び出し側で実際に含むか確かめる)。"""
+        if len(query) < GRAM:
+            candidates = set()
+            for gram in self._first.get(query, ()):
+                candidates |= self._postings[gram]
+            return candidates
+        postings = []
+        for gram in _query_grams(query):
+            keys = self._postings.get(gram)
+            if not keys:
+                return set()
+            postings.append(keys)
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def search(self, query, limit=20, kind=None):
+        """query を含む attribute / param を一致度の高い順に最大 limit 件返します。
+
+        同じ attribute / param の複数のフィールドが一致したときは、一致度の
+        高い方を1件だけ返します。kind ("attribute" / "param") で絞り込めます。
+        """
+        query = normalize(query)
+        if not query:
+            return []
+        candidates = self._candidates(query)
+
+        best = {}
+        for key in candidates:
+            prod_id, attribute_id, param_id, field = key
+            if kind is not None and (param_id is None) != (kind == "attribute"):
+                continue
+            text, value = self._documents[key]
+            if query not in text:
+                continue
+            hit_score = score(query, text)
+            entity = (prod_id, attribute_id, param_id)
+            # 同点なら FIELDS の順 (code を優先)
+            if entity not in best or (hit_score, field == FIELDS[0]) > (
+                best[entity][0], best[entity][1] == FIELDS[0]
+            ):
+                best[entity] = (hit_score, field, value)
+
+        ranked = heapq.nsmallest(limit, best.items(), key=_rank_key)
+        hits = []
+        for (prod_id, attribute_id, param_id), (hit_score, field, value) in ranked:
+            hit = {
+                "kind": "attribute" if param_id is None else "param",
+                "prod_id": prod_id,
+                "attribute_id": attribute_id,
+                "field": field,
+                "value": value,
+                "score": round(hit_score, 4),
+            }
+            if param_id is not None:
+                hit["param_id"] = param_id
+            hits.append(hit)
+        return hits
+
+
+def _rank_key(item):
+    # 一致度の高い順、同点なら ID 順 (attribute はその param より前)
+    (prod_id, attribute_id, param_id), (hit_score, _, _) = item
+    return -hit_score, prod_id, attribute_id, -1 if param_id is None else param_id
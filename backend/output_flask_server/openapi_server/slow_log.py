@@ -0,0 +1,113 @@
+# slow_log.py
+"""
+しきい値を超えたリクエストを構造化 JSON Lines で記録します。
+
+instrumentation のリスナーとして動作し、リクエストスレッドでは判定と
+dict の作成・キューへの投入だけを行います。JSON への変換と書き込みは
+QueueListener のスレッドで行われます。
+
+1行の例:
+    {"ts": "...", "operation_id": "list_products", "method": "GET",
+     "path": "/api/products", "path_params": {}, "status": 200,
+     "duration_ms": 812.4, "phases_ms": {"validation": 0.4, "controller": 3.1,
+     "from_dict": 402.0, "serialization": 406.9}, "request_bytes": 0,
+     "response_bytes": 10485760, "store": {"products": 5000}}
+"""
+import atexit
+import datetime
+import json
+import logging
+import logging.handlers
+import queue
+
+from openapi_server.controllers import data
+
+LOGGER_NAME = "openapi_server.slow_requests"
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """レコードを整形せずにキューへ入れる QueueHandler (整形は書き込みスレッドで行う)。"""
+
+    def prepare(self, record):
+        return record
+
+
+class JSONLineFormatter(logging.Formatter):
+    def format(self, record):
+        return json.dumps(record.msg, ensure_ascii=False, separators=(",", ":"))
+
+
+def _live_count(items, has_tombstones):
+    if not has_tombstones:
+        return len(items)
+    return sum(1 for item in items if data.DELETED not in item)
+
+
+def touched_store_sizes(path_params):
+    """リクエストが触れたストアの範囲の大きさ (削除済みのものは数えない) を返します。
+
+    tombstone のない product はリストの長さをそのまま使い、attribute は ID の索引から引きます。
+    """
+    products = data.DB.get("products", {})
+    sizes = {"products": len(products)}
+    product_id = path_params.get("productId")
+    product = products.get(product_id)
+    if product is not None:
+        has_tombstones = product_id in data.DB["tombstones"]
+        sizes["attributes"] = _live_count(product.get("attributes", []), has_tombstones)
+        attribute_id = path_params.get("attributeId")
+        if attribute_id is not None:
+            attribute = data.find_attribute(product_id, attribute_id)
+            if attribute is not None:
+                sizes["params"] = _live_count(attribute.get("params", []), has_tombstones)
+    return sizes
+
+
+class SlowRequestLog:
+    def __init__(self, threshold_ms, handler):
+        self.threshold = threshold_ms / 1000.0
+        handler.setFormatter(JSONLineFormatter())
+        self._queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(self._queue, handler)
+        self.logger = logging.Logger(LOGGER_NAME)
+        self.logger.addHandler(_DeferredQueueHandler(self._queue))
+        self._listener.start()
+        atexit.register(self.close)
+
+    def observe(self, record):
+        """instrumentation のリスナー。"""
+        if record.duration < self.threshold:
+            return
+        self.logger.warning({
+            "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "operation_id": record.operation_id,
+            "method": record.method,
+            "path": record.path,
+            "path_params": record.path_params,
+            "status": record.status,
+            "duration_ms": record.duration * 1000.0,
+            "phases_ms": {k: v * 1000.0 for k, v in record.phases.items()},
+            "request_bytes": record.request_bytes,
+            "response_bytes": record.response_bytes,
+            "store": touched_store_sizes(record.path_params),
+        })
+
+    def close(self):
+        """キューに残ったレコードを書き出してから書き込みスレッドを停止します。"""
+        atexit.unregister(self.close)
+        if self._listener._thread is not None:
+            self._listener.stop()
+
+
+def init_app(app, handler=None):
+    """SLOW_REQUEST_THRESHOLD_MS が 0 以上なら、遅いリクエストのログを有効にします。"""
+    threshold_ms = app.config.get("SLOW_REQUEST_THRESHOLD_MS", -1)
+    if threshold_ms < 0:
+        return None
+    if handler is None:
+        path = app.config.get("SLOW_REQUEST_LOG", "")
+        handler = logging.FileHandler(path, encoding="utf-8") if path else logging.StreamHandler()
+    slow_log = SlowRequestLog(threshold_ms, handler)
+    app.extensions["slow_log"] = slow_log
+    app.extensions["instrumentation"].add_listener(slow_log.observe)
+    return slow_log
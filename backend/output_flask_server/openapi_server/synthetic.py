@@ -0,0 +1,206 @@
+# synthetic.py
+"""
+openapi.yaml のスキーマから、任意の規模の合成カタログを生成します。
+
+ライブラリとしては CatalogGenerator を、CLI としては
+
+    python -m openapi_server.synthetic --products 100000 --attributes 5-20 \\
+        --params 0-10 --seed 42 --format ndjson --output catalog.ndjson
+
+のように使います。出力は product 単位 (ndjson では1レコード単位) で
+逐次書き出すため、メモリに収まらない規模のカタログも生成できます。
+
+- json:   list_products と同じ形の、ネストした product の配列
+- ndjson: 1行1レコードのフラット形式
+          {"kind": "product", "prod_id": ..., ...}
+          {"kind": "attribute", "prod_id": ..., "attribute_id": ..., ...}
+          {"kind": "param", "prod_id": ..., "attribute_id": ..., "param_id": ..., ...}
+
+param の type は、親 attribute の contract から
+_get_expected_param_type_from_contract で決定します。
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+import yaml
+
+from openapi_server.controllers.parameters_controller import (
+    _get_expected_param_type_from_contract,
+)
+
+DEFAULT_SPEC_PATH = os.path.join(os.path.dirname(__file__), "openapi", "openapi.yaml")
+
+# contract はスキーマ上ただの string なので、実データで使われる値から選ぶ
+CONTRACTS = ["type1", "type2", "type3", ""]
+
+_ID_FIELDS = {"prod_id", "attribute_id", "param_id"}
+
+
+def load_schemas(spec_path=None):
+    """仕様ファイルの components/schemas を返します。"""
+    with open(spec_path or DEFAULT_SPEC_PATH, encoding="utf-8") as f:
+        spec = yaml.safe_load(f)
+    return spec["components"]["schemas"]
+
+
+def _resolve(schemas, schema):
+    """$ref と allOf を展開し、properties/required をまとめたスキーマを返します。"""
+    if "$ref" in schema:
+        return _resolve(schemas, schemas[schema["$ref"].rsplit("/", 1)[-1]])
+    if "allOf" in schema:
+        merged = {"properties": {}, "required": []}
+        for part in schema["allOf"]:
+            resolved = _resolve(schemas, part)
+            merged["properties"].update(resolved.get("properties", {}))
+            merged["required"] += resolved.get("required", [])
+        return merged
+    return schema
+
+
+def _fields(schemas, name, exclude=()):
+    """スキーマ name のプロパティを (名前, スキーマ) のリストで返します (配列は除く)。"""
+    properties = _resolve(schemas, schemas[name])["properties"]
+    return [
+        (field, prop)
+        for field, prop in properties.items()
+        if field not in exclude and prop.get("type") != "array"
+    ]
+
+
+def _parse_range(value):
+    """5 や '5-20' を (下限, 上限) に変換します。"""
+    lo, _, hi = str(value).partition("-")
+    lo = int(lo)
+    hi = int(hi) if hi else lo
+    if lo < 0 or hi < lo:
+        raise ValueError(f"invalid range: {value}")
+    return lo, hi
+
+
+class CatalogGenerator:
+    """スキーマに従った product/attribute/param を決定的に生成します。"""
+
+    def __init__(self, seed=None, attributes=(5, 5), params=(3, 3), spec_path=None):
+        schemas = load_schemas(spec_path)
+        self._rng = random.Random(seed)
+        self._attributes = attributes if isinstance(attributes, tuple) else _parse_range(attributes)
+        self._params = params if isinstance(params, tuple) else _parse_range(params)
+        self._product_fields = _fields(schemas, "Product")
+        self._attribute_fields = _fields(schemas, "Attribute")
+        mapping = schemas["ParamItem"]["discriminator"]["mapping"]
+        self._param_fields = {
+            param_type: _fields(schemas, ref.rsplit("/", 1)[-1])
+            for param_type, ref in mapping.items()
+        }
+
+    def _value(self, field, prop, index, serial):
+        rng = self._rng
+        if field in _ID_FIELDS or field == "sort_order":
+            return index
+        if field == "contract":
+            return rng.choice(CONTRACTS)
+        if "enum" in prop:
+            return rng.choice(prop["enum"])
+        kind = prop.get("type")
+        if kind == "integer":
+            return rng.randint(1, 1000)
+        if kind == "boolean":
+            return rng.random() < 0.5
+        if field == "disp_name":
+            return f"表示名{serial}"
+        return f"{field}{serial}"
+
+    def _build(self, fields, index, serial):
+        return {field: self._value(field, prop, index, serial) for field, prop in fields}
+
+    def _count(self, bounds):
+        lo, hi = bounds
+        return lo if lo == hi else self._rng.randint(lo, hi)
+
+    def iter_records(self, count, start_id=0):
+        """count 個の product をフラットなレコードとして逐次 yield します。"""
+        for pid in range(start_id, start_id + count):
+            yield {"kind": "product", **self._build(self._product_fields, pid, pid)}
+            for aid in range(self._count(self._attributes)):
+                serial = f"{pid}_{aid}"
+                attribute = self._build(self._attribute_fields, aid, serial)
+                yield {"kind": "attribute", "prod_id": pid, **attribute}
+                param_type = _get_expected_param_type_from_contract(attribute["contract"])
+                fields = self._param_fields[param_type]
+                for param_id in range(self._count(self._params)):
+                    param = self._build(fields, param_id, f"{serial}_{param_id}")
+                    param["type"] = param_type
+                    yield {"kind": "param", "prod_id": pid, "attribute_id": aid, **param}
+
+    def iter_products(self, count, start_id=0):
+        """count 個の product を、attributes/params を含むネストした dict で逐次 yield します。
+
+        同じ seed なら iter_records と同じ内容になります。
+        """
+        product = None
+        for record in self.iter_records(count, start_id):
+            kind = record.pop("kind")
+            if kind == "product":
+                if product is not None:
+                    yield product
+                product = dict(record, attributes=[])
+            elif kind == "attribute":
+                del record["prod_id"]
+                product["attributes"].append(dict(record, params=[]))
+            else:
+                del record["prod_id"], record["attribute_id"]
+                product["attributes"][-1]["params"].append(record)
+        if product is not None:
+            yield product
+
+
+def write_ndjson(records, fp):
+    for record in records:
+        fp.write(json.dumps(record, ensure_ascii=False))
+        fp.write("\n")
+
+
+def write_json(products, fp):
+    fp.write("[")
+    for i, product in enumerate(products):
+        if i:
+            fp.write(",\n")
+        json.dump(product, fp, ensure_ascii=False)
+    fp.write("]\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="openapi.yaml のスキーマから合成カタログを生成します。")
+    parser.add_argument("--products", type=int, default=10)
+    parser.add_argument("--attributes", default="5", help="product あたりの attribute 数 (N または MIN-MAX)")
+    parser.add_argument("--params", default="3", help="attribute あたりの param 数 (N または MIN-MAX)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start-id", type=int, default=0, help="最初の prod_id")
+    parser.add_argument("--format", choices=("ndjson", "json"), default="ndjson")
+    parser.add_argument("--spec", help="openapi.yaml のパス (省略時はパッケージ同梱のもの)")
+    parser.add_argument("--output", help="出力先 (省略時は標準出力)")
+    args = parser.parse_args(argv)
+
+    try:
+        generator = CatalogGenerator(
+            seed=args.seed, attributes=args.attributes, params=args.params, spec_path=args.spec
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    fp = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        if args.format == "ndjson":
+            write_ndjson(generator.iter_records(args.products, args.start_id), fp)
+        else:
+            write_json(generator.iter_products(args.products, args.start_id), fp)
+    finally:
+        if fp is not sys.stdout:
+            fp.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,67 @@
 import logging
 
-import connexion
 from flask_testing import TestCase
 
-from openapi_server.encoder import JSONEncoder
+from openapi_server.app import create_app
+from openapi_server.controllers import data
+
+logging.getLogger('connexion.operation').setLevel('ERROR')
+
+_shared_app = None
+
+
+def shared_app():
+    """テストで共有する Flask アプリケーションを返します。
+
+    spec の読み込みと検証は重いので、プロセスごとに一度だけ作成します。
+    pytest-xdist のワーカーは別プロセスなので、アプリケーションも data.DB も
+    ワーカーごとに独立しています。
+    設定を変えたアプリケーションが必要なテストは ConfiguredAppTestCase を使います。
+    """
+    global _shared_app
+    if _shared_app is None:
+        _shared_app = create_app().app
+    return _shared_app
+
+
+def close_app(app):
+    """アプリケーションのバックグラウンドのスレッド (ログの書き込み、compaction) を止めます。"""
+    for name in ("slow_log", "access_log"):
+        log = app.extensions.get(name)
+        if log is not None:
+            log.close()
+    compactor = app.extensions.get("compactor")
+    if compactor is not None:
+        compactor.stop()
 
 
 class BaseTestCase(TestCase):
 
     def create_app(self):
-        logging.getLogger('connexion.operation').setLevel('ERROR')
-        app = connexion.App(__name__, specification_dir='../openapi/')
-        app.app.json_encoder = JSONEncoder
-        app.add_api('openapi.yaml', pythonic_params=True)
-        return app.app
+        return shared_app()
+
+    def _pre_setup(self):
+        # テストごとにストアを初期データに戻す (小さなスナップショットの deepcopy だけ)
+        data.initialize_data()
+        super()._pre_setup()
+
+
+class ConfiguredAppTestCase(BaseTestCase):
+    """app_config() の設定で作ったアプリケーションを、クラスごとに1つだけ使うテスト。"""
+
+    @classmethod
+    def app_config(cls):
+        return {}
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.configured_app = create_app(cls.app_config()).app
+
+    @classmethod
+    def tearDownClass(cls):
+        close_app(cls.configured_app)
+        super().tearDownClass()
+
+    def create_app(self):
+        return self.configured_app
@@ -0,0 +1,106 @@
+import io
+import json
+import logging
+import os
+import stat
+import sys
+import tempfile
+import unittest
+
+from openapi_server import access_log, config
+from openapi_server.test import BaseTestCase
+
+UMASK_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "umask"))
+
+
+class TestAccessLog(BaseTestCase):
+    """Access log tests"""
+
+    def setUp(self):
+        # 共有のアプリケーションに、テストの間だけアクセスログを足す
+        self.stream = io.StringIO()
+        self.access_log = access_log.AccessLog(logging.StreamHandler(self.stream))
+        self.instrumentation = self.app.extensions["instrumentation"]
+        self.instrumentation.add_listener(self.access_log.observe)
+
+    def tearDown(self):
+        self.instrumentation.remove_listener(self.access_log.observe)
+        self.access_log.close()
+
+    def read_lines(self):
+        self.access_log.close()
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_records_every_operation(self):
+        self.client.delete('/api/products/0/attributes/0/params/0')
+        self.client.post('/api/products/0/attributes/0/params',
+                         json={"type": "type1", "sort_order": 9, "code": "c", "disp_name": "表示"})
+        self.client.get('/api/products/999')
+        first, second, third = self.read_lines()
+
+        self.assertEqual([field for field, _ in access_log.FIELDS], list(first))
+        self.assertEqual(first["operationId"], "delete_param")
+        self.assertEqual((first["productId"], first["attributeId"], first["paramId"]), (0, 0, 0))
+        self.assertLess(first["status"], 300)
+        self.assertGreaterEqual(first["durationMs"], 0)
+
+        self.assertEqual(second["operationId"], "add_param")
+        self.assertIsNone(second["paramId"])
+        self.assertGreater(second["bytesIn"], 0)
+        self.assertGreater(second["bytesOut"], 0)
+
+        self.assertEqual(third["status"], 404)
+
+    def test_read_sampling_keeps_writes_and_errors(self):
+        self.access_log.read_sample_rate = 0.0
+        self.client.get('/api/products')
+        self.client.get('/api/products/999')
+        self.client.post('/api/products/0/attributes/0/params',
+                         json={"type": "type1", "sort_order": 9, "code": "c", "disp_name": "表示"})
+        self.assertEqual([line["operationId"] for line in self.read_lines()],
+                         ["get_product_by_id", "add_param"])
+
+
+class TestLoadHandler(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "access.log")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_missing_handler_fails(self):
+        with self.assertRaisesRegex(RuntimeError, "no_such_module.Handler"):
+            access_log.load_handler("no_such_module.Handler", self.path, 0o600)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_empty_name_uses_file_handler(self):
+        handler = access_log.load_handler("", self.path, 0o600)
+        self.assertIs(type(handler), logging.FileHandler)
+        handler.close()
+
+    def test_default_handler_sets_permissions(self):
+        # 既定のハンドラーはパッケージに含まれるので、PYTHONPATH の設定なしで読み込める
+        handler = access_log.load_handler(config.DEFAULTS["ACCESS_LOG_HANDLER"], self.path, 0o640)
+        log = access_log.AccessLog(handler)
+        log._queue.put((0.0, "list_products", None, None, None, 200, 0, 10, 0.001))
+        log.close()
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+        with open(self.path, encoding="utf-8") as f:
+            line = json.loads(f.read())
+        self.assertEqual(line["ts"], "1970-01-01T00:00:00.000+00:00")
+        self.assertEqual(line["durationMs"], 1.0)
+
+    @unittest.skipUnless(os.path.isdir(UMASK_DIR), "umask/sample.py is not available")
+    def test_handler_from_umask(self):
+        sys.path.insert(0, UMASK_DIR)
+        try:
+            handler = access_log.load_handler("sample.AppendFileHandler", self.path, 0o640)
+        finally:
+            sys.path.remove(UMASK_DIR)
+        handler.close()
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,68 +1,123 @@
 import unittest
+from unittest import mock
 
-from flask import json
-
-from openapi_server.models.attribute import Attribute  # noqa: E501
-from openapi_server.models.attribute_input import AttributeInput  # noqa: E501
-from openapi_server.models.error import Error  # noqa: E501
+from openapi_server.controllers import data
 from openapi_server.test import BaseTestCase
 
+ATTRIBUTE_INPUT = {
+    "code": "color",
+    "data_type": "string",
+    "disp_name": "色",
+    "unit": "",
+    "contract": "type1",
+    "public": True,
+    "masking": False,
+    "online": True,
+    "sort_order": 3,
+}
+
+
+def _attribute_ids(product_id):
+    product = data.live_product(data.DB["products"][product_id])
+    return [a["attribute_id"] for a in product["attributes"]]
+
 
 class TestAttributesController(BaseTestCase):
-    """AttributesController integration test stubs"""
+    """AttributesController integration tests"""
 
     def test_add_attribute(self):
-        """Test case for add_attribute
-
-        Add a new attribute to a specific product (without params)
-        """
-        attribute_input = {"attributeUnit":"attributeUnit","masking":True,"public":True,"attributeJP":"attributeJP","attributeType":"attributeType","contract":"contract","sortOrder":0,"online":True,"attribute":"attribute"}
-        headers = { 
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-        }
-        response = self.client.open(
-            '/api/products/{product_id}/attributes'.format(product_id=56),
-            method='POST',
-            headers=headers,
-            data=json.dumps(attribute_input),
-            content_type='application/json')
-        self.assert200(response,
-                       'Response body is : ' + response.data.decode('utf-8'))
+        response = self.client.post('/api/products/0/attributes', json=ATTRIBUTE_INPUT)
+        self.assertStatus(response, 201)
+        self.assertEqual(response.json, dict(ATTRIBUTE_INPUT, attribute_id=3, params=[]))
+        self.assertEqual(_attribute_ids(0), [0, 1, 2, 3])
+
+    def test_add_attribute_ids_are_not_reused(self):
+        self.client.delete('/api/products/0/attributes/2')
+        response = self.client.post('/api/products/0/attributes', json=ATTRIBUTE_INPUT)
+        self.assertEqual(response.json["attribute_id"], 3)
+
+    def test_add_attribute_product_not_found(self):
+        response = self.client.post('/api/products/999/attributes', json=ATTRIBUTE_INPUT)
+        self.assert404(response)
+        self.assertEqual(response.json, {"message": "Product not found"})
+
+    def test_add_attribute_validates_body(self):
+        body = dict(ATTRIBUTE_INPUT)
+        del body["code"]
+        self.assert400(self.client.post('/api/products/0/attributes', json=body))
+        self.assertEqual(_attribute_ids(0), [0, 1, 2])
 
     def test_delete_attribute(self):
-        """Test case for delete_attribute
-
-        Delete a specific attribute from a product
-        """
-        headers = { 
-            'Accept': 'application/json',
-        }
-        response = self.client.open(
-            '/api/products/{product_id}/attributes/{attribute_id}'.format(product_id=56, attribute_id=56),
-            method='DELETE',
-            headers=headers)
-        self.assert200(response,
-                       'Response body is : ' + response.data.decode('utf-8'))
+        response = self.client.delete('/api/products/0/attributes/1')
+        self.assertStatus(response, 204)
+        self.assertEqual(_attribute_ids(0), [0, 2])
+        self.assertNotIn((0, 1), data.DB["next_param_id"])
+
+    def test_delete_attribute_not_found(self):
+        self.assert404(self.client.delete('/api/products/0/attributes/99'))
+        self.assert404(self.client.delete('/api/products/999/attributes/0'))
+        self.assertEqual(_attribute_ids(0), [0, 1, 2])
 
     def test_update_attribute(self):
-        """Test case for update_attribute
-
-        Update an existing attribute of a specific product (without managing params list directly)
-        """
-        attribute_input = {"attributeUnit":"attributeUnit","masking":True,"public":True,"attributeJP":"attributeJP","attributeType":"attributeType","contract":"contract","sortOrder":0,"online":True,"attribute":"attribute"}
-        headers = { 
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-        }
-        response = self.client.open(
-            '/api/products/{product_id}/attributes/{attribute_id}'.format(product_id=56, attribute_id=56),
-            method='PUT',
-            headers=headers,
-            data=json.dumps(attribute_input),
-            content_type='application/json')
-        self.assert200(response,
-                       'Response body is : ' + response.data.decode('utf-8'))
+        body = dict(ATTRIBUTE_INPUT, contract="type1")
+        response = self.client.put('/api/products/0/attributes/0', json=body)
+        self.assert200(response)
+        self.assertEqual(response.json["disp_name"], "色")
+        self.assertEqual(response.json["attribute_id"], 0)
+        # params はこのエンドポイントでは変更されない
+        self.assertEqual([p["param_id"] for p in response.json["params"]], [0, 1])
+        self.assertEqual(data.DB["products"][0]["attributes"][0]["code"], "color")
+
+    def test_update_attribute_not_found(self):
+        self.assert404(self.client.put('/api/products/0/attributes/99', json=ATTRIBUTE_INPUT))
+        self.assert404(self.client.put('/api/products/999/attributes/0', json=ATTRIBUTE_INPUT))
+
+    def test_get_attribute_by_code(self):
+        response = self.client.get('/api/products/0/attributes/by-code/attr2')
+        self.assert200(response)
+        self.assertEqual(response.json["attribute_id"], 1)
+        self.assertEqual(response.json["params"][0]["type"], "type2")
+
+    def test_get_attribute_by_code_not_found(self):
+        response = self.client.get('/api/products/0/attributes/by-code/attr1_prod1')
+        self.assert404(response)
+        self.assertEqual(response.json, {"message": "Attribute not found"})
+        self.assert404(self.client.get('/api/products/999/attributes/by-code/attr1'))
+
+    def test_code_index_follows_writes(self):
+        self.client.post('/api/products/0/attributes', json=ATTRIBUTE_INPUT)
+        self.assertEqual(self.client.get('/api/products/0/attributes/by-code/color').json["attribute_id"], 3)
+
+        self.client.put('/api/products/0/attributes/3', json=dict(ATTRIBUTE_INPUT, code="size"))
+        self.assert404(self.client.get('/api/products/0/attributes/by-code/color'))
+        self.assertEqual(self.client.get('/api/products/0/attributes/by-code/size').json["attribute_id"], 3)
+
+        self.client.delete('/api/products/0/attributes/3')
+        self.assert404(self.client.get('/api/products/0/attributes/by-code/size'))
+        self.assertEqual(data.DB["attribute_codes"][0],
+                         {"attr1": [0], "attr2": [1], "attr_type3_contract_empty": [2]})
+
+    def test_duplicate_codes_are_allowed_by_default(self):
+        self.client.post('/api/products/0/attributes', json=dict(ATTRIBUTE_INPUT, code="attr2"))
+        self.assertEqual(self.client.get('/api/products/0/attributes/by-code/attr2').json["attribute_id"], 1)
+        self.client.delete('/api/products/0/attributes/1')
+        self.assertEqual(self.client.get('/api/products/0/attributes/by-code/attr2').json["attribute_id"], 3)
+
+    def test_unique_codes_are_enforced(self):
+        with mock.patch.dict(self.app.config, {"UNIQUE_ATTRIBUTE_CODES": True}):
+            response = self.client.post('/api/products/0/attributes',
+                                        json=dict(ATTRIBUTE_INPUT, code="attr2"))
+            self.assertStatus(response, 409)
+            self.assertEqual(response.json, {"message": "Attribute code 'attr2' already exists in product 0"})
+            self.assertEqual(_attribute_ids(0), [0, 1, 2])
+
+            self.assertStatus(self.client.put('/api/products/0/attributes/0',
+                                              json=dict(ATTRIBUTE_INPUT, code="attr2")), 409)
+            # 自分自身の code のままの更新と、他の product で使われている code は許される
+            self.assert200(self.client.put('/api/products/0/attributes/1',
+                                           json=dict(ATTRIBUTE_INPUT, code="attr2")))
+            self.assertStatus(self.client.post('/api/products/1/attributes',
+                                               json=dict(ATTRIBUTE_INPUT, code="attr2")), 201)
 
 
 if __name__ == '__main__':
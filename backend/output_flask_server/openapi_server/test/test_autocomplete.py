@@ -0,0 +1,104 @@
+import unittest
+
+from openapi_server import autocomplete
+from openapi_server.controllers import data
+from openapi_server.test import BaseTestCase
+
+PRODUCT_INPUT = {"prefix": "abd", "prd_type": "abc00", "cfg_type": "abcdef", "sort_order": 2}
+
+
+def _values(completions):
+    return [c["value"] for c in completions]
+
+
+class TestAutocomplete(BaseTestCase):
+    """GET /autocomplete tests"""
+
+    def complete(self, query):
+        response = self.client.get('/api/autocomplete' + query)
+        self.assert200(response)
+        return response.json
+
+    def test_completes_attribute_codes(self):
+        self.assertEqual(_values(self.complete('?field=code&prefix=attr1')), ["attr1", "attr1_prod1"])
+        self.assertEqual(_values(self.complete('?field=code&prefix=ATTR_&limit=1')),
+                         ["attr_empty_contract_empty_params"])
+        self.assertEqual(self.complete('?field=code&prefix=x'), [])
+
+    def test_completes_products(self):
+        self.client.post('/api/products', json=PRODUCT_INPUT)
+        self.assertEqual(self.complete('?field=prefix&prefix=ab'),
+                         [{"value": "abc", "count": 1}, {"value": "abd", "count": 1}])
+        self.assertEqual(self.complete('?field=prd_type'),
+                         [{"value": "abc00", "count": 2}, {"value": "def00", "count": 1}])
+
+        self.client.delete('/api/products/0')
+        self.assertEqual(self.complete('?field=prd_type'),
+                         [{"value": "abc00", "count": 1}, {"value": "def00", "count": 1}])
+        self.assertEqual(_values(self.complete('?field=code&prefix=attr')),
+                         ["attr1_prod1", "attr_empty_contract_empty_params"])
+
+    def test_follows_attribute_writes(self):
+        attribute = {"code": "attr2", "data_type": "string", "disp_name": "属性", "unit": "",
+                     "contract": "type1", "public": True, "masking": False, "online": True,
+                     "sort_order": 3}
+        self.client.post('/api/products/1/attributes', json=attribute)
+        self.assertEqual(self.complete('?field=code&prefix=attr2'), [{"value": "attr2", "count": 2}])
+
+        self.client.put('/api/products/0/attributes/1', json=dict(attribute, code="size"))
+        self.assertEqual(self.complete('?field=code&prefix=attr2'), [{"value": "attr2", "count": 1}])
+        self.assertEqual(_values(self.complete('?field=code&prefix=s')), ["size"])
+
+        self.client.delete('/api/products/1/attributes/2')
+        self.assertEqual(self.complete('?field=code&prefix=attr2'), [])
+
+    def test_rejects_invalid_query(self):
+        self.assert400(self.client.get('/api/autocomplete?prefix=a'))
+        self.assert400(self.client.get('/api/autocomplete?field=disp_name'))
+        self.assert400(self.client.get('/api/autocomplete?field=code&limit=0'))
+
+
+class TestPrefixIndex(unittest.TestCase):
+    def test_entries_stay_sorted_and_unique(self):
+        index = autocomplete.PrefixIndex()
+        for value in ["b2", "Ａ1", "a2", "b1", "a2"]:
+            index.add(value)
+        self.assertEqual([v for _, v in index._entries], ["Ａ1", "a2", "b1", "b2"])
+        self.assertEqual(index.complete("a"), [{"value": "Ａ1", "count": 1}, {"value": "a2", "count": 2}])
+
+        index.remove("a2")
+        index.remove("b1")
+        index.remove("missing")
+        self.assertEqual(_values(index.complete("")), ["Ａ1", "a2", "b2"])
+        index.remove("a2")
+        self.assertEqual(_values(index.complete("a")), ["Ａ1"])
+
+    def test_bulk_matches_single_inserts(self):
+        values = ["b2", "Ａ1", "a2", "b1", "a2", "c1", "b3"]
+        single, bulk = autocomplete.PrefixIndex(), autocomplete.PrefixIndex()
+        bulk.add("b1")
+        single.add("b1")
+        with bulk.bulk():
+            for value in values:
+                bulk.add(value)
+            for value in ("c1", "b1", "missing"):
+                bulk.remove(value)
+        for value in values:
+            single.add(value)
+        for value in ("c1", "b1", "missing"):
+            single.remove(value)
+        self.assertEqual((bulk._entries, bulk._counts), (single._entries, single._counts))
+
+    def test_index_matches_rebuild(self):
+        data.initialize_data()
+        data.remove_product(0)
+        incremental = data.DB["completions"]
+        data.load_products(list(data.DB["products"].values()))
+        for field, index in incremental.items():
+            self.assertEqual(index._entries, data.DB["completions"][field]._entries)
+            self.assertEqual(index._counts, data.DB["completions"][field]._counts)
+        data.initialize_data()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+
+from openapi_server import bitmaps
+from openapi_server import synthetic
+from openapi_server.controllers import data
+from openapi_server.test import BaseTestCase
+
+
+def _match_ids(result):
+    return [(m["prod_id"], m["attribute"]["attribute_id"]) for m in result["items"]]
+
+
+class TestQueryAttributes(BaseTestCase):
+    """GET /attributes tests"""
+
+    def query(self, query=""):
+        response = self.client.get('/api/attributes' + query)
+        self.assert200(response)
+        return response.json
+
+    def test_filters_across_products(self):
+        result = self.query('?public=false&masking=true')
+        self.assertEqual(result["total"], 3)
+        self.assertEqual(_match_ids(result), [(0, 1), (0, 2), (1, 1)])
+        self.assertEqual(result["items"][0]["attribute"],
+                         self.client.get('/api/products/0').json["attributes"][1])
+        self.assertEqual(_match_ids(self.query('?contract=type1&online=true')), [(0, 0), (1, 0)])
+        self.assertEqual(_match_ids(self.query('?contract=')), [(0, 2)])
+        self.assertEqual(self.query('?dataType=number'), {"total": 0, "offset": 0, "limit": 50, "items": []})
+
+    def test_paginates(self):
+        self.assertEqual(self.query()["total"], 5)
+        page = self.query('?unit=&offset=1&limit=2')
+        self.assertEqual((page["total"], page["offset"], page["limit"]), (5, 1, 2))
+        self.assertEqual(_match_ids(page), [(0, 1), (0, 2)])
+        self.assertEqual(_match_ids(self.query('?offset=4&limit=2')), [(1, 1)])
+
+    def test_follows_writes(self):
+        attribute = {"code": "weight", "data_type": "number", "disp_name": "重量", "unit": "kg",
+                     "contract": "type2", "public": True, "masking": False, "online": True,
+                     "sort_order": 2}
+        self.client.post('/api/products/1/attributes', json=attribute)
+        self.assertEqual(_match_ids(self.query('?unit=kg')), [(1, 2)])
+
+        self.client.put('/api/products/1/attributes/2', json=dict(attribute, public=False))
+        self.assertEqual(self.query('?unit=kg&public=true')["total"], 0)
+        self.assertEqual(_match_ids(self.query('?unit=kg&public=false')), [(1, 2)])
+
+        self.client.delete('/api/products/1/attributes/2')
+        self.client.delete('/api/products/0')
+        self.assertEqual(_match_ids(self.query()), [(1, 0), (1, 1)])
+
+    def test_results_follow_key_order(self):
+        attribute = {"code": "new", "data_type": "string", "disp_name": "新規", "unit": "",
+                     "contract": "type1", "public": True, "masking": False, "online": True,
+                     "sort_order": 3}
+        self.client.post('/api/products/0/attributes', json=attribute)
+        expected = [(0, 0), (0, 3), (1, 0)]
+        self.assertEqual(_match_ids(self.query('?contract=type1')), expected)
+        self.assertEqual(_match_ids(self.query('?contract=type1&offset=1&limit=1')), [(0, 3)])
+        # 読み直しても同じ順序
+        data.load_products(list(data.DB["products"].values()))
+        self.assertEqual(_match_ids(self.query('?contract=type1')), expected)
+
+    def test_rejects_invalid_query(self):
+        self.assert400(self.client.get('/api/attributes?public=maybe'))
+        self.assert400(self.client.get('/api/attributes?limit=0'))
+
+
+class TestBitmapIndex(unittest.TestCase):
+    def test_iter_bits(self):
+        bits = (1 << 0) | (1 << 63) | (1 << 64) | (1 << 200)
+        self.assertEqual(list(bitmaps.iter_bits(bits)), [0, 63, 64, 200])
+        self.assertEqual(list(bitmaps.iter_bits(0)), [])
+
+    def test_query_matches_scan(self):
+        products = list(synthetic.CatalogGenerator(seed=4, attributes="0-30").iter_products(40))
+        index = bitmaps.BitmapIndex()
+        for product in products:
+            for attribute in product["attributes"]:
+                index.add((product["prod_id"], attribute["attribute_id"]), attribute)
+        # 半分を削除し、残りの一部の値を変更する
+        for product in products[::2]:
+            for attribute in product["attributes"]:
+                index.remove((product["prod_id"], attribute["attribute_id"]))
+        for product in products[1::4]:
+            for attribute in product["attributes"]:
+                attribute["public"] = not attribute["public"]
+                index.add((product["prod_id"], attribute["attribute_id"]), attribute)
+
+        filters = {"public": True, "masking": False, "contract": "type1"}
+        expected = [
+            (product["prod_id"], attribute["attribute_id"])
+            for product in products[1::2]
+            for attribute in product["attributes"]
+            if all(attribute[field] == value for field, value in filters.items())
+        ]
+        total, page = index.query(filters, offset=0, limit=len(expected) + 1)
+        self.assertEqual((total, [key for key, _ in page]), (len(expected), expected))
+        _, page = index.query(filters, offset=3, limit=2)
+        self.assertEqual([key for key, _ in page], expected[3:5])
+
+    def test_out_of_order_adds_are_sorted(self):
+        index = bitmaps.BitmapIndex(("public",))
+        keys = [(pid, aid) for aid in range(30) for pid in range(10)]  # product をまたいで追加
+        for n, key in enumerate(keys):
+            index.add(key, {"public": key[1] % 3 != 0})
+            if n in (5, 150):
+                index.remove(keys[n - 1])
+            if n % 37 == 0:
+                # 振り直しの前後どちらでも、結果はキーの順
+                live = sorted(k for k in keys[:n + 1] if k not in (keys[4], keys[149]))
+                expected = [k for k in live if k[1] % 3 != 0]
+                total, page = index.query({"public": True}, offset=2, limit=20)
+                self.assertEqual((total, [k for k, _ in page]), (len(expected), expected[2:22]))
+        self.assertGreater(index._ordered, len(keys) // 2)
+
+    def test_index_matches_rebuild(self):
+        data.initialize_data()
+        data.remove_product(0)
+        total, page = data.DB["attribute_bitmaps"].query({"masking": True})
+        data.load_products(list(data.DB["products"].values()))
+        self.assertEqual(data.DB["attribute_bitmaps"].query({"masking": True}), (total, page))
+        data.initialize_data()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import io
+import json
+import tracemalloc
+import unittest
+from unittest import mock
+
+from openapi_server import bulk
+from openapi_server import synthetic
+from openapi_server.controllers import data
+from openapi_server.test import BaseTestCase
+
+NDJSON = "application/x-ndjson"
+
+
+def _ndjson(records):
+    return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+
+
+def _generator():
+    return synthetic.CatalogGenerator(seed=3, attributes="2-4", params="1-3")
+
+
+class TestImport(BaseTestCase):
+    """POST /import tests"""
+
+    def post(self, body, query="", accept="application/json"):
+        return self.client.post('/api/import' + query, data=body.encode("utf-8"),
+                                content_type=NDJSON, headers={"Accept": accept})
+
+    def test_imports_synthetic_catalog(self):
+        records = list(_generator().iter_records(5, start_id=10))
+        response = self.post(_ndjson(records), "?batchSize=7")
+        self.assert200(response)
+        result = response.json
+        self.assertEqual(result["lines"], len(records))
+        self.assertEqual(result["error_count"], 0)
+        self.assertEqual(result["errors"], [])
+        self.assertEqual(result["products"], 5)
+        self.assertEqual(result["params"], sum(r["kind"] == "param" for r in records))
+
+        expected = list(_generator().iter_products(5, start_id=10))
+        for product in expected:
+            self.assertEqual(self.client.get('/api/products/%d' % product["prod_id"]).json, product)
+        self.assertEqual(data.DB["next_product_id"], 15)
+
+    def test_counters_continue_after_import(self):
+        records = [
+            {"kind": "product", "prod_id": 7, "prefix": "p", "prd_type": "t", "cfg_type": "c", "sort_order": 0},
+            {"kind": "attribute", "prod_id": 7, "attribute_id": 4, "code": "a", "data_type": "string",
+             "disp_name": "属性", "unit": "", "contract": "type2", "public": True, "masking": False,
+             "online": True, "sort_order": 0},
+            {"kind": "param", "prod_id": 7, "attribute_id": 4, "param_id": 2, "type": "type2",
+             "sort_order": 0, "min": 1, "increment": 1},
+        ]
+        self.assert200(self.post(_ndjson(records)))
+        response = self.client.post('/api/products/7/attributes/4/params',
+                                    json={"type": "type2", "sort_order": 1, "min": 0, "increment": 5})
+        self.assertEqual(response.json["param_id"], 3)
+
+    def test_rejected_lines_are_reported_and_skipped(self):
+        product = {"kind": "product", "prod_id": 5, "prefix": "p", "prd_type": "t",
+                   "cfg_type": "c", "sort_order": 0}
+        lines = [
+            json.dumps(product),
+            json.dumps(dict(product, prod_id=0)),                         # 2: 既存の ID
+            json.dumps(dict(product, prod_id=6, sort_order="x")),         # 3: 型が違う
+            json.dumps(dict(product, prod_id=6, extra=1)),                # 4: 未知のフィールド
+            "{not json",                                                  # 5
+            "",                                                           # 空行は数えない
+            json.dumps({"kind": "param", "prod_id": 0, "attribute_id": 1, "param_id": 9,
+                        "type": "type1", "sort_order": 0, "code": "c", "disp_name": "d"}),  # 7: contract
+            json.dumps({"kind": "attribute", "prod_id": 99, "attribute_id": 0, "code": "a",
+                        "data_type": "string", "disp_name": "d", "unit": "", "contract": "",
+                        "public": True, "masking": False, "online": True, "sort_order": 0}),  # 8
+            json.dumps({"kind": "widget"}),                               # 9
+        ]
+        result = self.post("\n".join(lines) + "\n").json
+        self.assertEqual(result["products"], 1)
+        self.assertEqual(result["lines"], 8)
+        # 読み込めなかった行と反映できなかった行は、行番号の順に並ぶ
+        self.assertEqual([e["line"] for e in result["errors"]], [2, 3, 4, 5, 7, 8, 9])
+        messages = {e["line"]: e["message"] for e in result["errors"]}
+        self.assertIn("sort_order", messages[3])
+        self.assertIn("'extra' was unexpected", messages[4])
+        self.assertEqual(messages[2], "Product 0 already exists.")
+        self.assertIn("Expected parameter type: 'type2'", messages[7])
+        self.assertEqual(messages[8], "Product 99 not found.")
+        self.assertEqual(len(data.DB["products"][0]["attributes"][1]["params"]), 1)
+
+        # maxErrors で切り詰めても、先の行の error が残る
+        data.initialize_data()
+        result = self.post("\n".join(lines) + "\n", "?maxErrors=2").json
+        self.assertEqual(result["error_count"], 7)
+        self.assertEqual([e["line"] for e in result["errors"]], [2, 3])
+
+    def test_duplicate_codes_with_unique_codes(self):
+        records = [
+            {"kind": "attribute", "prod_id": 1, "attribute_id": attribute_id, "code": "attr1_prod1",
+             "data_type": "string", "disp_name": "属性", "unit": "", "contract": "type2",
+             "public": True, "masking": False, "online": True, "sort_order": 0}
+            for attribute_id in (5, 6)
+        ]
+        with mock.patch.dict(self.app.config, {"UNIQUE_ATTRIBUTE_CODES": True}):
+            result = self.post(_ndjson(records)).json
+        self.assertEqual([e["line"] for e in result["errors"]], [1, 2])
+        self.assertEqual(result["errors"][0]["message"],
+                         "Attribute code 'attr1_prod1' already exists in product 1.")
+
+        result = self.post(_ndjson(records)).json
+        self.assertEqual(result["attributes"], 2)
+        self.assertEqual(data.DB["attribute_codes"][1]["attr1_prod1"], [0, 5, 6])
+
+    def test_max_errors_limits_listed_errors(self):
+        result = self.post("x\n" * 20, "?maxErrors=3").json
+        self.assertEqual(result["error_count"], 20)
+        self.assertEqual(len(result["errors"]), 3)
+
+    def test_replace_clears_existing_products(self):
+        records = list(_generator().iter_records(2, start_id=0))
+        result = self.post(_ndjson(records), "?replace=true").json
+        self.assertEqual(result["error_count"], 0)
+        self.assertEqual(len(self.client.get('/api/products').json), 2)
+
+    def test_streams_progress_events(self):
+        records = list(_generator().iter_records(3, start_id=20))
+        response = self.post(_ndjson(records) + "oops\n", "?batchSize=10", accept=NDJSON)
+        self.assert200(response)
+        self.assertEqual(response.mimetype, NDJSON)
+        events = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        progress = [e for e in events if e["event"] == "progress"]
+        self.assertEqual(len(progress), len(records) // 10 + 1)
+        self.assertEqual(progress[-1]["lines"], len(records) + 1)
+        self.assertEqual([e["line"] for e in events if e["event"] == "error"], [len(records) + 1])
+
+    def test_rejects_invalid_query(self):
+        self.assert400(self.post("", "?batchSize=0"))
+
+
+class TestIterLines(unittest.TestCase):
+    def test_long_lines_are_skipped(self):
+        stream = io.BytesIO(b"short\n" + b"x" * 50 + b"\nnext")
+        self.assertEqual(list(bulk.iter_lines(stream, max_line_bytes=10)),
+                         [(1, b"short\n"), (2, None), (3, b"next")])
+
+    def test_memory_does_not_grow_with_input(self):
+        # 既存の product と重複するレコードを大量に流しても、溜め込むものはない
+        data.initialize_data()
+        line = json.dumps({"kind": "product", "prod_id": 0, "prefix": "p" * 200, "prd_type": "t",
+                           "cfg_type": "c", "sort_order": 0}).encode() + b"\n"
+
+        def lines(count):
+            for lineno in range(1, count + 1):
+                yield lineno, line
+
+        tracemalloc.start()
+        try:
+            for event in bulk.CatalogImporter(batch_size=100).run(lines(20000)):
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(event["error_count"], 20000)
+        self.assertLess(peak, len(line) * 2000)  # 入力全体 (約 4.7MB) よりずっと小さい
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+from unittest import mock
+
+from openapi_server import compaction
+from openapi_server.app import create_app
+from openapi_server.controllers import data
+from openapi_server.test import BaseTestCase, close_app
+
+
+def _raw_ids():
+    """ストアのリストにある (削除済みを含む) attribute と param のキー。"""
+    attributes, params = set(), set()
+    for pid, product in data.DB["products"].items():
+        for attr in product["attributes"]:
+            attributes.add((pid, attr["attribute_id"]))
+            params.update((pid, attr["attribute_id"], p["param_id"]) for p in attr["params"])
+    return attributes, params
+
+
+class TestTombstones(BaseTestCase):
+    """Tombstoned deletes and compaction tests"""
+
+    def setUp(self):
+        self.compactor = self.app.extensions["compactor"]
+
+    def paused(self):
+        # 割合が 1 を超えることはないので、バックグラウンドの compaction は起きない
+        return mock.patch.object(self.compactor, "ratio", 1.0)
+
+    def test_reads_skip_tombstones(self):
+        with self.paused():
+            self.client.delete('/api/products/0/attributes/0/params/0')
+            self.client.delete('/api/products/0/attributes/2')
+            self.assertEqual(data.DB["tombstone_count"], 3)
+            self.assertEqual(len(data.DB["products"][0]["attributes"]), 3)
+
+            product = self.client.get('/api/products/0').json
+            self.assertEqual([a["attribute_id"] for a in product["attributes"]], [0, 1])
+            self.assertEqual([p["param_id"] for p in product["attributes"][0]["params"]], [1])
+            self.assertNotIn(data.DELETED, str(self.client.get('/api/export').get_data(as_text=True)))
+            before = self.client.get('/api/products').json
+
+            self.assertEqual(data.compact(), 3)
+            self.assertEqual(data.DB["tombstones"], {})
+            self.assertEqual(self.client.get('/api/products').json, before)
+
+        self.assert404(self.client.delete('/api/products/0/attributes/2'))
+        self.assert404(self.client.put('/api/products/0/attributes/0/params/0',
+                                       json={"type": "type1", "sort_order": 0,
+                                             "code": "code1", "disp_name": "コード1"}))
+
+    def test_background_compaction_after_ratio(self):
+        runs = self.compactor.runs
+        self.client.delete('/api/products/0/attributes/0/params/0')
+        self.assertEqual(self.compactor.runs, runs)
+        self.assertLessEqual(data.tombstone_ratio(), self.compactor.ratio)
+
+        self.client.delete('/api/products/0/attributes/2')
+        self.assertTrue(self.compactor.done.wait(5))
+        self.assertEqual(self.compactor.runs, runs + 1)
+        self.assertEqual(data.DB["tombstone_count"], 0)
+        self.assertEqual(_raw_ids(), (set(data.DB["attribute_ids"]), set(data.DB["param_ids"])))
+        self.assertEqual([a["attribute_id"] for a in data.DB["products"][0]["attributes"]], [0, 1])
+
+    def test_attribute_reads_skip_deleted_params(self):
+        with self.paused():
+            self.client.delete('/api/products/0/attributes/0/params/0')
+
+            attribute = self.client.get('/api/products/0/attributes/by-code/attr1').json
+            self.assertEqual([p["param_id"] for p in attribute["params"]], [1])
+
+            matches = self.client.get('/api/attributes?contract=type1').json["items"]
+            self.assertEqual([p["param_id"] for p in matches[0]["attribute"]["params"]], [1])
+
+            body = {k: v for k, v in attribute.items() if k not in ("attribute_id", "params")}
+            response = self.client.put('/api/products/0/attributes/0', json=body)
+            self.assert200(response)
+            self.assertEqual([p["param_id"] for p in response.json["params"]], [1])
+
+    def test_compaction_settings_are_per_app(self):
+        other = create_app({"TOMBSTONE_COMPACTION_RATIO": -1}).app
+        self.addCleanup(close_app, other)
+        self.assertNotIn("compactor", other.extensions)
+        # 後から作ったアプリケーションの設定は、このアプリケーションの compaction に影響しない
+        self.test_background_compaction_after_ratio()
+
+    def test_id_index_follows_writes(self):
+        with self.paused():
+            self.client.post('/api/products/0/attributes/1/params',
+                             json={"type": "type2", "sort_order": 1, "min": 1, "increment": 1})
+            self.client.delete('/api/products/0/attributes/1')
+            self.client.delete('/api/products/1')
+            data.compact()
+        self.assertEqual(_raw_ids(), (set(data.DB["attribute_ids"]), set(data.DB["param_ids"])))
+        self.assertEqual(data.DB["tombstones"], {})
+
+    def test_ids_are_not_reused_after_compaction(self):
+        with self.paused():
+            self.client.delete('/api/products/0/attributes/2')
+            data.compact()
+        response = self.client.post('/api/products/0/attributes', json={
+            "code": "new", "data_type": "string", "disp_name": "新規", "unit": "",
+            "contract": "", "public": False, "masking": False, "online": False, "sort_order": 3,
+        })
+        self.assertEqual(response.json["attribute_id"], 3)
+
+
+class TestCompactor(unittest.TestCase):
+    def setUp(self):
+        data.initialize_data()
+
+    def tearDown(self):
+        data.initialize_data()
+
+    def test_skips_when_ratio_dropped(self):
+        compactor = compaction.Compactor(0.9)
+        with data.LOCK:
+            attr = data.find_attribute(0, 2)
+            data.tombstone_attribute(0, attr)
+            compactor.notify()
+        self.assertTrue(compactor.done.wait(5))
+        self.assertEqual(compactor.runs, 0)
+        self.assertEqual(data.DB["tombstone_count"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
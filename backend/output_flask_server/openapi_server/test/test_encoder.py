@@ -0,0 +1,69 @@
+import json
+import unittest
+
+from connexion.apps.flask_app import FlaskJSONEncoder
+
+from openapi_server.controllers import data
+from openapi_server.encoder import JSONEncoder
+from openapi_server.models.base_model import Model
+from openapi_server.models.product import Product
+from openapi_server.test import BaseTestCase
+
+
+class _ReferenceEncoder(FlaskJSONEncoder):
+    """The reflective encoder that encoder.JSONEncoder replaced."""
+    include_nulls = False
+
+    def default(self, o):
+        if isinstance(o, Model):
+            dikt = {}
+            for attr in o.openapi_types:
+                value = getattr(o, attr)
+                if value is None and not self.include_nulls:
+                    continue
+                dikt[o.attribute_map[attr]] = value
+            return dikt
+        return FlaskJSONEncoder.default(self, o)
+
+
+class _ReferenceEncoderWithNulls(_ReferenceEncoder):
+    include_nulls = True
+
+
+class _JSONEncoderWithNulls(JSONEncoder):
+    include_nulls = True
+
+
+class TestJSONEncoder(unittest.TestCase):
+    """encoder.JSONEncoder tests"""
+
+    def setUp(self):
+        self.products = [Product.from_dict(p) for p in data.DB["products"].values()]
+
+    def test_matches_reference(self):
+        for cls, reference in ((JSONEncoder, _ReferenceEncoder),
+                               (_JSONEncoderWithNulls, _ReferenceEncoderWithNulls)):
+            with self.subTest(cls=cls.__name__):
+                self.assertEqual(
+                    json.dumps(self.products, cls=cls, sort_keys=True),
+                    json.dumps(self.products, cls=reference, sort_keys=True))
+
+    def test_nulls_omitted_by_default(self):
+        encoded = json.loads(json.dumps(self.products[0], cls=JSONEncoder))
+        self.assertNotIn("min", encoded["attributes"][0]["params"][0])
+        encoded = json.loads(json.dumps(self.products[0], cls=_JSONEncoderWithNulls))
+        self.assertIsNone(encoded["attributes"][0]["params"][0]["min"])
+
+
+class TestJSONResponse(BaseTestCase):
+    """Response encoding tests"""
+
+    def test_non_ascii_is_raw_utf8(self):
+        response = self.client.get('/api/products/0')
+        self.assert200(response)
+        self.assertIn("属性1".encode("utf-8"), response.data)
+        self.assertNotIn(b"\\u", response.data)
+
+
+if __name__ == '__main__':
+    unittest.main()
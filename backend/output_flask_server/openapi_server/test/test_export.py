@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+import unittest
+from unittest import mock
+
+from openapi_server import export
+from openapi_server import synthetic
+from openapi_server.controllers import data
+from openapi_server.test import BaseTestCase
+
+
+class TestExport(BaseTestCase):
+    """GET /export tests"""
+
+    def test_ndjson_round_trips_through_import(self):
+        generator = synthetic.CatalogGenerator(seed=5, attributes="0-4", params="0-3")
+        data.load_products(list(generator.iter_products(30)))
+        before = self.client.get('/api/products').json
+
+        response = self.client.get('/api/export')
+        self.assert200(response)
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        body = response.get_data()
+        self.assertEqual(body.decode("utf-8"), "".join(
+            json.dumps(record, ensure_ascii=False) + "\n"
+            for record in synthetic.CatalogGenerator(seed=5, attributes="0-4", params="0-3")
+            .iter_records(30)))
+
+        result = self.client.post('/api/import?replace=true', data=body,
+                                  content_type="application/x-ndjson").json
+        self.assertEqual(result["error_count"], 0)
+        self.assertEqual(self.client.get('/api/products').json, before)
+
+    def test_csv_has_one_row_per_param(self):
+        response = self.client.get('/api/export?format=csv')
+        self.assert200(response)
+        self.assertEqual(response.mimetype, "text/csv")
+        self.assertIn('filename="catalog.csv"', response.headers["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+        # param 4つ + param のない attribute 2つ (product 1)
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[2], {
+            "prod_id": "0", "prefix": "abc", "prd_type": "abc00", "cfg_type": "abcdef",
+            "product_sort_order": "0", "attribute_id": "1", "attribute_code": "attr2",
+            "data_type": "string", "attribute_disp_name": "属性2", "unit": "", "contract": "type2",
+            "public": "false", "masking": "true", "online": "false", "attribute_sort_order": "1",
+            "param_id": "0", "param_sort_order": "0", "type": "type2", "param_code": "",
+            "param_disp_name": "", "min": "1", "increment": "2",
+        })
+        self.assertEqual((rows[4]["prod_id"], rows[4]["attribute_id"], rows[4]["param_id"]), ("1", "0", ""))
+
+    def test_product_without_attributes_gets_a_row(self):
+        data.DB["products"][1]["attributes"] = []
+        rows = list(csv.reader(io.StringIO(self.client.get('/api/export?format=csv').get_data(as_text=True))))
+        self.assertEqual(rows[-1][:2], ["1", "def"])
+        self.assertEqual(set(rows[-1][5:]), {""})
+
+    def test_snapshot_is_taken_before_streaming(self):
+        response = self.client.get('/api/export')
+        self.client.delete('/api/products/0/attributes/0')
+        self.assertIn('"code": "attr1"', response.get_data(as_text=True))
+
+    def test_rejects_unknown_format(self):
+        self.assert400(self.client.get('/api/export?format=xml'))
+
+
+class TestSnapshot(unittest.TestCase):
+    def tearDown(self):
+        data.initialize_data()
+
+    def test_large_snapshot_is_spooled_and_chunked(self):
+        data.load_products(list(synthetic.CatalogGenerator(seed=1).iter_products(50)))
+        with mock.patch.object(export, "SPOOL_MAX_BYTES", 4096), \
+                mock.patch.object(export, "EXPORT_CHUNK_BYTES", 1024):
+            spool = export.snapshot("ndjson")
+            self.assertTrue(spool._rolled)  # メモリではなくファイルに移っている
+            chunks = list(export.iter_chunks(spool, size=1024))
+        self.assertTrue(spool.closed)
+        self.assertEqual({len(c) for c in chunks[:-1]}, {1024})
+        lines = b"".join(chunks).decode("utf-8").splitlines()
+        self.assertEqual(len(lines), sum(1 for _ in export.iter_records()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from openapi_server import memory
+from openapi_server.controllers import data
+from openapi_server.synthetic import CatalogGenerator
+from openapi_server.test import BaseTestCase, ConfiguredAppTestCase
+
+
+class TestStoreMemory(BaseTestCase):
+    """Store memory accounting tests"""
+
+    def test_exact_counts(self):
+        report = memory.store_memory(sample=0)
+        self.assertTrue(report["exact"])
+        self.assertEqual(report["products"]["count"], 2)
+        self.assertEqual(report["attributes"]["count"], 5)
+        self.assertEqual(report["params"]["count"], 4)
+        self.assertEqual(report["counters"]["next_param_id"]["entries"], 5)
+        self.assertGreater(report["attributes"]["breakdown"]["strings"], 0)
+        self.assertEqual(
+            report["total_bytes"],
+            sum(report[k]["bytes"] for k in ("products", "attributes", "params", "tombstones"))
+            + report["products_table"]["bytes"]
+            + sum(c["bytes"] for c in report["counters"].values())
+            + sum(i["bytes"] for i in report["indexes"].values()))
+
+    def test_reports_indexes(self):
+        report = memory.store_memory(sample=0)
+        self.assertEqual(set(report["indexes"]), {name for name, _ in data.index_structures()})
+        for name in ("search_index", "attribute_bitmaps", "attribute_ids", "param_ids"):
+            self.assertGreater(report["indexes"][name]["bytes"], 0, name)
+        self.assertEqual(report["indexes"]["search_index"]["bytes"],
+                         sum(report["indexes"]["search_index"]["parts"].values()))
+
+    def test_tombstones_are_not_live(self):
+        with data.LOCK:
+            data.tombstone_attribute(0, data.find_attribute(0, 0))
+        report = memory.store_memory(sample=0)
+        # attribute 0 と、その params (param 0, 1) は削除済み
+        self.assertEqual(report["attributes"]["count"], 4)
+        self.assertEqual(report["params"]["count"], 2)
+        self.assertEqual(report["tombstones"]["count"], 3)
+        self.assertGreater(report["tombstones"]["bytes"], 0)
+
+    def test_sampled_estimate_is_close(self):
+        generator = CatalogGenerator(seed=3, attributes=4, params=3)
+        data.load_products(list(generator.iter_products(400)))
+        exact = memory.store_memory(sample=0)
+        sampled = memory.store_memory(sample=40, seed=1)
+        self.assertFalse(sampled["exact"])
+        self.assertEqual(sampled["sampled_products"], 40)
+        self.assertEqual(sampled["params"]["count"], exact["params"]["count"])
+        self.assertAlmostEqual(sampled["total_bytes"] / exact["total_bytes"], 1.0, delta=0.1)
+
+
+
+class TestMemoryEndpoint(ConfiguredAppTestCase):
+    """GET /admin/memory tests"""
+
+    @classmethod
+    def app_config(cls):
+        return {"PROFILE_TOKEN": "secret"}
+
+    def get(self, query, token="secret"):
+        return self.client.get('/admin/memory' + query, headers={"X-Profile": token})
+
+    def test_endpoint(self):
+        response = self.get('?sample=0')
+        self.assert200(response)
+        self.assertEqual(response.json["products"]["count"], 2)
+        self.assertIn("search_index", response.json["indexes"])
+        self.assert400(self.get('?sample=x'))
+        self.assert400(self.get('?sample=-1'))
+
+    def test_requires_token(self):
+        self.assert403(self.client.get('/admin/memory'))
+        self.assert403(self.get('', token="wrong"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from openapi_server import metrics
+from openapi_server.test import BaseTestCase
+
+
+class TestMetrics(BaseTestCase):
+    """/metrics endpoint tests"""
+
+    def setUp(self):
+        self.app.extensions["metrics"].reset()
+
+    def scrape(self):
+        response = self.client.get('/metrics')
+        self.assert200(response)
+        self.assertEqual(response.content_type, metrics.CONTENT_TYPE)
+        return response.get_data(as_text=True)
+
+    def test_counts_requests_and_errors(self):
+        self.client.get('/api/products')
+        self.client.get('/api/products')
+        self.client.get('/api/products/999')
+        text = self.scrape()
+        self.assertIn('openapi_requests_total{operation="list_products"} 2', text)
+        self.assertIn(
+            'openapi_request_errors_total{operation="get_product_by_id",status="404"} 1', text)
+        self.assertNotIn('operation="metrics"', text)
+
+    def test_phase_histograms(self):
+        self.client.get('/api/products/0')
+        text = self.scrape()
+        for phase in ("validation", "controller", "serialization"):
+            self.assertIn(
+                'openapi_request_phase_seconds_count{operation="get_product_by_id",'
+                'phase="%s"} 1' % phase, text)
+        self.assertIn(
+            'openapi_request_duration_seconds_bucket{operation="get_product_by_id",le="+Inf"} 1',
+            text)
+
+    def test_validation_failure_has_only_validation_phase(self):
+        self.client.post('/api/products/0/attributes', json={})
+        text = self.scrape()
+        self.assertIn(
+            'openapi_request_errors_total{operation="add_attribute",status="400"} 1', text)
+        self.assertNotIn('operation="add_attribute",phase="controller"', text)
+
+    def test_store_gauges(self):
+        text = self.scrape()
+        self.assertIn('openapi_store_items{kind="products"} 2', text)
+        self.assertIn('openapi_store_items{kind="params"} 4', text)
+        self.assertIn('openapi_cache_entries{cache="encoders"}', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
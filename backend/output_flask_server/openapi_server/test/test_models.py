@@ -0,0 +1,30 @@
+import unittest
+
+from openapi_server.controllers import data
+from openapi_server.models.attribute import Attribute
+from openapi_server.models.param_item import ParamItem
+from openapi_server.models.product import Product
+
+
+class TestModels(unittest.TestCase):
+    """Model class layout tests"""
+
+    def test_instances_have_no_dict(self):
+        for klass in (Product, Attribute, ParamItem):
+            self.assertFalse(hasattr(klass(), '__dict__'), klass.__name__)
+
+    def test_type_maps_are_class_level(self):
+        self.assertIs(Attribute().openapi_types, Attribute.openapi_types)
+        self.assertIs(Attribute().attribute_map, Attribute.attribute_map)
+
+    def test_round_trip_and_equality(self):
+        product_data = data.DB["products"][0]
+        product = Product.from_dict(product_data)
+        self.assertEqual(product, Product.from_dict(product_data))
+        self.assertNotEqual(product, Product.from_dict(data.DB["products"][1]))
+        self.assertEqual(product.attributes[0].params[0].disp_name, "コード1")
+        self.assertEqual(product.to_dict()["attributes"][1]["params"][0]["min"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,68 +1,75 @@
 import unittest
 
-from flask import json
-
-from openapi_server.models.error import Error  # noqa: E501
-from openapi_server.models.param_item import ParamItem  # noqa: E501
-from openapi_server.models.param_item_input import ParamItemInput  # noqa: E501
+from openapi_server.controllers import data
 from openapi_server.test import BaseTestCase
 
+TYPE1_INPUT = {"type": "type1", "sort_order": 2, "code": "code3", "disp_name": "コード3"}
+TYPE2_INPUT = {"type": "type2", "sort_order": 1, "min": 10, "increment": 5}
+
+
+def _params(product_id, attribute_id):
+    for attribute in data.live_product(data.DB["products"][product_id])["attributes"]:
+        if attribute["attribute_id"] == attribute_id:
+            return attribute["params"]
+
 
 class TestParametersController(BaseTestCase):
-    """ParametersController integration test stubs"""
+    """ParametersController integration tests"""
 
     def test_add_param(self):
-        """Test case for add_param
-
-        Add a new parameter to a specific attribute
-        """
-        param_item_input = {"code":"code","sortOrder":0,"type":"type1","dispName":"dispName"}
-        headers = { 
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-        }
-        response = self.client.open(
-            '/api/products/{product_id}/attributes/{attribute_id}/params'.format(product_id=56, attribute_id=56),
-            method='POST',
-            headers=headers,
-            data=json.dumps(param_item_input),
-            content_type='application/json')
-        self.assert200(response,
-                       'Response body is : ' + response.data.decode('utf-8'))
+        response = self.client.post('/api/products/0/attributes/0/params', json=TYPE1_INPUT)
+        self.assertStatus(response, 201)
+        self.assertEqual(response.json, dict(TYPE1_INPUT, param_id=2))
+        self.assertEqual([p["param_id"] for p in _params(0, 0)], [0, 1, 2])
+
+    def test_add_param_type2(self):
+        response = self.client.post('/api/products/0/attributes/1/params', json=TYPE2_INPUT)
+        self.assertStatus(response, 201)
+        self.assertEqual(response.json, dict(TYPE2_INPUT, param_id=1))
+
+    def test_add_param_contract_mismatch(self):
+        response = self.client.post('/api/products/0/attributes/1/params', json=TYPE1_INPUT)
+        self.assertStatus(response, 409)
+        self.assertIn("Expected parameter type: 'type2'", response.json["message"])
+        self.assertEqual(len(_params(0, 1)), 1)
+
+    def test_add_param_empty_contract_expects_type3(self):
+        body = dict(TYPE1_INPUT, type="type3")
+        self.assertStatus(self.client.post('/api/products/0/attributes/2/params', json=body), 201)
+        self.assertStatus(self.client.post('/api/products/0/attributes/2/params', json=TYPE1_INPUT), 409)
+
+    def test_add_param_not_found(self):
+        self.assert404(self.client.post('/api/products/0/attributes/99/params', json=TYPE1_INPUT))
+        self.assert404(self.client.post('/api/products/999/attributes/0/params', json=TYPE1_INPUT))
+
+    def test_add_param_validates_body(self):
+        self.assert400(self.client.post('/api/products/0/attributes/0/params', json={"type": "type1"}))
 
     def test_delete_param(self):
-        """Test case for delete_param
-
-        Delete a specific parameter from an attribute
-        """
-        headers = { 
-            'Accept': 'application/json',
-        }
-        response = self.client.open(
-            '/api/products/{product_id}/attributes/{attribute_id}/params/{param_id}'.format(product_id=56, attribute_id=56, param_id=56),
-            method='DELETE',
-            headers=headers)
-        self.assert200(response,
-                       'Response body is : ' + response.data.decode('utf-8'))
+        response = self.client.delete('/api/products/0/attributes/0/params/0')
+        self.assertStatus(response, 204)
+        self.assertEqual([p["param_id"] for p in _params(0, 0)], [1])
+
+    def test_delete_param_not_found(self):
+        self.assert404(self.client.delete('/api/products/0/attributes/0/params/99'))
+        self.assert404(self.client.delete('/api/products/0/attributes/99/params/0'))
+        self.assert404(self.client.delete('/api/products/999/attributes/0/params/0'))
 
     def test_update_param(self):
-        """Test case for update_param
-
-        Update an existing parameter of a specific attribute
-        """
-        param_item_input = {"code":"code","sortOrder":0,"type":"type1","dispName":"dispName"}
-        headers = { 
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-        }
-        response = self.client.open(
-            '/api/products/{product_id}/attributes/{attribute_id}/params/{param_id}'.format(product_id=56, attribute_id=56, param_id=56),
-            method='PUT',
-            headers=headers,
-            data=json.dumps(param_item_input),
-            content_type='application/json')
-        self.assert200(response,
-                       'Response body is : ' + response.data.decode('utf-8'))
+        body = dict(TYPE1_INPUT, disp_name="更新後")
+        response = self.client.put('/api/products/0/attributes/0/params/1', json=body)
+        self.assert200(response)
+        self.assertEqual(response.json, dict(body, param_id=1))
+        self.assertEqual(_params(0, 0)[1]["disp_name"], "更新後")
+
+    def test_update_param_contract_mismatch(self):
+        response = self.client.put('/api/products/0/attributes/0/params/0', json=dict(TYPE2_INPUT))
+        self.assertStatus(response, 409)
+        self.assertEqual(_params(0, 0)[0]["type"], "type1")
+
+    def test_update_param_not_found(self):
+        self.assert404(self.client.put('/api/products/0/attributes/0/params/99', json=TYPE1_INPUT))
+        self.assert404(self.client.put('/api/products/0/attributes/99/params/0', json=TYPE1_INPUT))
 
 
 if __name__ == '__main__':
@@ -1,44 +1,102 @@
+import threading
 import unittest
 
-from flask import json
-
-from openapi_server.models.error import Error  # noqa: E501
-from openapi_server.models.product import Product  # noqa: E501
+from openapi_server.controllers import data
 from openapi_server.test import BaseTestCase
 
 
 class TestProductsController(BaseTestCase):
-    """ProductsController integration test stubs"""
+    """ProductsController integration tests"""
 
     def test_get_product_by_id(self):
-        """Test case for get_product_by_id
-
-        Get a specific product by its ID
-        """
-        headers = { 
-            'Accept': 'application/json',
-        }
-        response = self.client.open(
-            '/api/products/{product_id}'.format(product_id=56),
-            method='GET',
-            headers=headers)
-        self.assert200(response,
-                       'Response body is : ' + response.data.decode('utf-8'))
+        response = self.client.get('/api/products/0')
+        self.assert200(response)
+        product = response.json
+        self.assertEqual(product["prod_id"], 0)
+        self.assertEqual(product["prefix"], "abc")
+        self.assertEqual([a["attribute_id"] for a in product["attributes"]], [0, 1, 2])
+        self.assertEqual(product["attributes"][0]["disp_name"], "属性1")
+        self.assertEqual(product["attributes"][1]["params"],
+                         [{"param_id": 0, "sort_order": 0, "type": "type2", "min": 1, "increment": 2}])
+
+    def test_get_product_by_id_not_found(self):
+        response = self.client.get('/api/products/999')
+        self.assert404(response)
+        self.assertEqual(response.json, {"message": "Product not found"})
+
+    def test_get_product_by_id_rejects_non_integer_id(self):
+        self.assert404(self.client.get('/api/products/abc'))
 
     def test_list_products(self):
-        """Test case for list_products
-
-        List all products
-        """
-        headers = { 
-            'Accept': 'application/json',
-        }
-        response = self.client.open(
-            '/api/products',
-            method='GET',
-            headers=headers)
-        self.assert200(response,
-                       'Response body is : ' + response.data.decode('utf-8'))
+        response = self.client.get('/api/products')
+        self.assert200(response)
+        self.assertEqual([p["prod_id"] for p in response.json], [0, 1])
+        self.assertEqual(response.json[1]["attributes"][1]["params"], [])
+
+    def test_list_products_reflects_store(self):
+        data.DB["products"].pop(1)
+        response = self.client.get('/api/products')
+        self.assertEqual([p["prod_id"] for p in response.json], [0])
+
+    def test_reads_during_writes(self):
+        body = {"prefix": "ghi", "prd_type": "ghi00", "cfg_type": "ghijkl", "sort_order": 2}
+        stop = threading.Event()
+
+        def write():
+            client = self.app.test_client()
+            while not stop.is_set():
+                pid = client.post('/api/products', json=body).json["prod_id"]
+                client.delete(f'/api/products/{pid}')
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            statuses = {self.client.get('/api/products').status_code for _ in range(100)}
+        finally:
+            stop.set()
+            writer.join()
+        self.assertEqual(statuses, {200})
+
+    def test_add_product(self):
+        body = {"prefix": "ghi", "prd_type": "ghi00", "cfg_type": "ghijkl", "sort_order": 2}
+        response = self.client.post('/api/products', json=body)
+        self.assertStatus(response, 201)
+        self.assertEqual(response.json, dict(body, prod_id=2, attributes=[]))
+        self.assertEqual(self.client.get('/api/products/2').json, response.json)
+
+        response = self.client.post('/api/products/2/attributes', json={
+            "code": "a", "data_type": "string", "disp_name": "属性", "unit": "", "contract": "type2",
+            "public": True, "masking": False, "online": True, "sort_order": 0})
+        self.assertEqual(response.json["attribute_id"], 0)
+
+    def test_add_product_rejects_invalid_body(self):
+        response = self.client.post('/api/products', json={"prefix": "ghi", "prd_type": "ghi00"})
+        self.assert400(response)
+        response = self.client.post('/api/products', json={
+            "prefix": "ghi", "prd_type": "ghi00", "cfg_type": "ghijkl", "sort_order": "x"})
+        self.assert400(response)
+        self.assertEqual(data.DB["next_product_id"], 2)
+
+    def test_delete_product_cascades(self):
+        response = self.client.delete('/api/products/0')
+        self.assertStatus(response, 204)
+        self.assert404(self.client.get('/api/products/0'))
+        self.assert404(self.client.delete('/api/products/0/attributes/1'))
+        self.assertEqual(data.DB["next_attribute_id"], {1: 2})
+        self.assertNotIn(0, data.DB["attribute_codes"])
+        self.assertEqual(set(data.DB["next_param_id"]), {(1, 0), (1, 1)})
+        self.assertEqual([p["prod_id"] for p in self.client.get('/api/products').json], [1])
+
+    def test_delete_product_not_found(self):
+        response = self.client.delete('/api/products/999')
+        self.assert404(response)
+        self.assertEqual(response.json, {"message": "Product not found"})
+
+    def test_deleted_product_id_is_not_reused(self):
+        self.client.delete('/api/products/1')
+        response = self.client.post('/api/products', json={
+            "prefix": "ghi", "prd_type": "ghi00", "cfg_type": "ghijkl", "sort_order": 1})
+        self.assertEqual(response.json["prod_id"], 2)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from openapi_server import profiling
+from openapi_server.test import BaseTestCase, ConfiguredAppTestCase
+
+
+class TestProfiling(ConfiguredAppTestCase):
+    """Per-request profiling tests"""
+
+    @classmethod
+    def app_config(cls):
+        cls.profile_dir = tempfile.mkdtemp()
+        return {"PROFILE_TOKEN": "secret", "PROFILE_DIR": cls.profile_dir}
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(cls.profile_dir, ignore_errors=True)
+
+    def test_unflagged_request_is_not_profiled(self):
+        response = self.client.get('/api/products')
+        self.assert200(response)
+        self.assertNotIn(profiling.ID_HEADER, response.headers)
+
+    def test_wrong_token_is_not_profiled(self):
+        response = self.client.get('/api/products', headers={profiling.HEADER: "nope"})
+        self.assertNotIn(profiling.ID_HEADER, response.headers)
+
+    def test_flagged_request_is_profiled_and_grouped(self):
+        response = self.client.get('/api/products', headers={profiling.HEADER: "secret"})
+        self.assert200(response)
+        profile_id = response.headers[profiling.ID_HEADER]
+        self.assertTrue(os.path.exists(os.path.join(self.profile_dir, profile_id + ".prof")))
+
+        response = self.client.get('/admin/profiles/' + profile_id,
+                                   headers={profiling.HEADER: "secret"})
+        self.assert200(response)
+        modules = response.json["modules"]
+        names = [entry["module"] for entry in modules]
+        self.assertIn("openapi_server.controllers.products_controller", names)
+        self.assertIn("openapi_server.encoder", names)
+        # JSON にしても自己時間の長い順のまま
+        tottimes = [entry["tottime"] for entry in modules]
+        self.assertEqual(tottimes, sorted(tottimes, reverse=True))
+
+    def test_overlapping_request_is_not_profiled(self):
+        # 他のリクエストをプロファイル中なら、プロファイルせずに処理する
+        with profiling._ACTIVE:
+            response = self.client.get('/api/products', headers={profiling.HEADER: "secret"})
+        self.assert200(response)
+        self.assertNotIn(profiling.ID_HEADER, response.headers)
+        response = self.client.get('/api/products', headers={profiling.HEADER: "secret"})
+        self.assertIn(profiling.ID_HEADER, response.headers)
+
+    def test_other_active_profiler_is_skipped(self):
+        with mock.patch.object(profiling.cProfile.Profile, "enable",
+                               side_effect=ValueError("Another profiling tool is already active")):
+            response = self.client.get('/api/products', headers={profiling.HEADER: "secret"})
+        self.assert200(response)
+        self.assertNotIn(profiling.ID_HEADER, response.headers)
+        self.assertFalse(profiling._ACTIVE.locked())
+
+    def test_profile_lookup_requires_token(self):
+        response = self.client.get('/admin/profiles/unknown')
+        self.assert403(response)
+
+
+class TestProfilingDisabled(BaseTestCase):
+    """Profiling is not wired in unless configured"""
+
+    def test_no_hooks_without_token(self):
+        self.assertNotIn("profile", self.app.view_functions)
+        response = self.client.get('/api/products', headers={profiling.HEADER: ""})
+        self.assertNotIn(profiling.ID_HEADER, response.headers)
+
+
+class TestModuleFor(unittest.TestCase):
+
+    def test_package_module_names(self):
+        path = os.path.join(profiling._PACKAGE_DIR, "controllers", "data.py")
+        self.assertEqual(profiling.module_for(path), "openapi_server.controllers.data")
+        self.assertEqual(profiling.module_for("~"), "builtins")
+
+
+if __name__ == '__main__':
+    unittest.main()
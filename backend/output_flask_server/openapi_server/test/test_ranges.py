@@ -0,0 +1,123 @@
+import random
+import unittest
+
+from openapi_server import ranges
+from openapi_server.controllers import data
+from openapi_server.test import BaseTestCase
+
+
+def _param_ids(result):
+    return [(m["prod_id"], m["attribute_id"], m["param"]["param_id"]) for m in result["items"]]
+
+
+class TestQueryType2Params(BaseTestCase):
+    """GET /params/type2 tests"""
+
+    def setUp(self):
+        # product 0 の attribute 1 (contract type2) に min 0〜9、increment 9〜0 の param を足す
+        for i in range(10):
+            self.client.post('/api/products/0/attributes/1/params',
+                             json={"type": "type2", "sort_order": i + 1, "min": i, "increment": 9 - i})
+
+    def query(self, query=""):
+        response = self.client.get('/api/params/type2' + query)
+        self.assert200(response)
+        return response.json
+
+    def test_range(self):
+        result = self.query('?low=1&high=3')
+        # 既存の param 0 (min 1) と、追加した min 1〜3 の param 2〜4
+        self.assertEqual(result["total"], 4)
+        self.assertEqual(_param_ids(result), [(0, 1, 0), (0, 1, 2), (0, 1, 3), (0, 1, 4)])
+        self.assertEqual(result["items"][0]["param"],
+                         {"param_id": 0, "sort_order": 0, "type": "type2", "min": 1, "increment": 2})
+        self.assertEqual(self.query('?low=5&high=4')["total"], 0)
+        self.assertEqual(self.query('?low=100')["items"], [])
+
+    def test_top_k_and_pagination(self):
+        self.assertEqual([m["param"]["increment"] for m in self.query('?field=increment&order=desc&limit=3')["items"]],
+                         [9, 8, 7])
+        page = self.query('?high=4&order=desc&offset=2&limit=2')
+        self.assertEqual((page["total"], [m["param"]["min"] for m in page["items"]]), (6, [2, 1]))
+        self.assertEqual([m["param"]["min"] for m in self.query('?offset=9')["items"]], [8, 9])
+
+    def test_follows_writes(self):
+        self.client.put('/api/products/0/attributes/1/params/5',
+                        json={"type": "type2", "sort_order": 0, "min": 100, "increment": 1})
+        self.assertEqual(_param_ids(self.query('?low=100')), [(0, 1, 5)])
+        self.assertEqual(self.query('?low=4&high=4')["total"], 0)
+
+        self.client.delete('/api/products/0/attributes/1/params/5')
+        self.assertEqual(self.query('?low=100')["total"], 0)
+
+        self.client.delete('/api/products/0/attributes/1')
+        self.assertEqual(self.query()["total"], 0)
+
+    def test_rejects_invalid_query(self):
+        self.assert400(self.client.get('/api/params/type2?field=sort_order'))
+        self.assert400(self.client.get('/api/params/type2?low=x'))
+
+
+class TestRangeIndex(unittest.TestCase):
+    def test_query_matches_scan(self):
+        rng = random.Random(7)
+        index = ranges.RangeIndex()
+        values = {}
+        for key in range(500):
+            values[key] = rng.randrange(50)
+            index.add(key, values[key], {"key": key})
+        for key in rng.sample(range(500), 200):
+            del values[key]
+            index.remove(key)
+        for key in rng.sample(sorted(values), 100):
+            values[key] = rng.randrange(50)
+            index.add(key, values[key], {"key": key})
+
+        expected = sorted((value, key) for key, value in values.items() if 10 <= value <= 20)
+        total, page = index.query(10, 20, offset=0, limit=1000)
+        self.assertEqual((total, [(v, k) for k, v, _ in page]), (len(expected), expected))
+        total, page = index.query(10, 20, descending=True, offset=5, limit=10)
+        self.assertEqual([(v, k) for k, v, _ in page], expected[::-1][5:15])
+        self.assertEqual(index.query(None, None, limit=1)[1][0][1], min(values.values()))
+
+    def test_bulk_matches_single_inserts(self):
+        rng = random.Random(3)
+        single, bulk = ranges.RangeIndex(), ranges.RangeIndex()
+        for key in range(100):
+            single.add(key, rng.randrange(20), key)
+            bulk.add(key, single._values[key][0], key)
+        with bulk.bulk():
+            for key in range(100, 300):
+                value = rng.randrange(20)
+                single.add(key, value, key)
+                bulk.add(key, value, key)
+            for key in (5, 150, 250):
+                single.remove(key)
+                bulk.remove(key)
+            single.add(150, 7, 150)
+            bulk.add(150, 7, 150)
+            bulk.add(50, None, 50)
+            single.add(50, None, 50)
+        self.assertEqual(len(bulk), len(single))
+        self.assertEqual(bulk.query(limit=1000), single.query(limit=1000))
+
+    def test_none_value_removes(self):
+        index = ranges.RangeIndex()
+        index.add("a", 1, {})
+        index.add("a", None, {})
+        self.assertEqual((len(index), index.query()), (0, (0, [])))
+
+    def test_load_products_builds_index(self):
+        data.load_products([{"prod_id": 0, "prefix": "p", "prd_type": "t", "cfg_type": "c",
+                             "sort_order": 0, "attributes": [
+                                 {"attribute_id": 0, "code": "a", "data_type": "string",
+                                  "disp_name": "属性", "unit": "", "contract": "type2",
+                                  "public": True, "masking": False, "online": True, "sort_order": 0,
+                                  "params": [{"param_id": i, "type": "type2", "sort_order": i,
+                                              "min": -i, "increment": i} for i in range(5)]}]}])
+        self.assertEqual([v for _, v, _ in data.DB["param_ranges"]["min"].query()[1]], [-4, -3, -2, -1, 0])
+        data.initialize_data()
+
+
+if __name__ == '__main__':
+    unittest.main()
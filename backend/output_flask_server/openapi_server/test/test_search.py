@@ -0,0 +1,126 @@
+import json
+import unittest
+
+from openapi_server import search
+from openapi_server import synthetic
+from openapi_server.controllers import data
+from openapi_server.test import BaseTestCase
+
+
+def _hit_ids(hits):
+    return [(h["prod_id"], h["attribute_id"], h.get("param_id")) for h in hits]
+
+
+class TestSearch(BaseTestCase):
+    """GET /search tests"""
+
+    def search(self, query):
+        response = self.client.get('/api/search' + query)
+        self.assert200(response)
+        return response.json
+
+    def test_ranks_hits(self):
+        hits = self.search('?q=属性1')
+        self.assertEqual(_hit_ids(hits), [(0, 0, None), (1, 0, None)])
+        self.assertEqual(hits[0], {"kind": "attribute", "prod_id": 0, "attribute_id": 0,
+                                   "field": "disp_name", "value": "属性1", "score": 1.5})
+        self.assertEqual(hits[1]["value"], "属性1製品1")
+
+    def test_searches_params_and_codes(self):
+        hits = self.search('?q=code')
+        self.assertEqual(_hit_ids(hits), [(0, 0, 0), (0, 0, 1), (0, 2, 0)])
+        self.assertEqual({h["kind"] for h in hits}, {"param"})
+        self.assertEqual(_hit_ids(self.search('?q=コード&kind=attribute')), [])
+
+    def test_normalizes_width_and_case(self):
+        # 全角英数字と大文字は NFKC + casefold で code と一致する
+        self.assertEqual(_hit_ids(self.search('?q=ＡＴＴＲ２')), [(0, 1, None)])
+        self.assertEqual(len(self.search('?q=attr&limit=2')), 2)
+
+    def test_follows_writes(self):
+        response = self.client.post('/api/products/1/attributes', json={
+            "code": "weight", "data_type": "number", "disp_name": "重量", "unit": "kg",
+            "contract": "type1", "public": True, "masking": False, "online": True, "sort_order": 2})
+        aid = response.json["attribute_id"]
+        self.client.post('/api/products/1/attributes/%d/params' % aid,
+                         json={"type": "type1", "sort_order": 0, "code": "w1", "disp_name": "重量区分"})
+        self.assertEqual(_hit_ids(self.search('?q=重量')), [(1, aid, None), (1, aid, 0)])
+
+        self.client.put('/api/products/1/attributes/%d/params/0' % aid,
+                        json={"type": "type1", "sort_order": 0, "code": "w1", "disp_name": "区分"})
+        self.assertEqual(_hit_ids(self.search('?q=重量')), [(1, aid, None)])
+
+        self.client.delete('/api/products/1/attributes/%d' % aid)
+        self.assertEqual(self.search('?q=重量'), [])
+        self.assertEqual(self.search('?q=区分'), [])
+
+        self.client.delete('/api/products/0')
+        self.assertEqual(self.search('?q=code'), [])
+
+    def test_index_matches_rebuild(self):
+        generator = synthetic.CatalogGenerator(seed=9, attributes="1-3", params="0-3")
+        body = "".join(json.dumps(r, ensure_ascii=False) + "\n"
+                       for r in generator.iter_records(10, start_id=5))
+        self.client.post('/api/import', data=body, content_type="application/x-ndjson")
+        self.client.delete('/api/products/5/attributes/0')
+        incremental = data.DB["search_index"]
+        data.load_products(list(data.DB["products"].values()))
+        self.assertEqual(incremental._documents, data.DB["search_index"]._documents)
+        self.assertEqual(incremental._postings, data.DB["search_index"]._postings)
+        self.assertEqual(incremental._first, data.DB["search_index"]._first)
+
+    def test_rejects_invalid_query(self):
+        self.assert400(self.client.get('/api/search'))
+        self.assert400(self.client.get('/api/search?q=a&kind=product'))
+
+
+class TestNgramIndex(unittest.TestCase):
+    def test_remove_drops_empty_postings(self):
+        index = search.NgramIndex()
+        index.add((0, 0, None, "code"), "ab")
+        index.add((0, 1, None, "code"), "bc")
+        index.remove((0, 0, None, "code"))
+        self.assertEqual(set(index._postings), {"bc", "c" + search.END})
+        self.assertEqual(index._first, {"b": {"bc"}, "c": {"c" + search.END}})
+        index.add((0, 1, None, "code"), "")
+        self.assertEqual((len(index), index._postings, index._first), (0, {}, {}))
+
+    def test_single_character_query(self):
+        index = search.NgramIndex()
+        index.add((0, 0, None, "code"), "ab")
+        index.add((0, 1, None, "code"), "b")
+        index.add((0, 2, None, "code"), "cd")
+        self.assertEqual([h["attribute_id"] for h in index.search("b")], [1, 0])
+        self.assertEqual([h["attribute_id"] for h in index.search("Ａ")], [0])
+        self.assertEqual(index.search("e"), [])
+
+    def test_bulk_matches_single_inserts(self):
+        documents = [((0, i, None, "code"), f"code{i % 7}x") for i in range(30)]
+        single, bulk = search.NgramIndex(), search.NgramIndex()
+        single.add((1, 0, None, "code"), "old")
+        bulk.add((1, 0, None, "code"), "old")
+        with bulk.bulk():
+            for key, value in documents:
+                bulk.add(key, value)
+            bulk.remove((0, 3, None, "code"))
+            bulk.add((0, 4, None, "code"), "new")
+            bulk.remove((1, 0, None, "code"))
+        for key, value in documents:
+            single.add(key, value)
+        single.remove((0, 3, None, "code"))
+        single.add((0, 4, None, "code"), "new")
+        single.remove((1, 0, None, "code"))
+        self.assertEqual(bulk._documents, single._documents)
+        self.assertEqual(bulk._postings, single._postings)
+        self.assertEqual(bulk._first, single._first)
+
+    def test_candidates_are_verified(self):
+        index = search.NgramIndex()
+        # "ab-ba" は "ab" と "ba" を両方含むが "aba" は含まないので、候補から除かれる
+        index.add((0, 0, None, "code"), "ab-ba")
+        index.add((0, 1, None, "code"), "xabax")
+        self.assertEqual([h["attribute_id"] for h in index.search("aba")], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import io
+import json
+import logging
+import unittest
+from unittest import mock
+
+from openapi_server import slow_log
+from openapi_server.test import BaseTestCase
+
+
+class TestSlowRequestLog(BaseTestCase):
+    """Slow request log tests"""
+
+    def setUp(self):
+        # 共有のアプリケーションに、しきい値 0 で全リクエストを記録するログをテストの間だけ足す
+        self.stream = io.StringIO()
+        self.slow_log = slow_log.SlowRequestLog(0, logging.StreamHandler(self.stream))
+        self.instrumentation = self.app.extensions["instrumentation"]
+        self.instrumentation.add_listener(self.slow_log.observe)
+
+    def tearDown(self):
+        self.instrumentation.remove_listener(self.slow_log.observe)
+        self.slow_log.close()
+
+    def read_lines(self):
+        self.slow_log.close()
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_records_request_shape_and_phases(self):
+        self.client.get('/api/products/0')
+        self.client.post('/api/products/0/attributes/0/params',
+                         json={"type": "type1", "sort_order": 9, "code": "c", "disp_name": "表示"})
+        first, second = self.read_lines()
+
+        self.assertEqual(first["operation_id"], "get_product_by_id")
+        self.assertEqual(first["path_params"], {"productId": 0})
+        self.assertEqual(first["status"], 200)
+        self.assertGreater(first["response_bytes"], 0)
+        self.assertEqual(set(first["phases_ms"]),
+                         {"validation", "controller", "from_dict", "serialization"})
+        self.assertEqual(first["store"], {"products": 2, "attributes": 3})
+
+        self.assertEqual(second["operation_id"], "add_param")
+        self.assertGreater(second["request_bytes"], 0)
+        self.assertEqual(second["store"]["params"], 3)
+
+    def test_store_sizes_skip_tombstones(self):
+        with mock.patch.object(self.app.extensions["compactor"], "ratio", 1.0):
+            self.client.delete('/api/products/0/attributes/0/params/0')
+            self.client.delete('/api/products/0/attributes/2')
+            self.client.post('/api/products/0/attributes/0/params',
+                             json={"type": "type1", "sort_order": 9, "code": "c", "disp_name": "表示"})
+        param_delete, attribute_delete, param_add = self.read_lines()
+        self.assertEqual(param_delete["store"], {"products": 2, "attributes": 3, "params": 1})
+        self.assertEqual(attribute_delete["store"], {"products": 2, "attributes": 2})
+        self.assertEqual(param_add["store"], {"products": 2, "attributes": 2, "params": 2})
+
+    def test_fast_requests_are_skipped(self):
+        self.slow_log.threshold = 60.0
+        self.client.get('/api/products')
+        self.assertEqual(self.read_lines(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
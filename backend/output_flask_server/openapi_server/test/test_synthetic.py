@@ -0,0 +1,82 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from openapi_server import synthetic
+from openapi_server.controllers import data
+from openapi_server.controllers.parameters_controller import (
+    _get_expected_param_type_from_contract,
+)
+from openapi_server.models.product import Product
+
+
+class TestCatalogGenerator(unittest.TestCase):
+    """synthetic.CatalogGenerator tests"""
+
+    def tearDown(self):
+        data.initialize_data()
+
+    def generate(self, seed=7, count=20):
+        generator = synthetic.CatalogGenerator(seed=seed, attributes="0-6", params="0-4")
+        return list(generator.iter_products(count))
+
+    def test_products_are_valid_models(self):
+        for product in self.generate():
+            model = Product.from_dict(product)
+            for attribute in model.attributes:
+                expected = _get_expected_param_type_from_contract(attribute.contract)
+                for param in attribute.params:
+                    self.assertEqual(param.type, expected)
+                    if expected == "type2":
+                        self.assertIsInstance(param.min, int)
+                    else:
+                        self.assertIsInstance(param.disp_name, str)
+
+    def test_seed_is_reproducible(self):
+        self.assertEqual(self.generate(seed=3), self.generate(seed=3))
+        self.assertNotEqual(self.generate(seed=3), self.generate(seed=4))
+
+    def test_records_match_products(self):
+        generator = synthetic.CatalogGenerator(seed=1, attributes="1-3", params="1-3")
+        records = list(generator.iter_records(5))
+        generator = synthetic.CatalogGenerator(seed=1, attributes="1-3", params="1-3")
+        products = list(generator.iter_products(5))
+        self.assertEqual(
+            sum(len(a["params"]) for p in products for a in p["attributes"]),
+            sum(r["kind"] == "param" for r in records))
+        self.assertEqual(products[0]["attributes"][0]["code"],
+                         next(r for r in records if r["kind"] == "attribute")["code"])
+        self.assertEqual(sum(r["kind"] == "product" for r in records), 5)
+        for record in records:
+            if record["kind"] == "param":
+                self.assertIn("attribute_id", record)
+                self.assertIn("prod_id", record)
+
+    def test_catalog_loads_into_db(self):
+        products = self.generate(count=5)
+        data.load_products(products)
+        self.assertEqual(data.DB["next_product_id"], 5)
+        self.assertEqual(len(data.DB["products"]), 5)
+
+    def test_invalid_range(self):
+        with self.assertRaises(ValueError):
+            synthetic.CatalogGenerator(attributes="5-2")
+
+    def test_cli_streams_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "catalog.json")
+            synthetic.main(["--products", "3", "--format", "json", "--output", path])
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(len(json.load(f)), 3)
+
+    def test_write_ndjson(self):
+        fp = io.StringIO()
+        synthetic.write_ndjson(synthetic.CatalogGenerator(seed=0).iter_records(2), fp)
+        lines = fp.getvalue().splitlines()
+        self.assertEqual(json.loads(lines[0])["kind"], "product")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import copy
+import unittest
+
+from openapi_server import typing_utils
+from openapi_server import util
+from openapi_server.controllers import data
+from openapi_server.models.attribute import Attribute
+from openapi_server.models.param_item import ParamItem
+from openapi_server.models.product import Product
+
+
+def _reference_deserialize(value, klass):
+    """The reflective deserializer that util.deserialize_model replaced."""
+    if value is None:
+        return None
+    if klass in (int, float, str, bool, bytearray):
+        return util._deserialize_primitive(value, klass)
+    elif typing_utils.is_generic(klass):
+        if typing_utils.is_list(klass):
+            return [_reference_deserialize(v, klass.__args__[0]) for v in value]
+        if typing_utils.is_dict(klass):
+            return {k: _reference_deserialize(v, klass.__args__[1])
+                    for k, v in value.items()}
+    else:
+        return _reference_deserialize_model(value, klass)
+
+
+def _reference_deserialize_model(value, klass):
+    instance = klass()
+    if not instance.openapi_types:
+        return value
+    for attr, attr_type in instance.openapi_types.items():
+        if value is not None \
+                and instance.attribute_map[attr] in value \
+                and isinstance(value, (list, dict)):
+            setattr(instance, attr, _reference_deserialize(
+                value[instance.attribute_map[attr]], attr_type))
+    return instance
+
+
+class TestDeserializeModel(unittest.TestCase):
+    """util.deserialize_model plan tests"""
+
+    def assertSameResult(self, value, klass):
+        try:
+            expected = _reference_deserialize_model(value, klass)
+        except Exception as e:
+            with self.assertRaises(type(e)) as cm:
+                util.deserialize_model(value, klass)
+            self.assertEqual(str(cm.exception), str(e))
+            return
+        actual = util.deserialize_model(value, klass)
+        self.assertIs(type(actual), type(expected))
+        self.assertEqual(actual, expected)
+
+    def test_products_match_reference(self):
+        for product_data in data.DB["products"].values():
+            self.assertSameResult(product_data, Product)
+            result = util.deserialize_model(product_data, Product)
+            self.assertIsInstance(result.attributes[0], Attribute)
+            if result.attributes[0].params:
+                self.assertIsInstance(result.attributes[0].params[0], ParamItem)
+
+    def test_edge_cases_match_reference(self):
+        attribute = copy.deepcopy(data.DB["products"][0]["attributes"][0])
+        cases = [
+            (None, Attribute),
+            ("not a dict", Attribute),
+            ({}, ParamItem),
+            ({"param_id": "3", "sort_order": 1.0, "type": "type1"}, ParamItem),
+            ({"param_id": None}, ParamItem),
+            ({"param_id": 0, "sort_order": 0, "type": "bad"}, ParamItem),
+            (dict(attribute, params=None), Attribute),
+            (dict(attribute, params=[None]), Attribute),
+            (dict(attribute, extra="ignored"), Attribute),
+        ]
+        for value, klass in cases:
+            with self.subTest(value=value, klass=klass.__name__):
+                self.assertSameResult(value, klass)
+
+    def test_plan_is_cached(self):
+        util.deserialize_model({}, ParamItem)
+        plan = util._PLANS[ParamItem]
+        util.deserialize_model({}, ParamItem)
+        self.assertIs(util._PLANS[ParamItem], plan)
+
+
+if __name__ == '__main__':
+    unittest.main()
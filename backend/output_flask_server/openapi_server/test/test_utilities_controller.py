@@ -1,29 +1,24 @@
 import unittest
 
-from flask import json
-
-from openapi_server.models.error import Error  # noqa: E501
-from openapi_server.models.refresh_mock_data200_response import RefreshMockData200Response  # noqa: E501
+from openapi_server.controllers import data
 from openapi_server.test import BaseTestCase
 
 
 class TestUtilitiesController(BaseTestCase):
-    """UtilitiesController integration test stubs"""
+    """UtilitiesController integration tests"""
 
     def test_refresh_mock_data(self):
-        """Test case for refresh_mock_data
-
-        Reset all mock data to its initial state
-        """
-        headers = { 
-            'Accept': 'application/json',
-        }
-        response = self.client.open(
-            '/api/refresh',
-            method='POST',
-            headers=headers)
-        self.assert200(response,
-                       'Response body is : ' + response.data.decode('utf-8'))
+        self.client.delete('/api/products/0/attributes/0')
+        self.client.post('/api/products/1/attributes/0/params',
+                         json={"type": "type1", "sort_order": 0, "code": "c", "disp_name": "d"})
+
+        response = self.client.post('/api/refresh')
+        self.assert200(response)
+        self.assertEqual(response.json, {"message": "Mock data has been reset to the initial state."})
+        self.assertEqual(self.client.get('/api/products').json,
+                         [self.client.get('/api/products/%d' % pid).json for pid in (0, 1)])
+        self.assertEqual(len(data.DB["products"][0]["attributes"]), 3)
+        self.assertEqual(data.DB["next_param_id"][(1, 0)], 0)
 
 
 if __name__ == '__main__':
@@ -1,5 +1,60 @@
+import fcntl
 import logging
+import logging.handlers
 import os
+import queue
+import sys
+import threading
+import time
+import traceback
+
+
+def _open_fd(path, open_flags, permissions):
+    """
+    ファイルを開いてディスクリプタを返します。
+
+    os.umask() はプロセス全体の設定で、スレッドから一時的に変更すると
+    他のスレッドのファイル作成と競合するため使いません。代わりにファイルを
+    新規作成したときだけ、開いたディスクリプタに os.fchmod() で
+    パーミッションを設定します (umask の影響を受けません)。
+    既存のファイルのパーミッションは変更しません。
+    """
+    while True:
+        try:
+            fd = os.open(path, open_flags | os.O_CREAT | os.O_EXCL, permissions)
+            created = True
+            break
+        except FileExistsError:
+            pass
+        try:
+            fd = os.open(path, open_flags)
+            created = False
+            break
+        except FileNotFoundError:
+            pass  # 2回の open の間に削除された場合は作成からやり直す
+    if created:
+        try:
+            os.fchmod(fd, permissions)
+        except BaseException:
+            os.close(fd)
+            raise
+    return fd
+
+
+def open_with_permissions(path, mode, permissions, encoding=None, errors=None):
+    """permissions を指定してファイルを開き、ファイルオブジェクトを返します (_open_fd 参照)。"""
+    open_flags = os.O_WRONLY
+    if "a" in mode:
+        open_flags |= os.O_APPEND
+    elif "w" in mode:
+        open_flags |= os.O_TRUNC
+
+    fd = _open_fd(path, open_flags, permissions)
+    try:
+        return os.fdopen(fd, mode, encoding=encoding, errors=errors)
+    except BaseException:
+        os.close(fd)
+        raise
 
 
 class MyFileHandler(logging.FileHandler):
@@ -32,49 +87,320 @@ class MyFileHandler(logging.FileHandler):
 
     def _open(self):
         # os.open() を使用してファイルを開き、パーミッションを明示的に指定
-        # O_CREAT: ファイルが存在しない場合は作成
-        # O_WRONLY: 書き込み専用で開く
-        # O_APPEND: 追記モード (mode='a' の場合)
-        # mode='w' の場合は O_TRUNC を追加するなどの調整が必要
-        open_flags = os.O_WRONLY | os.O_CREAT
-        if self.mode == "a":
-            open_flags |= os.O_APPEND
-        elif self.mode == "w":  # 'w' や 'w+' の場合
-            open_flags |= os.O_TRUNC
-
-        # umaskを一時的に0にして、指定したパーミッションがそのまま適用されるようにする
-        original_umask = os.umask(0)
+        # (umask は変更せず、新規作成時に fchmod で設定する)
+        return open_with_permissions(
+            self.baseFilename, self.mode, self.permissions, self.encoding, self.errors
+        )
+
+
+class QueueFileHandler(logging.handlers.QueueHandler):
+    """
+    MyFileHandler の非同期版。
+
+    呼び出し側 (リクエストスレッドなど) はレコードをキューに入れるだけで、
+    整形とファイルへの書き込みはバックグラウンドの書き込みスレッドが行います。
+    ファイルは MyFileHandler と同じく permissions で作成されます。
+    close() はキューに残ったレコードを書き出してから終了します。
+    """
+
+    def __init__(
+        self,
+        filename,
+        mode="a",
+        encoding=None,
+        errors=None,
+        permissions=0o600,
+    ):
+        super().__init__(queue.SimpleQueue())
+        self.file_handler = MyFileHandler(
+            filename,
+            mode=mode,
+            encoding=encoding,
+            delay=True,
+            errors=errors,
+            permissions=permissions,
+        )
+        self._listener = logging.handlers.QueueListener(
+            self.queue, self.file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def setFormatter(self, fmt):
+        # 整形は書き込みスレッド側のハンドラで行う
+        self.file_handler.setFormatter(fmt)
+
+    def prepare(self, record):
+        # 親クラスはここで整形するが、整形も書き込みスレッドに任せる。
+        # ただし %-引数は呼び出し時点の値で確定させておく。
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def close(self):
+        if self._listener._thread is not None:
+            self._listener.stop()  # キューを最後まで処理してからスレッドを止める
+        self.file_handler.close()
+        super().close()
+
+
+class BufferedRotatingFileHandler(logging.Handler):
+    """
+    レコードをバッファにまとめて書き込み、サイズと時間でローテートするハンドラ。
+
+    - 整形したレコードはメモリ上のバッファに溜め、buffer_size バイトに達したとき
+      または flush_interval 秒毎に、1回の write システムコールで書き出します。
+    - max_bytes を超える書き込みの前、または rotate_interval 秒毎にローテートします
+      (filename.1, filename.2, ... backup_count 個まで。0 ならローテートしない)。
+    - 新しく作成するファイルもローテートしたファイルも permissions のパーミッションにします。
+    - close() (logging.shutdown() から呼ばれる) でバッファを書き出してから閉じます。
+    """
+
+    def __init__(
+        self,
+        filename,
+        permissions=0o600,
+        max_bytes=0,
+        rotate_interval=0,
+        backup_count=5,
+        buffer_size=64 * 1024,
+        flush_interval=1.0,
+        encoding="utf-8",
+        errors=None,
+    ):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.permissions = permissions
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.encoding = encoding
+        self.errors = errors or "strict"
+        self.terminator = "\n"
+
+        # バッファとファイル操作は Handler.lock (handle() が emit() の間保持する) で保護する
+        self._buffer = bytearray()
+        self._fd = None
+        self._size = 0
+        self._next_rollover = None
+        self._open_file()
+
+        self._closed = threading.Event()
+        self._flusher = None
+        if flush_interval and flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name="log-flusher", daemon=True
+            )
+            self._flusher.start()
+
+    def _open_file(self):
+        self._fd = _open_fd(
+            self.baseFilename, os.O_WRONLY | os.O_APPEND, self.permissions
+        )
+        self._size = os.fstat(self._fd).st_size
+        if self.rotate_interval and self.backup_count > 0:
+            self._next_rollover = time.time() + self.rotate_interval
+
+    def _rotate(self):
+        # backup_count が 0 なら _write から呼ばれない (ローテートで書いたログを消さない)
+        os.close(self._fd)
+        self._fd = None
+        for i in range(self.backup_count - 1, 0, -1):
+            source = f"{self.baseFilename}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.baseFilename}.{i + 1}")
+        rotated = self.baseFilename + ".1"
+        os.replace(self.baseFilename, rotated)
+        os.chmod(rotated, self.permissions)
+        self._open_file()
+
+    def _write(self, data):
+        """data をファイルに書き出します (self.lock を保持して呼ぶこと)。"""
+        if self._fd is None:
+            return
+        if self._next_rollover is not None and time.time() >= self._next_rollover:
+            self._rotate()
+        elif (self.max_bytes and self.backup_count > 0 and self._size
+              and self._size + len(data) > self.max_bytes):
+            self._rotate()
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+        self._size += len(data)
+
+    def emit(self, record):
         try:
-            # self.baseFilename は親クラスで設定される実際のファイルパス
-            fd = os.open(self.baseFilename, open_flags, self.permissions)
-            stream = os.fdopen(
-                fd, self.mode, encoding=self.encoding, errors=self.errors
+            self._buffer += (self.format(record) + self.terminator).encode(
+                self.encoding, self.errors
             )
+            if len(self._buffer) >= self.buffer_size:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            if self._buffer:
+                data = self._buffer
+                self._buffer = bytearray()
+                self._write(data)
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                if logging.raiseExceptions:
+                    traceback.print_exc(file=sys.stderr)
+
+    def close(self):
+        self._closed.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        try:
+            self.flush()
         finally:
-            os.umask(original_umask)  # umaskを元に戻す
-        return stream
+            with self.lock:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+            super().close()
+
+
+class AppendFileHandler(logging.Handler):
+    """
+    複数のワーカープロセスが同じファイルに書き込んでも、レコードが混ざらないハンドラ。
+
+    - 1レコードを整形してから1つのバッファにまとめ、O_APPEND で開いた
+      ディスクリプタに1回の write で書き込みます。
+    - atomic_size バイト以下のレコードはロックなしで書き込みます
+      (O_APPEND の1回の write はプロセス間で分断されない)。
+      それより大きいレコードはロックファイルの排他ロック下で書き込み、
+      write が途中までしか書けなかった場合も大きいレコード同士が混ざらないようにします。
+    - max_bytes を超えたときのローテートもロックファイル (filename + ".lock") で
+      プロセス間で調整します (backup_count が 0 ならローテートしない)。他のプロセスがローテートしたことは、パスの inode と
+      開いているファイルの inode の比較で検出して開き直します。
+    - ファイルは permissions で作成されます。
+    """
+
+    def __init__(
+        self,
+        filename,
+        permissions=0o600,
+        max_bytes=0,
+        backup_count=5,
+        atomic_size=4096,
+        encoding="utf-8",
+        errors=None,
+    ):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.lockFilename = self.baseFilename + ".lock"
+        self.permissions = permissions
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.atomic_size = atomic_size
+        self.encoding = encoding
+        self.errors = errors or "strict"
+        self.terminator = "\n"
+        self._lock_fd = _open_fd(self.lockFilename, os.O_WRONLY, permissions)
+        self._fd = None
+        self._ino = None
+        self._open_file()
+
+    def _open_file(self):
+        if self._fd is not None:
+            os.close(self._fd)
+        self._fd = _open_fd(self.baseFilename, os.O_WRONLY | os.O_APPEND, permissions=self.permissions)
+        self._ino = os.fstat(self._fd).st_ino
+
+    def _reopen_if_rotated(self):
+        """他のプロセスがローテートしていればファイルを開き直します。"""
+        try:
+            if os.stat(self.baseFilename).st_ino == self._ino:
+                return
+        except FileNotFoundError:
+            pass
+        self._open_file()
+
+    def _rotate(self, size):
+        """size バイトを書くと max_bytes を超える場合、ロックファイルの排他ロック下でローテートします。"""
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            self._reopen_if_rotated()
+            if os.fstat(self._fd).st_size + size <= self.max_bytes:
+                return  # 他のプロセスがローテート済み
+            for i in range(self.backup_count - 1, 0, -1):
+                source = f"{self.baseFilename}.{i}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.baseFilename}.{i + 1}")
+            os.replace(self.baseFilename, self.baseFilename + ".1")
+            os.chmod(self.baseFilename + ".1", self.permissions)
+            self._open_file()
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _write_all(self, data):
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+
+    def emit(self, record):
+        try:
+            data = (self.format(record) + self.terminator).encode(self.encoding, self.errors)
+            # backup_count が 0 ならローテートしない (共有のファイルを消すと他のプロセスのログも消える)
+            if self.max_bytes and self.backup_count > 0:
+                self._reopen_if_rotated()
+                if os.fstat(self._fd).st_size + len(data) > self.max_bytes:
+                    self._rotate(len(data))
+            if len(data) <= self.atomic_size:
+                self._write_all(data)
+            else:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+                try:
+                    self._write_all(data)
+                finally:
+                    fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        with self.lock:
+            for name in ("_fd", "_lock_fd"):
+                fd = getattr(self, name)
+                if fd is not None:
+                    os.close(fd)
+                    setattr(self, name, None)
+        super().close()
 
 
-# ロガーの設定
-logger = logging.getLogger("permission_test_logger")
-logger.setLevel(logging.INFO)
+if __name__ == "__main__":
+    # ロガーの設定
+    logger = logging.getLogger("permission_test_logger")
+    logger.setLevel(logging.INFO)
 
-# カスタムハンドラを使用 (パーミッションを 0o600 rw------- に設定)
-# ファイルが存在しない場合にこのパーミッションで作成されます。
-# ファイルが既に存在し、かつ追記モードの場合、既存ファイルのパーミッションは変更されません。
-# もし既存ファイルのパーミッションも変更したい場合は、ファイルを開く前に os.chmod() を呼び出す必要があります。
-file_handler = MyFileHandler(
-    "app_specific_permission.log", mode="w", permissions=0o600
-)  # 'w'で新規作成または上書き
-# file_handler = MyFileHandler('app_specific_permission.log', mode='a', permissions=0o600) # 'a'で追記
+    # カスタムハンドラを使用 (パーミッションを 0o600 rw------- に設定)
+    # ファイルが存在しない場合にこのパーミッションで作成されます。
+    # ファイルが既に存在し、かつ追記モードの場合、既存ファイルのパーミッションは変更されません。
+    # もし既存ファイルのパーミッションも変更したい場合は、ファイルを開く前に os.chmod() を呼び出す必要があります。
+    file_handler = MyFileHandler(
+        "app_specific_permission.log", mode="w", permissions=0o600
+    )  # 'w'で新規作成または上書き
+    # file_handler = MyFileHandler('app_specific_permission.log', mode='a', permissions=0o600) # 'a'で追記
+    # 書き込みをバックグラウンドスレッドに任せる場合は QueueFileHandler を使います
+    # file_handler = QueueFileHandler('app_specific_permission.log', mode='a', permissions=0o600)
 
-formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-file_handler.setFormatter(formatter)
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    file_handler.setFormatter(formatter)
 
-logger.addHandler(file_handler)
+    logger.addHandler(file_handler)
 
-logger.info("このログは指定されたパーミッションでファイルに書き込まれます。")
+    logger.info("このログは指定されたパーミッションでファイルに書き込まれます。")
 
-print(
-    f"ログファイル 'app_specific_permission.log' を確認してください。パーミッションが {oct(0o600)} になっているはずです。"
-)
+    print(
+        f"ログファイル 'app_specific_permission.log' を確認してください。パーミッションが {oct(0o600)} になっているはずです。"
+    )
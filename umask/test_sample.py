@@ -0,0 +1,285 @@
+import glob
+import logging
+import multiprocessing
+import os
+import stat
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from sample import (
+    AppendFileHandler,
+    BufferedRotatingFileHandler,
+    MyFileHandler,
+    QueueFileHandler,
+    open_with_permissions,
+)
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def _append_worker(path, worker, count):
+    handler = AppendFileHandler(path, max_bytes=256 * 1024, backup_count=100)
+    logger = logging.Logger(f"append_worker_{worker}")
+    logger.addHandler(handler)
+    for seq in range(count):
+        size = (seq * 997) % 9000  # atomic_size をまたぐ長さを混ぜる
+        logger.info("%d %d %d %s", worker, seq, size, chr(ord("a") + worker) * size)
+    handler.close()
+
+
+class TestOpenWithPermissions(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "test.log")
+        self.original_umask = os.umask(0o077)
+
+    def tearDown(self):
+        os.umask(self.original_umask)
+        self.tmp.cleanup()
+
+    def test_new_file_gets_requested_mode_regardless_of_umask(self):
+        open_with_permissions(self.path, "a", 0o644).close()
+        self.assertEqual(_mode(self.path), 0o644)
+        self.assertEqual(os.umask(0o077), 0o077)  # umask は変更されていない
+
+    def test_existing_file_mode_is_kept(self):
+        open_with_permissions(self.path, "a", 0o600).close()
+        open_with_permissions(self.path, "w", 0o644).close()
+        self.assertEqual(_mode(self.path), 0o600)
+
+    def test_truncate_and_append(self):
+        with open_with_permissions(self.path, "w", 0o600) as f:
+            f.write("a\n")
+        with open_with_permissions(self.path, "a", 0o600) as f:
+            f.write("b\n")
+        with open(self.path) as f:
+            self.assertEqual(f.read(), "a\nb\n")
+        with open_with_permissions(self.path, "w", 0o600) as f:
+            f.write("c\n")
+        with open(self.path) as f:
+            self.assertEqual(f.read(), "c\n")
+
+
+class TestQueueFileHandler(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "queue.log")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_records_from_threads_are_written_on_close(self):
+        handler = QueueFileHandler(self.path, permissions=0o640)
+        handler.setFormatter(logging.Formatter("%(threadName)s %(message)s"))
+        logger = logging.Logger("queue_test")
+        logger.addHandler(handler)
+
+        def work(n):
+            for i in range(200):
+                logger.info("record %d-%d", n, i)
+
+        threads = [threading.Thread(target=work, args=(n,), name=f"t{n}") for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        handler.close()
+
+        with open(self.path) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 8 * 200)
+        self.assertIn("t3 record 3-199", lines)
+        self.assertEqual(_mode(self.path), 0o640)
+
+    def test_args_are_bound_at_call_time(self):
+        handler = QueueFileHandler(self.path)
+        logger = logging.Logger("queue_args_test")
+        logger.addHandler(handler)
+        value = ["before"]
+        logger.warning("value=%s", value)
+        value[0] = "after"
+        handler.close()
+        with open(self.path) as f:
+            self.assertEqual(f.read(), "value=['before']\n")
+
+
+class TestMyFileHandler(unittest.TestCase):
+    def test_creates_file_with_permissions(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "my.log")
+            handler = MyFileHandler(path, mode="w", permissions=0o600)
+            handler.close()
+            self.assertEqual(_mode(path), 0o600)
+
+
+class TestBufferedRotatingFileHandler(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "buffered.log")
+        self.logger = logging.Logger("buffered_test")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_handler(self, **kwargs):
+        kwargs.setdefault("flush_interval", 0)
+        handler = BufferedRotatingFileHandler(self.path, **kwargs)
+        self.logger.addHandler(handler)
+        return handler
+
+    def read(self, path=None):
+        with open(path or self.path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_records_are_buffered_until_flush(self):
+        handler = self.make_handler(buffer_size=1024)
+        self.logger.info("一件目")
+        self.assertEqual(self.read(), "")
+        handler.flush()
+        self.assertEqual(self.read(), "一件目\n")
+        handler.close()
+
+    def test_full_buffer_is_written_in_one_call(self):
+        handler = self.make_handler(buffer_size=100)
+        with mock.patch("sample.os.write", wraps=os.write) as write:
+            for i in range(10):
+                self.logger.info("record %02d", i)  # 10 バイト x 10
+            self.assertEqual(write.call_count, 1)
+        handler.close()
+        self.assertEqual(len(self.read().splitlines()), 10)
+
+    def test_close_flushes(self):
+        handler = self.make_handler(buffer_size=1 << 20)
+        for i in range(100):
+            self.logger.info("line %d", i)
+        handler.close()
+        self.assertEqual(len(self.read().splitlines()), 100)
+
+    def test_periodic_flush(self):
+        handler = self.make_handler(buffer_size=1 << 20, flush_interval=0.01)
+        self.logger.info("tick")
+        for _ in range(200):
+            if self.read():
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual(self.read(), "tick\n")
+        handler.close()
+
+    def test_size_rotation_keeps_permissions(self):
+        handler = self.make_handler(buffer_size=1, max_bytes=50, backup_count=2,
+                                    permissions=0o640)
+        for i in range(12):
+            self.logger.info("message %04d", i)  # 13 バイト
+        handler.close()
+        for path in (self.path, self.path + ".1", self.path + ".2"):
+            self.assertEqual(_mode(path), 0o640, path)
+            self.assertLessEqual(os.path.getsize(path), 50)
+        self.assertFalse(os.path.exists(self.path + ".3"))
+        self.assertIn("message 0011", self.read())
+
+    def test_time_rotation(self):
+        now = [1000.0]
+        with mock.patch("sample.time.time", lambda: now[0]):
+            handler = self.make_handler(buffer_size=1, rotate_interval=60)
+            self.logger.info("old")
+            now[0] += 61
+            self.logger.info("new")
+            handler.close()
+        self.assertEqual(self.read(self.path + ".1"), "old\n")
+        self.assertEqual(self.read(), "new\n")
+
+    def test_no_rotation_without_backups(self):
+        now = [1000.0]
+        with mock.patch("sample.time.time", lambda: now[0]):
+            handler = self.make_handler(buffer_size=1, max_bytes=30, rotate_interval=60,
+                                        backup_count=0)
+            for i in range(5):
+                self.logger.info("record %d", i)
+                now[0] += 61
+            handler.close()
+        self.assertEqual(self.read(), "".join(f"record {i}\n" for i in range(5)))
+        self.assertEqual(glob.glob(self.path + ".*"), [])
+
+
+class TestAppendFileHandler(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "append.log")
+        self.logger = logging.Logger("append_test")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_one_write_per_record(self):
+        handler = AppendFileHandler(self.path, permissions=0o640)
+        self.logger.addHandler(handler)
+        with mock.patch("sample.os.write", wraps=os.write) as write:
+            self.logger.info("first")
+            self.logger.info("second")
+            self.assertEqual(write.call_count, 2)
+        handler.close()
+        self.assertEqual(_mode(self.path), 0o640)
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "first\nsecond\n")
+
+    def test_reopens_after_rotation_by_another_handler(self):
+        first = AppendFileHandler(self.path, max_bytes=25, backup_count=3)
+        second = AppendFileHandler(self.path, max_bytes=25, backup_count=3)
+        record = logging.makeLogRecord({"msg": "0123456789"})  # 11 バイト
+        first.handle(record)
+        first.handle(record)
+        first.handle(record)   # 25 バイトを超えるのでローテート
+        second.handle(record)  # 開き直して新しいファイルに書く (ローテートはしない)
+        first.close()
+        second.close()
+        self.assertFalse(os.path.exists(self.path + ".2"))
+        with open(self.path + ".1", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "0123456789\n" * 2)
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "0123456789\n" * 2)
+
+    def test_no_rotation_without_backups(self):
+        first = AppendFileHandler(self.path, max_bytes=30, backup_count=0)
+        second = AppendFileHandler(self.path, max_bytes=30, backup_count=0)
+        for i in range(5):
+            (first, second)[i % 2].handle(logging.makeLogRecord({"msg": f"record {i}"}))
+        first.close()
+        second.close()
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "".join(f"record {i}\n" for i in range(5)))
+        self.assertEqual(glob.glob(self.path + ".*"), [self.path + ".lock"])
+
+    def test_concurrent_processes_do_not_tear_records(self):
+        workers, count = 4, 300
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=_append_worker, args=(self.path, worker, count))
+            for worker in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+
+        seen = set()
+        paths = glob.glob(self.path + "*")
+        self.assertGreater(len(paths), 2)  # ローテートが起きている
+        for path in paths:
+            if path.endswith(".lock"):
+                continue
+            with open(path, encoding="utf-8") as f:
+                for line in f.read().splitlines():
+                    worker, seq, size, payload = line.split(" ", 3)
+                    self.assertEqual(len(payload), int(size))
+                    self.assertEqual(set(payload) - {chr(ord("a") + int(worker))}, set())
+                    seen.add((int(worker), int(seq)))
+        self.assertEqual(len(seen), workers * count)
+
+
+if __name__ == "__main__":
+    unittest.main()